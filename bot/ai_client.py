@@ -3,15 +3,18 @@ OpenAI client for AI-powered Discord responses
 """
 import os
 import logging
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 
+# Returned in place of a model reply when the API call fails
+ERROR_RESPONSE = "I'm sorry, I'm having trouble responding right now. Please try again later."
+
 class AIClient:
     """Client for OpenAI API interactions"""
     
     def __init__(self):
-        self.client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+        self.client = AsyncOpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
         # Default system prompt - will be customizable
         self.system_prompt = """You are a helpful Discord bot assistant specializing in Jewish texts and wisdom. You are knowledgeable about Torah, Talmud, Jewish philosophy, and religious practices. 
 
@@ -32,7 +35,7 @@ Keep responses under 2000 characters to fit Discord's message limits."""
     async def generate_response(self, user_message: str, user_name: str = "") -> str:
         """Generate an AI response to a user message"""
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": self.system_prompt},
@@ -47,7 +50,7 @@ Keep responses under 2000 characters to fit Discord's message limits."""
             
         except Exception as e:
             logger.error(f"Error generating AI response: {e}")
-            return "I'm sorry, I'm having trouble responding right now. Please try again later."
+            return ERROR_RESPONSE
     
     async def generate_contextual_response(self, user_message: str, context: str = "", user_name: str = "") -> str:
         """Generate a response with additional context"""
@@ -59,7 +62,7 @@ Keep responses under 2000 characters to fit Discord's message limits."""
             
             messages.append({"role": "user", "content": user_message})
             
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=messages,
                 max_tokens=500,
@@ -70,4 +73,4 @@ Keep responses under 2000 characters to fit Discord's message limits."""
             
         except Exception as e:
             logger.error(f"Error generating contextual AI response: {e}")
-            return "I'm sorry, I'm having trouble responding right now. Please try again later."
\ No newline at end of file
+            return ERROR_RESPONSE
\ No newline at end of file
@@ -0,0 +1,257 @@
+"""
+In-memory caching helpers for slow-changing API client responses
+"""
+import asyncio
+import functools
+import hashlib
+import logging
+import os
+import pickle
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, Union
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+try:
+    _JERUSALEM = ZoneInfo("Asia/Jerusalem")
+except ZoneInfoNotFoundError:
+    _JERUSALEM = timezone(timedelta(hours=2))
+
+# Shared Redis backend, enabled by setting REDIS_URL
+_redis: Optional["aioredis.Redis"] = None
+
+class LRUCache:
+    """Mapping that evicts its least recently used key once it holds maxsize items"""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self._data[key]
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        if key not in self._data:
+            return default
+        return self[key]
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        return self._data.pop(key, default)
+
+    def clear(self):
+        self._data.clear()
+
+# Stale-while-revalidate entries: key -> (fresh_until, stale_until, value)
+_swr_entries = LRUCache(maxsize=1024)
+_swr_refreshing: Dict[Hashable, asyncio.Task] = {}
+
+def _make_key(func, args: Tuple, kwargs: Dict) -> Hashable:
+    """Build a cache key from the method name and its arguments (excluding self)"""
+    return (func.__qualname__, args[1:], tuple(sorted(kwargs.items())))
+
+def jerusalem_today() -> date:
+    """Today's date in Israel, where daily content rolls over"""
+    return datetime.now(_JERUSALEM).date()
+
+def seconds_until_jerusalem_midnight() -> float:
+    """TTL for daily content, which rolls over at midnight Israel time"""
+    now = datetime.now(_JERUSALEM)
+    midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return max((midnight - now).total_seconds(), 1.0)
+
+def _get_redis() -> Optional["aioredis.Redis"]:
+    """Return the shared Redis client, or None when REDIS_URL is unset"""
+    global _redis
+    if _redis is None and aioredis is not None:
+        url = os.getenv('REDIS_URL')
+        if url:
+            _redis = aioredis.Redis.from_url(url)
+    return _redis
+
+def _redis_key(key: Hashable) -> str:
+    """Namespace a cache key as sefaria:<qualname>:<args-hash>"""
+    qualname, *rest = key
+    digest = hashlib.sha1(repr(rest).encode()).hexdigest()
+    return f"sefaria:{qualname}:{digest}"
+
+async def _redis_get(key: Hashable) -> Tuple[Any, float]:
+    """Read a pickled value and its remaining lifetime from Redis; (None, 0) on a miss or error"""
+    client = _get_redis()
+    if client is None:
+        return None, 0
+    redis_key = _redis_key(key)
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            raw, remaining = await pipe.get(redis_key).ttl(redis_key).execute()
+        if raw is None or remaining <= 0:
+            return None, 0
+        return pickle.loads(raw), remaining
+    except Exception as e:
+        logger.warning("Redis cache read failed for %s: %s", key, e)
+        return None, 0
+
+async def _redis_set(key: Hashable, value: Any, ttl: float):
+    """Store a pickled value in Redis with an expiry"""
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        await client.set(_redis_key(key), pickle.dumps(value), ex=max(int(ttl), 1))
+    except Exception as e:
+        logger.warning("Redis cache write failed for %s: %s", key, e)
+
+async def close_redis():
+    """Close the shared Redis client if one was opened"""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+def async_ttl_cache(ttl: Union[float, Callable[[], float]], maxsize: int = 1024):
+    """Cache an API client coroutine method's results for `ttl` seconds
+
+    Each decorated method keeps its own LRU store of at most `maxsize` keys,
+    so an entry leaves the cache when it expires or is evicted, whichever
+    comes first.
+
+    `ttl` may be a callable returning the lifetime, e.g. for daily content
+    that expires at a fixed time of day. With seconds_until_jerusalem_midnight
+    the key also includes jerusalem_today(), so it rolls over with the TTL
+    rather than with the host's clock. When REDIS_URL is set, results are
+    also stored in Redis so they survive restarts and are shared by shards.
+
+    Concurrent misses for the same key share a single in-flight request
+    (singleflight), so only one upstream call is made. Empty (None) results
+    are not cached. The API clients report failures as None, so every
+    successful result is also kept as a last-known-good value, served (even
+    if expired) when a later refresh comes back empty.
+    """
+    def decorator(func):
+        entries = LRUCache(maxsize)
+        inflight: Dict[Hashable, asyncio.Task] = {}
+        last_good = LRUCache(maxsize)
+        daily = ttl is seconds_until_jerusalem_midnight
+
+        def lifetime() -> float:
+            return ttl() if callable(ttl) else ttl
+
+        def lookup(key: Hashable):
+            entry = entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] > time.monotonic():
+                return entry[1]
+            entries.pop(key)
+            return None
+
+        async def fill(key: Hashable, args: Tuple, kwargs: Dict):
+            try:
+                # A value from Redis only lives as long as its key has left there
+                value, remaining = await _redis_get(key)
+                if value is not None:
+                    entries[key] = (time.monotonic() + min(remaining, lifetime()), value)
+                    last_good[key] = value
+                    return value
+
+                value = await func(*args, **kwargs)
+                if value is None:
+                    if key in last_good:
+                        logger.warning("Serving last known good %s result after empty response", func.__qualname__)
+                    return last_good.get(key)
+
+                seconds = lifetime()
+                entries[key] = (time.monotonic() + seconds, value)
+                last_good[key] = value
+                await _redis_set(key, value, seconds)
+                return value
+            finally:
+                inflight.pop(key, None)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = _make_key(func, args, kwargs)
+            if daily:
+                key += (jerusalem_today(),)
+            value = lookup(key)
+            if value is not None:
+                return value
+
+            task = inflight.get(key)
+            if task is None:
+                task = asyncio.create_task(fill(key, args, kwargs))
+                inflight[key] = task
+            # Shield so one caller being cancelled doesn't cancel the shared fetch
+            return await asyncio.shield(task)
+
+        wrapper.cache_clear = entries.clear
+        return wrapper
+    return decorator
+
+def _swr_store(key: Hashable, value: Any, ttl: float, stale: float):
+    """Record a successful result with its fresh and stale deadlines"""
+    if value is not None:
+        now = time.monotonic()
+        _swr_entries[key] = (now + ttl, now + stale, value)
+
+async def _swr_refresh(key: Hashable, fetcher: Callable[[], Awaitable], ttl: float, stale: float):
+    """Refresh a stale entry in the background"""
+    try:
+        _swr_store(key, await fetcher(), ttl, stale)
+    except Exception as e:
+        logger.warning("Background refresh failed for %s: %s", key, e)
+    finally:
+        _swr_refreshing.pop(key, None)
+
+async def fetch_with_swr(key: Hashable, fetcher: Callable[[], Awaitable], ttl: float = 600, stale: float = 3600):
+    """Return a cached result, revalidating it in the background once stale
+
+    Results younger than `ttl` seconds are returned as is. Results up to
+    `stale` seconds old are returned immediately while a single background
+    refresh repopulates the entry; anything older is fetched inline, falling
+    back to the expired value if that fetch fails or comes back empty.
+    """
+    now = time.monotonic()
+    entry = _swr_entries.get(key)
+    if entry:
+        fresh_until, stale_until, value = entry
+        if now < fresh_until:
+            return value
+        if now < stale_until:
+            if key not in _swr_refreshing:
+                _swr_refreshing[key] = asyncio.create_task(_swr_refresh(key, fetcher, ttl, stale))
+            return value
+
+    try:
+        value = await fetcher()
+    except Exception as e:
+        if not entry:
+            raise
+        logger.warning("Serving last known good result for %s after error: %s", key, e)
+        return entry[2]
+
+    if value is None and entry:
+        return entry[2]
+    _swr_store(key, value, ttl, stale)
+    return value
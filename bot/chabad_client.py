@@ -4,6 +4,7 @@ Client for interacting with Chabad.org content and services
 import aiohttp
 import asyncio
 import logging
+import orjson
 import hashlib
 import hmac
 import base64
@@ -12,13 +13,15 @@ from typing import Dict, List, Optional, Union
 from urllib.parse import quote, urljoin
 import json
 import re
+from .cache import async_ttl_cache, seconds_until_jerusalem_midnight
 
 logger = logging.getLogger(__name__)
 
 class ChabadClient:
     """Client for Chabad.org content and services"""
     
-    def __init__(self, public_key: Optional[str] = None, secret_key: Optional[str] = None):
+    def __init__(self, public_key: Optional[str] = None, secret_key: Optional[str] = None,
+                 session: Optional[aiohttp.ClientSession] = None):
         """Initialize the Chabad client"""
         self.base_url = "https://www.chabad.org"
         self.api_url = "https://api.chabad.org"
@@ -28,12 +31,15 @@ class ChabadClient:
         self.public_key = public_key
         self.secret_key = secret_key
         
-        self.session = None
+        # Use the bot's shared session when given; otherwise one is created on demand
+        self.session = session
+        self._owns_session = session is None
         self.last_request_time = 0
         
     async def _ensure_session(self):
         """Ensure aiohttp session exists"""
-        if self.session is None:
+        if self.session is None or self.session.closed:
+            self._owns_session = True
             self.session = aiohttp.ClientSession()
     
     async def _rate_limit(self):
@@ -78,7 +84,7 @@ class ChabadClient:
                 if response.status == 200:
                     content_type = response.headers.get('content-type', '')
                     if 'application/json' in content_type:
-                        return await response.json()
+                        return orjson.loads(await response.read())
                     else:
                         # Parse HTML content for structured data
                         text = await response.text()
@@ -128,6 +134,7 @@ class ChabadClient:
         url = f"{self.base_url}/library/article_cdo/aid/3146/jewish/Daily-Study.htm"
         return await self._make_request(url)
     
+    @async_ttl_cache(ttl=seconds_until_jerusalem_midnight)
     async def get_daily_wisdom(self) -> Optional[Dict]:
         """Get daily wisdom/quote from Chabad.org"""
         url = f"{self.base_url}/library/article_cdo/aid/3147/jewish/Daily-Wisdom.htm"
@@ -222,6 +229,6 @@ class ChabadClient:
         return await self._make_request(url, params)
     
     async def close(self):
-        """Close the aiohttp session"""
-        if self.session:
+        """Close the aiohttp session if this client created it"""
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
\ No newline at end of file
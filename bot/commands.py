@@ -6,18 +6,471 @@ from discord.ext import commands
 from discord import app_commands
 import logging
 import asyncio
-from typing import Optional
-from urllib.parse import quote
+import functools
+import time
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
+from urllib.parse import quote_plus
 from .sefaria_client import SefariaClient
 from .hebcal_client import HebcalClient
-from .nli_client import NLIClient
+from .nli_client import NLIClient, NLIItem
 from .chabad_client import ChabadClient
 from .dicta_client import DictaClient
-from .utils import format_text_response, truncate_text
-from datetime import date
+from .cache import LRUCache
+from .retry import retry_async
+from .utils import StaticEmbed, format_text_response, truncate_text
+from datetime import date, datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+_CHABAD_LOCATOR_TMPL = (
+    "Search for Chabad centers at [Chabad.org Directory]"
+    "(https://www.chabad.org/centers/default_cdo/jewish/Chabad-Locator.htm?searchstring={})"
+)
+
+# Embed colors shared by every command
+_BLUE = discord.Color.blue()
+_GOLD = discord.Color.gold()
+_GREEN = discord.Color.green()
+_ORANGE = discord.Color.orange()
+_PURPLE = discord.Color.purple()
+_RED = discord.Color.red()
+_DARK_BLUE = discord.Color.dark_blue()
+_ORAYTA_BLUE = discord.Color(0x4A90E2)
+_SIDDUR_BROWN = discord.Color(0x8B4513)
+_PNINIM_ORANGE = discord.Color(0xFF6B35)
+_ECOSYSTEM_VIOLET = discord.Color(0x9932CC)
+
+# Followup window Discord grants after a deferred interaction response
+_FOLLOWUP_WINDOW = 15 * 60
+_CATEGORIES_TIMEOUT = 8.0
+# Upper bound for a single upstream API call, so one slow source cannot stall a reply
+# (Sefaria calls are bounded per request inside SefariaClient instead)
+_UPSTREAM_TIMEOUT = 4.0
+# Upper bound for client calls that chain several upstream requests
+_COMPOSITE_TIMEOUT = 10.0
+# Built /parsha embeds are reused for a day
+_PARSHA_CACHE_TTL = 24 * 60 * 60
+# /torahstudy renders whatever sources have answered by this deadline
+_TORAHSTUDY_DEADLINE = 3.0
+
+# Discord embed limits: characters per field value, a margin under the
+# 6000-character total shared by all embeds in one message, and embeds per message
+_FIELD_LIMIT = 1024
+_EMBED_SOFT_LIMIT = 5500
+_MAX_EMBEDS = 10
+
+def _remaining_budget(interaction: discord.Interaction, cap: float, floor: float = 2.0) -> float:
+    """Seconds left to answer an interaction, clamped between floor and cap"""
+    elapsed = (discord.utils.utcnow() - interaction.created_at).total_seconds()
+    return max(floor, min(cap, _FOLLOWUP_WINDOW - elapsed))
+
+# Compact command overview; per-command usage lives in _HELP_DETAILS for /help <command>
+_HELP_SECTIONS = (
+    ("📜 Texts", "`/random` `/search` `/text` `/commentary` `/daily` `/categories`"),
+    ("📅 Calendar", "`/shabbat` `/holidays` `/hebrewdate` `/zmanim` `/parsha` `/dafyomi`"),
+    ("📖 Study", "`/dailylearning` `/torahstudy` `/learning` `/halacha` `/gematria`"),
+    ("🔥 Chabad & Chassidut", "`/dailystudy` `/dailywisdom` `/tanya` `/chassidic` `/chabadcenters`"),
+    ("🏛️ Libraries & Archives", "`/jewishbooks` `/manuscripts` `/historicalphotos` `/maps` `/randomtreasure` `/archives` `/orayta`"),
+    ("🧮 Tools & Community", "`/calculate` `/measurements` `/translate` `/siddur` `/chiddush` `/ecosystem`"),
+    ("🔧 Admin", "`/autoreply` `/setprompt`"),
+    ("🤖 AI Chat", "Mention @Rabbi Bot to ask a question"),
+    ("ℹ️ Data Sources", "Sefaria • Hebcal • National Library of Israel • Chabad.org • Dicta • Google Translate"),
+)
+
+_HELP_DETAILS = {
+    "random": "Get a random Jewish text quote\n`language`: hebrew, english, or both\n`category`: torah, talmud, mishnah, etc.",
+    "search": "Search for specific texts or passages\n`query`: Search term or text reference\n`language`: hebrew, english, or both",
+    "text": "Get a specific text by reference\n`reference`: e.g., 'Genesis 1:1', 'Berakhot 2a'\n`language`: hebrew, english, or both",
+    "commentary": "Get commentary on a verse\n`reference`: e.g., 'Genesis 1:1'\n`commentator`: rashi, ibn_ezra, ramban, ralbag, sforno, radak\n`language`: hebrew, english, or both",
+    "daily": "Get the daily Torah portion or study text",
+    "categories": "List available text categories for use with `/random`",
+    "shabbat": "Get Shabbat candle lighting and havdalah times\n`location`: e.g., 'New York', 'Jerusalem', 'London'",
+    "holidays": "Get upcoming Jewish holidays\n`year`: Optional year (defaults to current)",
+    "hebrewdate": "Get today's Hebrew date conversion",
+    "zmanim": "Get daily prayer times for any location\n`location`: City name (e.g., 'New York')",
+    "parsha": "Get weekly Torah portion (current or specific date)\n`date`: Optional date (YYYY-MM-DD)",
+    "dafyomi": "Get today's Daf Yomi (daily Talmud page)",
+    "gematria": "Calculate gematria values for Hebrew text\n`text`: Hebrew text to calculate\n`method`: standard, small, absolute, ordinal",
+    "dailylearning": "Unified daily learning from multiple sources\n`source`: Choose chabad, sefaria, all, or random",
+    "torahstudy": "Comprehensive daily Torah study from ALL sources\n`date`: Optional date (YYYY-MM-DD)",
+    "learning": "Personalized Jewish learning path recommendations\n`level`: beginner, intermediate, or advanced\n`interests`: torah, talmud, halacha, chassidut, etc.",
+    "halacha": "Ask practical Jewish law questions with AI assistance\n`question`: Your halacha question\n`category`: shabbat, kashrut, prayer, holidays, etc.",
+    "dailystudy": "Get today's daily study from Chabad.org",
+    "dailywisdom": "Get daily wisdom quote from Chabad.org",
+    "tanya": "Get today's Tanya lesson from Chabad.org",
+    "chassidic": "Unified Chassidic content: stories (Chabad) + books (Dicta)\n`type`: Choose stories, books, or all",
+    "chabadcenters": "Find Chabad centers near a location\n`location`: City name",
+    "jewishbooks": "Search Jewish books across Sefaria, Dicta and the National Library of Israel\n`query`: Search term\n`source`: dicta/nli/sefaria/all\n`language`: heb/eng/yid",
+    "manuscripts": "Search Hebrew manuscripts from National Library of Israel\n`query`: Search term",
+    "historicalphotos": "Search historical photos from National Library of Israel\n`query`: Search term",
+    "maps": "Search historical maps from National Library of Israel\n`location`: Location name",
+    "randomtreasure": "Get a random treasure from National Library of Israel\n`type`: Optional type filter",
+    "archives": "Search across ALL Jewish digital archives\n`query`: Search historical documents and texts",
+    "orayta": "Access Orayta's comprehensive Jewish book library\n`query`, `category`: Search cross-platform texts",
+    "calculate": "Natural language Jewish calculations using TorahCalc\n`query`: Natural language (e.g., 'Convert 3 amos to feet')",
+    "measurements": "Convert between biblical and modern units\n`unit_type`, `from_unit`, `to_unit`, `amount`",
+    "translate": "Translate text to any language\n`text`: Text to translate\n`target_language`: Target language",
+    "siddur": "Create custom Jewish liturgical books with OpenSiddur\n`prayer_type`, `tradition`: Build custom siddurim",
+    "chiddush": "Share and discover Torah insights on Pninim\n`topic`, `author_type`: Social Torah learning",
+    "ecosystem": "Overview of the complete Jewish software ecosystem",
+    "autoreply": "[ADMIN] Toggle auto-reply to @mentions on/off\n`enabled`: true or false",
+    "setprompt": "[ADMIN] Set the AI system prompt\n`prompt`: The new system prompt",
+    "ping": "Test bot response",
+}
+
+def _build_help_embed() -> discord.Embed:
+    """Build the static /help overview embed"""
+    embed = StaticEmbed(
+        title="📚 Rabbi Bot - Ultimate Jewish Learning Assistant",
+        description="Use `/help <command>` for details on any command",
+        color=_GOLD
+    )
+    for name, value in _HELP_SECTIONS:
+        embed.add_field(name=name, value=value, inline=False)
+    embed.set_footer(text="🚀 Most comprehensive Jewish learning bot")
+    return embed
+
+_HELP_EMBED = _build_help_embed()
+
+# Static embed fields as (name, value, inline), shared across invocations
+_CHASSIDIC_STORY_FIELDS = (
+    ("📚 Chassidic Stories (Chabad.org)",
+     "Inspiring tales teaching faith, kindness, spiritual growth, and overcoming challenges through the wisdom of great rabbis.",
+     False),
+    ("🔗 Read Stories",
+     "[Chabad.org Stories](https://www.chabad.org/library/article_cdo/aid/3149/jewish/Stories.htm)",
+     True),
+)
+
+_DICTA_FEATURE_FIELDS = (
+    ("🤖 AI Features", "Rashi script modernization • Automatic nikud • Enhanced readability", True),
+    ("🔗 Browse Library", "[Dicta Library](https://library.dicta.org.il)", True),
+)
+
+_DAILY_MITZVAH_FIELDS = (
+    ("🎯 Daily Mitzvah",
+     "Daily commandments and spiritual practices guide Jewish life through 613 mitzvot (positive actions and prohibitions).",
+     False),
+    ("💎 Daily Wisdom",
+     "Chassidic teachings offering spiritual insights for modern life from Chabad tradition.",
+     False),
+    ("📜 Tanya Study",
+     "Foundational Chassidic philosophy teaching the soul's divine nature and spiritual growth.",
+     False),
+)
+
+_DAILY_LEARNING_SOURCE_FIELDS = (
+    ("🔗 Sources",
+     "[Chabad.org](https://www.chabad.org) • [Sefaria.org](https://www.sefaria.org) • [Hebcal.com](https://www.hebcal.com)",
+     False),
+)
+
+_UNIT_TYPE_FIELDS = (
+    ("📐 Unit Types Available",
+     "• **Length:** amah, tefach, etzbah, mil, parsah\n• **Volume:** kezayis, kav, seah, kor\n"
+     "• **Weight:** shekel, mane, kikar\n• **Time:** shaah, et, chelek\n• **Coins:** shekel, dinar, maah",
+     False),
+)
+
+_MEASUREMENT_TIP_FIELDS = (
+    ("🎯 Pro Tip", "Use `/calculate` for natural language: 'Convert 3 amos to feet'", False),
+)
+
+_OPENSIDDUR_FEATURES_TMPL = (
+    "**Mission**: {}\n"
+    "**Core Values**: Pluralism, Historical Awareness, Individual Freedom\n"
+    "**Formats**: Print, Screen, Mobile, Accessible"
+)
+
+# /ecosystem overview; static, so the embed is built once at import
+_ECOSYSTEM_FIELDS = (
+    ("📚 Core Text Libraries",
+     "**Sefaria**: Digital library of Jewish texts\n"
+     "**Dicta**: 800+ AI-enhanced books\n"
+     "**Orayta**: Cross-platform Jewish library\n"
+     "**OpenTorah**: Early Chabad archives",
+     True),
+    ("🏛️ Historical Archives",
+     "**National Library of Israel**: Manuscripts, photos\n"
+     "**Chabad.org**: Daily wisdom, Tanya, stories\n"
+     "**Hebcal**: Jewish calendar and holidays",
+     True),
+    ("🔧 Modern Platforms",
+     "**TorahCalc**: Jewish calculations & gematria\n"
+     "**OpenSiddur**: Custom liturgical books\n"
+     "**Pninim**: Torah insights sharing\n"
+     "**AI Integration**: OpenAI-powered responses",
+     True),
+    ("🚀 Unprecedented Capabilities",
+     "✅ **40+ specialized commands**\n"
+     "✅ **10+ major Jewish institutions**\n"
+     "✅ **AI-enhanced text processing**\n"
+     "✅ **Biblical calculations & gematria**\n"
+     "✅ **Historical manuscript access**\n"
+     "✅ **Custom liturgy creation**\n"
+     "✅ **Social Torah learning**\n"
+     "✅ **Multilingual support**",
+     False),
+    ("🎯 Revolutionary Features",
+     "🔬 **Smart unified commands** combining multiple APIs\n"
+     "🧮 **Natural language Torah calculations**\n"
+     "🏛️ **Cross-archive digital searches**\n"
+     "📚 **Comprehensive daily study aggregation**\n"
+     "💡 **Community-driven insight sharing**\n"
+     "🕊️ **Customizable liturgical creation**",
+     False),
+)
+
+# Babylonian Talmud tractates in Daf Yomi order as (name, first daf, last daf).
+# Kinnim, Tamid and Middot continue the page numbering that follows Meilah.
+_DAF_YOMI_TRACTATES = (
+    ("Berakhot", 2, 64), ("Shabbat", 2, 157), ("Eruvin", 2, 105), ("Pesachim", 2, 121),
+    ("Shekalim", 2, 22), ("Yoma", 2, 88), ("Sukkah", 2, 56), ("Beitzah", 2, 40),
+    ("Rosh Hashanah", 2, 35), ("Taanit", 2, 31), ("Megillah", 2, 32), ("Moed Katan", 2, 29),
+    ("Chagigah", 2, 27), ("Yevamot", 2, 122), ("Ketubot", 2, 112), ("Nedarim", 2, 91),
+    ("Nazir", 2, 66), ("Sotah", 2, 49), ("Gittin", 2, 90), ("Kiddushin", 2, 82),
+    ("Bava Kamma", 2, 119), ("Bava Metzia", 2, 119), ("Bava Batra", 2, 176), ("Sanhedrin", 2, 113),
+    ("Makkot", 2, 24), ("Shevuot", 2, 49), ("Avodah Zarah", 2, 76), ("Horayot", 2, 14),
+    ("Zevachim", 2, 120), ("Menachot", 2, 110), ("Chullin", 2, 142), ("Bekhorot", 2, 61),
+    ("Arakhin", 2, 34), ("Temurah", 2, 34), ("Keritot", 2, 28), ("Meilah", 2, 22),
+    ("Kinnim", 23, 25), ("Tamid", 26, 34), ("Middot", 34, 36), ("Niddah", 2, 73)
+)
+# Days elapsed in the cycle once each tractate is finished; the last entry is the cycle length
+_DAF_YOMI_CUMULATIVE = tuple(accumulate(last - first + 1 for _, first, last in _DAF_YOMI_TRACTATES))
+_DAF_YOMI_CYCLE_DAYS = _DAF_YOMI_CUMULATIVE[-1]  # 2,711
+# First day of the 14th cycle
+_DAF_YOMI_EPOCH = date(2020, 1, 5)
+_DAF_YOMI_EPOCH_CYCLE = 14
+
+@functools.lru_cache(maxsize=64)
+def _daf_for_day(day_in_cycle: int) -> Tuple[str, int]:
+    """Map a zero-based day of the Daf Yomi cycle to (tractate, daf)"""
+    i = bisect_right(_DAF_YOMI_CUMULATIVE, day_in_cycle)
+    name, first, _ = _DAF_YOMI_TRACTATES[i]
+    days_before = _DAF_YOMI_CUMULATIVE[i - 1] if i else 0
+    return name, first + day_in_cycle - days_before
+
+# /halacha prompt, split around the category and question inserted per call
+_HALACHA_PROMPT_PRE = (
+    "You are a knowledgeable assistant helping with Jewish law (halacha) questions.\n"
+    "\n"
+    "Guidelines:\n"
+    "- Provide accurate, well-sourced information\n"
+    "- Always recommend consulting a qualified rabbi for final decisions\n"
+    "- Reference relevant halachic sources when possible\n"
+    "- Be clear about different opinions when they exist\n"
+    "- Focus on practical applications\n"
+    "- Distinguish between biblical and rabbinical laws\n"
+    "\n"
+    "Category: "
+)
+_HALACHA_PROMPT_POST = (
+    "\n\n"
+    "Please provide a helpful response while emphasizing the importance of consulting "
+    "with a qualified rabbi for final halachic decisions."
+)
+
+# Hebcal zmanim keys and their /zmanim field names, in display order
+_ZMANIM_FIELDS = (
+    # Morning times
+    ("alotHaShachar", "🌅 Alot HaShachar"),
+    ("misheyakir", "👁️ Misheyakir"),
+    ("sunrise", "☀️ Sunrise"),
+    # Prayer times
+    ("sofZmanShmaGRA", "📿 Latest Shma (GR\"A)"),
+    ("sofZmanTfilla", "🙏 Latest Tfilla"),
+    ("chatzot", "🕐 Chatzot"),
+    # Evening times
+    ("minchaGedola", "🌇 Mincha Gedola"),
+    ("sunset", "🌅 Sunset"),
+    ("tzeit", "⭐ Tzeit HaKochavim"),
+)
+
+# /learning recommendations per level; unknown levels get the advanced set
+_LEARNING_LEVEL_FIELDS = {
+    "beginner": (
+        ("🌱 Getting Started",
+         "• Weekly Torah portion (Parsha)\n• Basic Jewish concepts\n• Prayer book (Siddur) study\n• Jewish holidays and customs",
+         False),
+        ("📖 Recommended Texts",
+         "• Pirkei Avot (Ethics of the Fathers)\n• Simple Chumash with Rashi\n• Basic Shulchan Aruch\n• Stories of the Sages",
+         False),
+    ),
+    "intermediate": (
+        ("📈 Building Knowledge",
+         "• Complete Chumash study\n• Mishnah tractates\n• Halacha (Jewish law)\n• Jewish philosophy basics",
+         False),
+        ("📚 Study Options",
+         "• Rambam's Mishneh Torah\n• Selected Talmud pages\n• Medieval commentaries\n• Chassidic teachings",
+         False),
+    ),
+    "advanced": (
+        ("🎓 Advanced Study",
+         "• Daily Talmud (Daf Yomi)\n• Complex halachic texts\n• Kabbalah and mysticism\n• Original research",
+         False),
+        ("🔬 Deep Dive",
+         "• Rishonim and Acharonim\n• Responsa literature\n• Comparative analysis\n• Teaching others",
+         False),
+    ),
+}
+# /learning interest keywords, checked in order
+_LEARNING_INTEREST_FIELDS = (
+    ("talmud", (
+        ("📖 Talmud Focus",
+         "• Start with Tractate Berakhot\n• Join Daf Yomi program\n• Use English translations initially\n• Find study partner (chavruta)",
+         False),
+    )),
+    ("halacha", (
+        ("⚖️ Halacha Focus",
+         "• Daily halacha study\n• Practical applications\n• Shulchan Aruch sections\n• Contemporary responsa",
+         False),
+    )),
+    ("chassidut", (
+        ("✨ Chassidut Focus",
+         "• Daily Tanya study\n• Chassidic stories\n• Rebbes' teachings\n• Mystical concepts",
+         False),
+    )),
+)
+
+# Reaction buttons added to each interactive command's reply
+_GEMATRIA_REACTIONS = ("🔄", "📖", "🔍")
+_ZMANIM_REACTIONS = ("📅", "🕯️", "ℹ️")
+_PARSHA_REACTIONS = ("📝", "🔍", "📖", "❓")
+_HALACHA_REACTIONS = ("📖", "❓", "👨‍🏫")
+_DAF_YOMI_REACTIONS = ("📝", "🔊", "👥", "📖")
+_LEARNING_REACTIONS = ("📅", "👥", "📖", "⭐")
+
+# Source selectors for the unified multi-library commands
+_CHASSIDIC_STORIES = frozenset({"stories", "all"})
+_CHASSIDIC_BOOKS = frozenset({"books", "all"})
+_DAILY_CHABAD = frozenset({"chabad", "all", "random"})
+_DAILY_SEFARIA = frozenset({"sefaria", "all", "random"})
+_BOOKS_DICTA = frozenset({"dicta", "all"})
+_BOOKS_NLI = frozenset({"nli", "all"})
+_BOOKS_SEFARIA = frozenset({"sefaria", "all"})
+
+# Query keywords that make /archives also fan out to the NLI collections.
+# Matched as substrings so plurals like "maps" or "photos" still trigger.
+_NLI_TRIGGER = frozenset({"manuscript", "historical", "photo", "map"})
+
+# Gematria letter values (final forms share their letter's value)
+_GEMATRIA_VALUES = {
+    'א': 1, 'ב': 2, 'ג': 3, 'ד': 4, 'ה': 5, 'ו': 6, 'ז': 7, 'ח': 8, 'ט': 9,
+    'י': 10, 'כ': 20, 'ך': 20, 'ל': 30, 'מ': 40, 'ם': 40, 'נ': 50, 'ן': 50,
+    'ס': 60, 'ע': 70, 'פ': 80, 'ף': 80, 'צ': 90, 'ץ': 90, 'ק': 100,
+    'ר': 200, 'ש': 300, 'ת': 400
+}
+# Per-letter (standard, small, ordinal) values, so each character costs one lookup
+_GEMATRIA_TABLE = {
+    char: (value, value % 9 or 9, i + 1)
+    for i, (char, value) in enumerate(_GEMATRIA_VALUES.items())
+}
+_GEMATRIA_SPECIAL = {
+    26: "יהוה (God's name)",
+    86: "אלהים (Elohim)",
+    72: "חסד (Chesed - Kindness)",
+    613: "תרי״ג מצוות (613 Commandments)",
+    18: "חי (Chai - Life)",
+    36: "לו״ב צדיקים (36 Righteous)",
+    248: "רמ״ח איברים (248 Limbs)",
+    365: "ש״ס לא תעשה (365 Negative Commands)"
+}
+
+def _gematria(text: str) -> Tuple[int, int, int]:
+    """Standard, small and ordinal gematria of text in a single pass"""
+    standard = small = ordinal = 0
+    for char in text:
+        entry = _GEMATRIA_TABLE.get(char)
+        if entry is None:
+            continue
+        standard += entry[0]
+        small += entry[1]
+        ordinal += entry[2]
+    return standard, small, ordinal
+
+def _ellipsize(text: str, limit: int) -> str:
+    """Cut text to `limit` characters, marking the cut with an ellipsis"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+def _chunks(text: str, size: int = _FIELD_LIMIT):
+    """Yield consecutive slices of text that each fit in one embed field"""
+    for i in range(0, len(text), size):
+        yield text[i:i + size]
+
+def _group_embeds(embeds: List[discord.Embed]) -> List[List[discord.Embed]]:
+    """Pack embeds, in order, into as few messages as Discord's per-message limits allow"""
+    messages = [[]]
+    total = 0
+    for embed in embeds:
+        size = len(embed)
+        if messages[-1] and (total + size > _EMBED_SOFT_LIMIT or len(messages[-1]) == _MAX_EMBEDS):
+            messages.append([])
+            total = 0
+        messages[-1].append(embed)
+        total += size
+    return messages
+
+def _add_fields(embed: discord.Embed, fields):
+    """Add a tuple of (name, value, inline) fields to an embed"""
+    for name, value, inline in fields:
+        embed.add_field(name=name, value=value, inline=inline)
+
+def _build_ecosystem_embed() -> discord.Embed:
+    """Build the static /ecosystem overview embed"""
+    embed = StaticEmbed(
+        title="🌟 Complete Jewish Software Ecosystem",
+        description="The most comprehensive Discord bot for Jewish learning and practice",
+        color=_ECOSYSTEM_VIOLET
+    )
+    _add_fields(embed, _ECOSYSTEM_FIELDS)
+    embed.set_footer(text="The Ultimate Jewish Discord Bot - No longer just 'the best' but 'the only one you'll ever need'")
+    return embed
+
+_ECOSYSTEM_EMBED = _build_ecosystem_embed()
+
+def _result_or_none(result, context: str):
+    """Unwrap a gather(return_exceptions=True) result, logging failures as missing data"""
+    if isinstance(result, Exception):
+        logger.error("Error in %s: %s", context, result, exc_info=result)
+        return None
+    return result
+
+async def _gather_dict(coros: Dict[str, Awaitable], context: str) -> Dict[str, Any]:
+    """Await named coroutines concurrently; failed ones map to None"""
+    results = await asyncio.gather(*coros.values(), return_exceptions=True)
+    return {
+        name: _result_or_none(result, f"{context} ({name})")
+        for name, result in zip(coros.keys(), results)
+    }
+
+async def _add_reactions(message: discord.Message, emojis: Tuple[str, ...]):
+    """Add reaction buttons to a message concurrently"""
+    await asyncio.gather(*(message.add_reaction(emoji) for emoji in emojis))
+
+async def _send_error(interaction: discord.Interaction, embed: discord.Embed):
+    """Send an error embed whether or not the interaction has been answered yet"""
+    if interaction.response.is_done():
+        await interaction.followup.send(embed=embed)
+    else:
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+def safe_command(description: str, title: str = "❌ Error"):
+    """Log any failure in a command callback and reply with a prebuilt error embed"""
+    error_embed = discord.Embed(title=title, description=description, color=_RED)
+    
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, interaction: discord.Interaction, *args, **kwargs):
+            try:
+                await func(self, interaction, *args, **kwargs)
+            except Exception:
+                logger.exception("Error in %s", func.__name__)
+                await _send_error(interaction, error_embed)
+        return wrapper
+    return decorator
+
 class SefariaCommands(commands.Cog):
     """Cog containing all Sefaria-related commands"""
     
@@ -37,7 +490,17 @@ class SefariaCommands(commands.Cog):
         self.pninim_client = pninim_client
         # Track auto-reply settings per guild
         self.auto_reply_enabled = {}
-        
+        # /dafyomi embed keyed by the date ordinal it was built for
+        self._daf_cache: Optional[Tuple[int, discord.Embed]] = None
+        # /parsha embeds keyed by date ordinal -> (expiry, embed)
+        self._parsha_cache = LRUCache(maxsize=64)
+        
+    def _track_reactions(self, message: discord.Message, kind: str):
+        """Register a reply with the ReactionHandler cog so its reactions dispatch by message id"""
+        handler = self.bot.get_cog("ReactionHandler")
+        if handler and message:
+            handler.track_message(message.id, kind)
+    
     @app_commands.command(name="random", description="Get a random Jewish text quote")
     @app_commands.describe(
         language="Language preference (hebrew, english, or both)",
@@ -60,7 +523,7 @@ class SefariaCommands(commands.Cog):
                 embed = discord.Embed(
                     title="❌ No Text Found",
                     description="Could not retrieve a random text at this time.",
-                    color=discord.Color.red()
+                    color=_RED
                 )
                 await interaction.followup.send(embed=embed)
                 return
@@ -69,12 +532,12 @@ class SefariaCommands(commands.Cog):
             embed = format_text_response(text_data, language or "both")
             await interaction.followup.send(embed=embed)
             
-        except Exception as e:
-            logger.error(f"Error in random_quote: {e}")
+        except Exception:
+            logger.exception("Error in random_quote")
             embed = discord.Embed(
                 title="❌ Error",
                 description="An error occurred while fetching the text.",
-                color=discord.Color.red()
+                color=_RED
             )
             await interaction.followup.send(embed=embed)
     
@@ -100,7 +563,7 @@ class SefariaCommands(commands.Cog):
                 embed = discord.Embed(
                     title="🔍 No Results",
                     description=f"No texts found for query: **{query}**",
-                    color=discord.Color.orange()
+                    color=_ORANGE
                 )
                 await interaction.followup.send(embed=embed)
                 return
@@ -117,7 +580,7 @@ class SefariaCommands(commands.Cog):
             embed = discord.Embed(
                 title="🔍 Search Results",
                 description=f"Found {len(results)} results for: **{query}**",
-                color=discord.Color.blue()
+                color=_BLUE
             )
             
             for i, result in enumerate(results[:10]):  # Limit to 10 results
@@ -138,12 +601,12 @@ class SefariaCommands(commands.Cog):
             
             await interaction.followup.send(embed=embed)
             
-        except Exception as e:
-            logger.error(f"Error in search_text: {e}")
+        except Exception:
+            logger.exception("Error in search_text")
             embed = discord.Embed(
                 title="❌ Error",
                 description="An error occurred while searching.",
-                color=discord.Color.red()
+                color=_RED
             )
             await interaction.followup.send(embed=embed)
     
@@ -171,7 +634,7 @@ class SefariaCommands(commands.Cog):
                 embed = discord.Embed(
                     title="❌ Text Not Found",
                     description=f"Could not find text for reference: **{reference}**",
-                    color=discord.Color.red()
+                    color=_RED
                 )
                 await interaction.followup.send(embed=embed)
                 return
@@ -181,7 +644,8 @@ class SefariaCommands(commands.Cog):
             await interaction.followup.send(embed=embed)
             
             # If commentary requested, get and send that too
-            if commentary and commentary.lower() != "none":
+            commentator_name = (commentary or "").casefold()
+            if commentator_name and commentator_name != "none":
                 commentator_map = {
                     "rashi": "Rashi_on_",
                     "ibn_ezra": "Ibn_Ezra_on_",
@@ -191,7 +655,6 @@ class SefariaCommands(commands.Cog):
                     "radak": "Radak_on_"
                 }
                 
-                commentator_name = commentary.lower()
                 if commentator_name in commentator_map:
                     # Format the commentary reference correctly
                     # Convert "Genesis 1:1" to "Genesis.1.1" format
@@ -204,7 +667,7 @@ class SefariaCommands(commands.Cog):
                     if commentary_data:
                         commentary_embed = format_text_response(commentary_data, language or "both")
                         commentary_embed.title = f"📖 {commentator_name.title()} on {reference}"
-                        commentary_embed.color = discord.Color.purple()
+                        commentary_embed.color = _PURPLE
                         await interaction.followup.send(embed=commentary_embed)
                     else:
                         # Inform user that commentary wasn't found, but don't error
@@ -213,12 +676,12 @@ class SefariaCommands(commands.Cog):
                             ephemeral=True
                         )
             
-        except Exception as e:
-            logger.error(f"Error in get_text: {e}")
+        except Exception:
+            logger.exception("Error in get_text")
             embed = discord.Embed(
                 title="❌ Error",
                 description="An error occurred while fetching the text.",
-                color=discord.Color.red()
+                color=_RED
             )
             await interaction.followup.send(embed=embed)
     
@@ -234,7 +697,7 @@ class SefariaCommands(commands.Cog):
                 embed = discord.Embed(
                     title="❌ No Daily Text",
                     description="Could not retrieve today's text.",
-                    color=discord.Color.red()
+                    color=_RED
                 )
                 await interaction.followup.send(embed=embed)
                 return
@@ -243,12 +706,12 @@ class SefariaCommands(commands.Cog):
             embed.title = f"📅 Daily Text - {embed.title}"
             await interaction.followup.send(embed=embed)
             
-        except Exception as e:
-            logger.error(f"Error in daily_text: {e}")
+        except Exception:
+            logger.exception("Error in daily_text")
             embed = discord.Embed(
                 title="❌ Error",
                 description="An error occurred while fetching the daily text.",
-                color=discord.Color.red()
+                color=_RED
             )
             await interaction.followup.send(embed=embed)
     
@@ -279,12 +742,12 @@ class SefariaCommands(commands.Cog):
                 "radak": "Radak_on_"
             }
             
-            commentator_name = commentator.lower()
+            commentator_name = commentator.casefold()
             if commentator_name not in commentator_map:
                 embed = discord.Embed(
                     title="❌ Unknown Commentator",
                     description=f"Available commentators: {', '.join(commentator_map.keys())}",
-                    color=discord.Color.red()
+                    color=_RED
                 )
                 await interaction.followup.send(embed=embed)
                 return
@@ -301,7 +764,7 @@ class SefariaCommands(commands.Cog):
                 embed = discord.Embed(
                     title="❌ Commentary Not Found",
                     description=f"Could not find {commentator_name.title()} commentary on {reference}",
-                    color=discord.Color.red()
+                    color=_RED
                 )
                 await interaction.followup.send(embed=embed)
                 return
@@ -309,15 +772,15 @@ class SefariaCommands(commands.Cog):
             # Format and send response
             embed = format_text_response(commentary_data, language)
             embed.title = f"📖 {commentator_name.title()} on {reference}"
-            embed.color = discord.Color.purple()
+            embed.color = _PURPLE
             await interaction.followup.send(embed=embed)
             
-        except Exception as e:
-            logger.error(f"Error in commentary: {e}")
+        except Exception:
+            logger.exception("Error in commentary")
             embed = discord.Embed(
                 title="❌ Error",
                 description="An error occurred while fetching the commentary.",
-                color=discord.Color.red()
+                color=_RED
             )
             await interaction.followup.send(embed=embed)
     
@@ -330,36 +793,37 @@ class SefariaCommands(commands.Cog):
         await interaction.response.defer()
         
         try:
-            shabbat_data = await self.hebcal_client.get_shabbat_times(location)
+            shabbat_data = await asyncio.wait_for(self.hebcal_client.get_shabbat_times(location), _UPSTREAM_TIMEOUT)
             
             if not shabbat_data or "items" not in shabbat_data:
                 embed = discord.Embed(
                     title="❌ Location Not Found",
                     description=f"Could not find Shabbat times for {location}. Try: New York, Jerusalem, London, etc.",
-                    color=discord.Color.red()
+                    color=_RED
                 )
                 await interaction.followup.send(embed=embed)
                 return
             
             embed = discord.Embed(
                 title=f"🕯️ Shabbat Times - {shabbat_data.get('location', location)}",
-                color=discord.Color.gold()
+                color=_GOLD
             )
             
             for item in shabbat_data["items"]:
-                if "candles" in item.get("category", "").lower():
+                category = item.get("category", "").casefold()
+                if "candles" in category:
                     embed.add_field(
                         name="🕯️ Candle Lighting",
                         value=item.get("title", "Not available"),
                         inline=True
                     )
-                elif "havdalah" in item.get("category", "").lower():
+                elif "havdalah" in category:
                     embed.add_field(
                         name="✨ Havdalah",
                         value=item.get("title", "Not available"),
                         inline=True
                     )
-                elif "parashat" in item.get("title", "").lower():
+                elif "parashat" in item.get("title", "").casefold():
                     embed.add_field(
                         name="📜 Torah Portion",
                         value=item.get("title", ""),
@@ -369,12 +833,12 @@ class SefariaCommands(commands.Cog):
             embed.set_footer(text="Times provided by Hebcal.com")
             await interaction.followup.send(embed=embed)
             
-        except Exception as e:
-            logger.error(f"Error in shabbat_times: {e}")
+        except Exception:
+            logger.exception("Error in shabbat_times")
             embed = discord.Embed(
                 title="❌ Error",
                 description="Could not retrieve Shabbat times.",
-                color=discord.Color.red()
+                color=_RED
             )
             await interaction.followup.send(embed=embed)
     
@@ -387,19 +851,18 @@ class SefariaCommands(commands.Cog):
         await interaction.response.defer()
         
         try:
-            holidays_data = await self.hebcal_client.get_jewish_holidays(year)
+            holidays_data = await asyncio.wait_for(self.hebcal_client.get_jewish_holidays(year), _UPSTREAM_TIMEOUT)
             
             if not holidays_data:
                 embed = discord.Embed(
                     title="❌ No Holidays Found",
                     description="Could not retrieve holiday information.",
-                    color=discord.Color.red()
+                    color=_RED
                 )
                 await interaction.followup.send(embed=embed)
                 return
             
             # Filter to next 10 upcoming holidays
-            from datetime import datetime
             now = datetime.now()
             upcoming_holidays = []
             
@@ -417,7 +880,7 @@ class SefariaCommands(commands.Cog):
             
             embed = discord.Embed(
                 title=f"📅 Jewish Holidays {year or datetime.now().year}",
-                color=discord.Color.blue()
+                color=_BLUE
             )
             
             for holiday in upcoming_holidays:
@@ -438,12 +901,12 @@ class SefariaCommands(commands.Cog):
             embed.set_footer(text="Holiday data provided by Hebcal.com")
             await interaction.followup.send(embed=embed)
             
-        except Exception as e:
-            logger.error(f"Error in jewish_holidays: {e}")
+        except Exception:
+            logger.exception("Error in jewish_holidays")
             embed = discord.Embed(
                 title="❌ Error",
                 description="Could not retrieve holiday information.",
-                color=discord.Color.red()
+                color=_RED
             )
             await interaction.followup.send(embed=embed)
     
@@ -454,20 +917,20 @@ class SefariaCommands(commands.Cog):
         
         try:
             today = date.today()
-            hebrew_data = await self.hebcal_client.convert_hebrew_date(today)
+            hebrew_data = await asyncio.wait_for(self.hebcal_client.convert_hebrew_date(today), _UPSTREAM_TIMEOUT)
             
             if not hebrew_data:
                 embed = discord.Embed(
                     title="❌ Conversion Failed",
                     description="Could not convert to Hebrew date.",
-                    color=discord.Color.red()
+                    color=_RED
                 )
                 await interaction.followup.send(embed=embed)
                 return
             
             embed = discord.Embed(
                 title="📅 Today's Hebrew Date",
-                color=discord.Color.purple()
+                color=_PURPLE
             )
             
             gregorian = f"{today.strftime('%B %d, %Y')}"
@@ -496,12 +959,12 @@ class SefariaCommands(commands.Cog):
             embed.set_footer(text="Date conversion by Hebcal.com")
             await interaction.followup.send(embed=embed)
             
-        except Exception as e:
-            logger.error(f"Error in hebrew_date: {e}")
+        except Exception:
+            logger.exception("Error in hebrew_date")
             embed = discord.Embed(
                 title="❌ Error",
                 description="Could not convert Hebrew date.",
-                color=discord.Color.red()
+                color=_RED
             )
             await interaction.followup.send(embed=embed)
     
@@ -521,7 +984,7 @@ class SefariaCommands(commands.Cog):
             embed = discord.Embed(
                 title="❌ Permission Denied",
                 description="Only server administrators can use this command.",
-                color=discord.Color.red()
+                color=_RED
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
@@ -536,7 +999,7 @@ class SefariaCommands(commands.Cog):
             embed = discord.Embed(
                 title="🔧 Auto-Reply Settings Updated",
                 description=f"Auto-reply to @mentions has been **{status}** for this server.",
-                color=discord.Color.green() if enabled else discord.Color.orange()
+                color=_GREEN if enabled else _ORANGE
             )
             
             if enabled:
@@ -554,12 +1017,12 @@ class SefariaCommands(commands.Cog):
             
             await interaction.followup.send(embed=embed)
             
-        except Exception as e:
-            logger.error(f"Error in toggle_autoreply: {e}")
+        except Exception:
+            logger.exception("Error in toggle_autoreply")
             embed = discord.Embed(
                 title="❌ Error",
                 description="Could not update auto-reply settings.",
-                color=discord.Color.red()
+                color=_RED
             )
             await interaction.followup.send(embed=embed)
     
@@ -573,7 +1036,7 @@ class SefariaCommands(commands.Cog):
         embed = discord.Embed(
             title="🏓 Pong!",
             description="Rabbi Bot is online and ready to serve!",
-            color=discord.Color.green()
+            color=_GREEN
         )
         embed.add_field(
             name="✅ Status",
@@ -583,260 +1046,26 @@ class SefariaCommands(commands.Cog):
         await interaction.response.send_message(embed=embed)
 
     @app_commands.command(name="help", description="Show help information for Sefaria bot commands")
-    async def help_command(self, interaction: discord.Interaction):
+    @app_commands.describe(command="Optional command name for detailed usage (e.g. 'commentary')")
+    async def help_command(self, interaction: discord.Interaction, command: Optional[str] = None):
         """Show help information"""
         # Respond immediately to avoid timeout
-        embed = discord.Embed(
-            title="📚 Rabbi Bot - Ultimate Jewish Learning Assistant",
-            description="Access the world's largest Jewish text library with 50+ specialized commands",
-            color=discord.Color.gold()
-        )
-        
-        embed.add_field(
-            name="🎲 /random",
-            value="Get a random Jewish text quote\n`language`: hebrew, english, or both\n`category`: torah, talmud, mishnah, etc.",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🔍 /search",
-            value="Search for specific texts or passages\n`query`: Search term or text reference\n`language`: hebrew, english, or both",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📖 /text",
-            value="Get a specific text by reference\n`reference`: e.g., 'Genesis 1:1', 'Berakhot 2a'\n`language`: hebrew, english, or both",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📅 /daily",
-            value="Get the daily Torah portion or study text",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📖 /commentary",
-            value="Get commentary on a verse\n`reference`: e.g., 'Genesis 1:1'\n`commentator`: rashi, ibn_ezra, ramban, ralbag, sforno, radak\n`language`: hebrew, english, or both",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🕯️ /shabbat",
-            value="Get Shabbat candle lighting and havdalah times\n`location`: e.g., 'New York', 'Jerusalem', 'London'",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📅 /holidays",
-            value="Get upcoming Jewish holidays\n`year`: Optional year (defaults to current)",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📅 /hebrewdate",
-            value="Get today's Hebrew date conversion",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🔧 /autoreply [ADMIN]",
-            value="Toggle auto-reply to @mentions on/off\n`enabled`: true or false",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🕰️ /zmanim",
-            value="Get daily prayer times for any location\n`location`: City name (e.g., 'New York')",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📜 /parsha",
-            value="Get weekly Torah portion (current or specific date)\n`date`: Optional date (YYYY-MM-DD)",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📖 /dafyomi",
-            value="Get today's Daf Yomi (daily Talmud page)",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🔢 /gematria",
-            value="Calculate Hebrew numerology values\n`text`: Hebrew text to calculate",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📜 /manuscripts",
-            value="Search Hebrew manuscripts from National Library of Israel\n`query`: Search term",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📸 /historicalphotos",
-            value="Search historical photos from National Library of Israel\n`query`: Search term",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📚 /jewishbooks",
-            value="Search Jewish books from National Library of Israel\n`query`: Search term, `language`: heb/eng/yid",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🗺️ /maps",
-            value="Search historical maps from National Library of Israel\n`location`: Location name",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="💎 /randomtreasure",
-            value="Get a random treasure from National Library of Israel\n`type`: Optional type filter",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🌍 /translate",
-            value="Translate text to any language\n`text`: Text to translate, `target_language`: Target language",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📖 /dailystudy",
-            value="Get today's daily study from Chabad.org",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="💎 /dailywisdom",
-            value="Get daily wisdom quote from Chabad.org",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📜 /tanya",
-            value="Get today's Tanya lesson from Chabad.org",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🏛️ /chabadcenters",
-            value="Find Chabad centers near a location\n`location`: City name",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🔥 /chassidic",
-            value="Unified Chassidic content: stories (Chabad) + books (Dicta)\n`type`: Choose stories, books, or all",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📖 /dailylearning",
-            value="Unified daily learning from multiple sources\n`source`: Choose chabad, sefaria, all, or random",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📚 /jewishbooks",
-            value="Smart search across ALL libraries (Sefaria, Dicta, NLI)\n`query`: Search term, `source`: dicta/nli/sefaria/all",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🍯 /kosherinfo",
-            value="Kosher laws and certification info\n`query`: Optional search term",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="⚖️ /responsa",
-            value="Browse rabbinic legal decisions from Dicta",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📊 /dictastats",
-            value="Statistics about Dicta's 800+ AI-enhanced books",
-            inline=False
-        )
-        
-        # Revolutionary new integrated commands
-        embed.add_field(
-            name="🧮 /calculate",
-            value="Natural language Jewish calculations using TorahCalc\n`query`: Natural language (e.g., 'Convert 3 amos to feet')",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📏 /measurements",
-            value="Convert between biblical and modern units\n`unit_type`, `from_unit`, `to_unit`, `amount`",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📚 /torahstudy",
-            value="Comprehensive daily Torah study from ALL sources\n`date`: Optional date (YYYY-MM-DD)",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🏛️ /archives",
-            value="Search across ALL Jewish digital archives\n`query`: Search historical documents and texts",
-            inline=False
-        )
-        
-        # Revolutionary new ecosystem commands
-        embed.add_field(
-            name="📖 /orayta",
-            value="Access Orayta's comprehensive Jewish book library\n`query`, `category`: Search cross-platform texts",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🕊️ /siddur",
-            value="Create custom Jewish liturgical books with OpenSiddur\n`prayer_type`, `tradition`: Build custom siddurim",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="💡 /chiddush",
-            value="Share and discover Torah insights on Pninim\n`topic`, `author_type`: Social Torah learning",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🌟 /ecosystem",
-            value="Overview of the complete Jewish software ecosystem\nSee all 10+ integrated platforms",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="ℹ️ Data Sources",
-            value="Texts: Sefaria.org • Calendar: Hebcal.com • Archives: National Library of Israel • Chassidic: Chabad.org • AI Books: Dicta.org.il • Translation: Google Translate",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🔢 /gematria",
-            value="Calculate gematria values for Hebrew text\n`text`: Hebrew text to calculate\n`method`: standard, small, mispar_katan",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🌟 Advanced Features",
-            value="• AI-powered conversations (mention @Rabbi Bot)\n• Historical manuscripts & photos\n• Chassidic wisdom & daily studies\n• Biblical calculations & measurements\n• Multi-language support & translation",
-            inline=False
-        )
+        if command is None:
+            await interaction.response.send_message(embed=_HELP_EMBED)
+            return
         
-        embed.set_footer(text="🚀 Most comprehensive Jewish learning bot with 50+ commands")
+        name = command.strip().lstrip("/").casefold()
+        details = _HELP_DETAILS.get(name)
+        if details is None:
+            embed = discord.Embed(
+                title="❓ Unknown Command",
+                description=f"No help available for `/{name}`. Use `/help` to list all commands.",
+                color=_ORANGE
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
         
-        # Respond immediately to prevent Discord timeout
+        embed = discord.Embed(title=f"📚 /{name}", description=details, color=_GOLD)
         await interaction.response.send_message(embed=embed)
 
     @app_commands.command(name="categories", description="List available text categories")
@@ -845,17 +1074,16 @@ class SefariaCommands(commands.Cog):
         await interaction.response.defer()
         
         try:
-            # Set a shorter timeout for this command
-            categories = await asyncio.wait_for(
-                self.sefaria_client.get_categories(), 
-                timeout=8.0
+            # Bound the index fetch by whatever is left of the interaction budget
+            categories = await self.sefaria_client.get_categories(
+                deadline_ms=_remaining_budget(interaction, _CATEGORIES_TIMEOUT) * 1000
             )
             
             if not categories:
                 embed = discord.Embed(
                     title="📂 Text Categories",
                     description="Popular categories include: Torah, Talmud, Mishnah, Halakhah, Kabbalah, Liturgy, Philosophy",
-                    color=discord.Color.blue()
+                    color=_BLUE
                 )
                 embed.add_field(
                     name="💡 Try these commands instead:",
@@ -868,7 +1096,7 @@ class SefariaCommands(commands.Cog):
             embed = discord.Embed(
                 title="📂 Available Text Categories",
                 description="Use these categories with the `/random` command",
-                color=discord.Color.green()
+                color=_GREEN
             )
             
             category_text = "\n".join([f"• {cat}" for cat in categories[:20]])  # Limit to 20
@@ -891,7 +1119,7 @@ class SefariaCommands(commands.Cog):
             embed = discord.Embed(
                 title="📂 Text Categories",
                 description="Connection timeout. Here are popular categories:",
-                color=discord.Color.blue()
+                color=_BLUE
             )
             embed.add_field(
                 name="Popular Categories",
@@ -904,12 +1132,12 @@ class SefariaCommands(commands.Cog):
                 inline=False
             )
             await interaction.followup.send(embed=embed)
-        except Exception as e:
-            logger.error(f"Error in list_categories: {e}")
+        except Exception:
+            logger.exception("Error in list_categories")
             embed = discord.Embed(
                 title="📂 Text Categories",
                 description="Here are the main Jewish text categories:",
-                color=discord.Color.blue()
+                color=_BLUE
             )
             embed.add_field(
                 name="Main Categories",
@@ -927,7 +1155,7 @@ class SefariaCommands(commands.Cog):
             embed = discord.Embed(
                 title="❌ Permission Denied",
                 description="Only administrators can change the AI prompt.",
-                color=discord.Color.red()
+                color=_RED
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
@@ -938,11 +1166,11 @@ class SefariaCommands(commands.Cog):
         embed = discord.Embed(
             title="✅ AI Prompt Updated",
             description="The AI system prompt has been successfully updated.",
-            color=discord.Color.green()
+            color=_GREEN
         )
         embed.add_field(
             name="New Prompt Preview",
-            value=prompt[:200] + "..." if len(prompt) > 200 else prompt,
+            value=_ellipsize(prompt, 200),
             inline=False
         )
         
@@ -951,653 +1179,532 @@ class SefariaCommands(commands.Cog):
     # National Library of Israel Commands
     @app_commands.command(name="manuscripts", description="Search Hebrew manuscripts from National Library of Israel")
     @app_commands.describe(query="Search term for Hebrew manuscripts")
+    @safe_command("Could not search Hebrew manuscripts.")
     async def hebrew_manuscripts(self, interaction: discord.Interaction, query: str):
         """Search Hebrew manuscripts"""
         await interaction.response.defer()
         
-        try:
-            manuscripts = await self.nli_client.search_hebrew_manuscripts(query)
-            
-            if not manuscripts:
-                embed = discord.Embed(
-                    title="📜 No Manuscripts Found",
-                    description=f"No Hebrew manuscripts found for: **{query}**",
-                    color=discord.Color.orange()
-                )
-                await interaction.followup.send(embed=embed)
-                return
-            
+        manuscripts = await asyncio.wait_for(self.nli_client.search_hebrew_manuscripts(query), _UPSTREAM_TIMEOUT)
+        
+        if not manuscripts:
             embed = discord.Embed(
-                title=f"📜 Hebrew Manuscripts: {query}",
-                description=f"Found {len(manuscripts)} manuscripts",
-                color=discord.Color.gold()
+                title="📜 No Manuscripts Found",
+                description=f"No Hebrew manuscripts found for: **{query}**",
+                color=_ORANGE
             )
-            
-            for i, manuscript in enumerate(manuscripts[:5]):
-                title = manuscript.get('title', 'Unknown Title')
-                creator = manuscript.get('creator', 'Unknown Creator')
-                date = manuscript.get('date', 'Unknown Date')
-                
-                embed.add_field(
-                    name=f"📚 {title[:50]}{'...' if len(title) > 50 else ''}",
-                    value=f"**Creator:** {creator}\n**Date:** {date}",
-                    inline=False
-                )
-            
-            embed.set_footer(text="Hebrew manuscripts from National Library of Israel")
             await interaction.followup.send(embed=embed)
+            return
+        
+        embed = discord.Embed(
+            title=f"📜 Hebrew Manuscripts: {query}",
+            description=f"Found {len(manuscripts)} manuscripts",
+            color=_GOLD
+        )
+        
+        for i, manuscript in enumerate(manuscripts[:5]):
+            title = manuscript.title
+            creator = manuscript.creator
+            date = manuscript.date
             
-        except Exception as e:
-            logger.error(f"Error in hebrew_manuscripts: {e}")
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Could not search Hebrew manuscripts.",
-                color=discord.Color.red()
+            embed.add_field(
+                name=f"📚 {_ellipsize(title, 50)}",
+                value=f"**Creator:** {creator}\n**Date:** {date}",
+                inline=False
             )
-            await interaction.followup.send(embed=embed)
+        
+        embed.set_footer(text="Hebrew manuscripts from National Library of Israel")
+        await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="historicalphotos", description="Search historical photos from National Library of Israel")
     @app_commands.describe(query="Search term for historical photos")
+    @safe_command("Could not search historical photos.")
     async def historical_photos(self, interaction: discord.Interaction, query: str):
         """Search historical photographs"""
         await interaction.response.defer()
         
-        try:
-            photos = await self.nli_client.search_historical_photos(query)
-            
-            if not photos:
-                embed = discord.Embed(
-                    title="📸 No Photos Found",
-                    description=f"No historical photos found for: **{query}**",
-                    color=discord.Color.orange()
-                )
-                await interaction.followup.send(embed=embed)
-                return
-            
+        photos = await asyncio.wait_for(self.nli_client.search_historical_photos(query), _UPSTREAM_TIMEOUT)
+        
+        if not photos:
             embed = discord.Embed(
-                title=f"📸 Historical Photos: {query}",
-                description=f"Found {len(photos)} historical photographs",
-                color=discord.Color.blue()
+                title="📸 No Photos Found",
+                description=f"No historical photos found for: **{query}**",
+                color=_ORANGE
             )
-            
-            for i, photo in enumerate(photos[:3]):
-                title = photo.get('title', 'Unknown Title')
-                date = photo.get('date', 'Unknown Date')
-                description = photo.get('description', '')
-                
-                embed.add_field(
-                    name=f"📷 {title[:50]}{'...' if len(title) > 50 else ''}",
-                    value=f"**Date:** {date}\n{description[:100]}{'...' if len(description) > 100 else ''}",
-                    inline=False
-                )
-            
-            embed.set_footer(text="Historical photos from National Library of Israel")
             await interaction.followup.send(embed=embed)
+            return
+        
+        embed = discord.Embed(
+            title=f"📸 Historical Photos: {query}",
+            description=f"Found {len(photos)} historical photographs",
+            color=_BLUE
+        )
+        
+        for i, photo in enumerate(photos[:3]):
+            title = photo.title
+            date = photo.date
+            description = photo.description
             
-        except Exception as e:
-            logger.error(f"Error in historical_photos: {e}")
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Could not search historical photos.",
-                color=discord.Color.red()
+            embed.add_field(
+                name=f"📷 {_ellipsize(title, 50)}",
+                value=f"**Date:** {date}\n{_ellipsize(description, 100)}",
+                inline=False
             )
-            await interaction.followup.send(embed=embed)
+        
+        embed.set_footer(text="Historical photos from National Library of Israel")
+        await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="jewishbooks", description="Search Jewish books from National Library of Israel")
     @app_commands.describe(
         query="Search term for Jewish books",
-        language="Language (heb for Hebrew, eng for English, yid for Yiddish)"
+        language="Language of the books"
     )
+    @app_commands.choices(language=[
+        app_commands.Choice(name="Hebrew", value="heb"),
+        app_commands.Choice(name="English", value="eng"),
+        app_commands.Choice(name="Yiddish", value="yid"),
+    ])
+    @safe_command("Could not search Jewish books.")
     async def jewish_books(self, interaction: discord.Interaction, query: str, language: str = "heb"):
         """Search Jewish books"""
         await interaction.response.defer()
         
-        try:
-            books = await self.nli_client.search_jewish_books(query, language)
-            
-            if not books:
-                embed = discord.Embed(
-                    title="📚 No Books Found",
-                    description=f"No Jewish books found for: **{query}** in {language}",
-                    color=discord.Color.orange()
-                )
-                await interaction.followup.send(embed=embed)
-                return
-            
+        books = await asyncio.wait_for(self.nli_client.search_jewish_books(query, language), _UPSTREAM_TIMEOUT)
+        
+        if not books:
             embed = discord.Embed(
-                title=f"📚 Jewish Books: {query}",
-                description=f"Found {len(books)} books in {language}",
-                color=discord.Color.purple()
+                title="📚 No Books Found",
+                description=f"No Jewish books found for: **{query}** in {language}",
+                color=_ORANGE
             )
-            
-            for i, book in enumerate(books[:4]):
-                title = book.get('title', 'Unknown Title')
-                creator = book.get('creator', 'Unknown Author')
-                date = book.get('date', 'Unknown Date')
-                
-                embed.add_field(
-                    name=f"📖 {title[:45]}{'...' if len(title) > 45 else ''}",
-                    value=f"**Author:** {creator}\n**Date:** {date}",
-                    inline=True
-                )
-            
-            embed.set_footer(text="Jewish books from National Library of Israel")
             await interaction.followup.send(embed=embed)
+            return
+        
+        embed = discord.Embed(
+            title=f"📚 Jewish Books: {query}",
+            description=f"Found {len(books)} books in {language}",
+            color=_PURPLE
+        )
+        
+        for i, book in enumerate(books[:4]):
+            title = book.title
+            creator = book.creator
+            date = book.date
             
-        except Exception as e:
-            logger.error(f"Error in jewish_books: {e}")
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Could not search Jewish books.",
-                color=discord.Color.red()
+            embed.add_field(
+                name=f"📖 {_ellipsize(title, 45)}",
+                value=f"**Author:** {creator}\n**Date:** {date}",
+                inline=True
             )
-            await interaction.followup.send(embed=embed)
+        
+        embed.set_footer(text="Jewish books from National Library of Israel")
+        await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="maps", description="Search historical maps from National Library of Israel")
     @app_commands.describe(location="Location to search for historical maps")
+    @safe_command("Could not search historical maps.")
     async def historical_maps(self, interaction: discord.Interaction, location: str):
         """Search historical maps"""
         await interaction.response.defer()
         
-        try:
-            maps = await self.nli_client.search_maps(location)
-            
-            if not maps:
-                embed = discord.Embed(
-                    title="🗺️ No Maps Found",
-                    description=f"No historical maps found for: **{location}**",
-                    color=discord.Color.orange()
-                )
-                await interaction.followup.send(embed=embed)
-                return
-            
+        maps = await asyncio.wait_for(self.nli_client.search_maps(location), _UPSTREAM_TIMEOUT)
+        
+        if not maps:
             embed = discord.Embed(
-                title=f"🗺️ Historical Maps: {location}",
-                description=f"Found {len(maps)} historical maps",
-                color=discord.Color.green()
+                title="🗺️ No Maps Found",
+                description=f"No historical maps found for: **{location}**",
+                color=_ORANGE
             )
-            
-            for i, map_item in enumerate(maps[:3]):
-                title = map_item.get('title', 'Unknown Title')
-                date = map_item.get('date', 'Unknown Date')
-                creator = map_item.get('creator', 'Unknown Creator')
-                
-                embed.add_field(
-                    name=f"🗺️ {title[:50]}{'...' if len(title) > 50 else ''}",
-                    value=f"**Creator:** {creator}\n**Date:** {date}",
-                    inline=False
-                )
-            
-            embed.set_footer(text="Historical maps from National Library of Israel")
             await interaction.followup.send(embed=embed)
+            return
+        
+        embed = discord.Embed(
+            title=f"🗺️ Historical Maps: {location}",
+            description=f"Found {len(maps)} historical maps",
+            color=_GREEN
+        )
+        
+        for i, map_item in enumerate(maps[:3]):
+            title = map_item.title
+            date = map_item.date
+            creator = map_item.creator
             
-        except Exception as e:
-            logger.error(f"Error in historical_maps: {e}")
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Could not search historical maps.",
-                color=discord.Color.red()
+            embed.add_field(
+                name=f"🗺️ {_ellipsize(title, 50)}",
+                value=f"**Creator:** {creator}\n**Date:** {date}",
+                inline=False
             )
-            await interaction.followup.send(embed=embed)
+        
+        embed.set_footer(text="Historical maps from National Library of Israel")
+        await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="randomtreasure", description="Get a random treasure from National Library of Israel")
-    @app_commands.describe(type="Type of item (manuscript, photograph, book, map, audio)")
+    @app_commands.describe(type="Type of item")
+    @app_commands.choices(type=[
+        app_commands.Choice(name="Manuscript", value="manuscript"),
+        app_commands.Choice(name="Photograph", value="photograph"),
+        app_commands.Choice(name="Book", value="book"),
+        app_commands.Choice(name="Map", value="map"),
+        app_commands.Choice(name="Audio", value="audio"),
+    ])
+    @safe_command("Could not get random treasure.")
     async def random_treasure(self, interaction: discord.Interaction, type: str = ""):
         """Get a random treasure from NLI"""
         await interaction.response.defer()
         
-        try:
-            item = await self.nli_client.get_random_item(type)
-            
-            if not item:
-                embed = discord.Embed(
-                    title="💎 No Treasure Found",
-                    description="Could not find a random treasure at this time.",
-                    color=discord.Color.orange()
-                )
-                await interaction.followup.send(embed=embed)
-                return
-            
+        item = await asyncio.wait_for(self.nli_client.get_random_item(type), _UPSTREAM_TIMEOUT)
+        
+        if not item:
             embed = discord.Embed(
-                title="💎 Random Treasure from National Library of Israel",
-                color=discord.Color.gold()
+                title="💎 No Treasure Found",
+                description="Could not find a random treasure at this time.",
+                color=_ORANGE
             )
-            
-            title = item.get('title', 'Unknown Title')
-            creator = item.get('creator', 'Unknown Creator')
-            date = item.get('date', 'Unknown Date')
-            item_type = item.get('material_type', 'Unknown Type')
-            description = item.get('description', 'No description available')
-            
-            embed.add_field(name="📚 Title", value=title, inline=False)
-            embed.add_field(name="👤 Creator", value=creator, inline=True)
-            embed.add_field(name="📅 Date", value=date, inline=True)
-            embed.add_field(name="🏷️ Type", value=item_type, inline=True)
-            
-            if description and len(description) > 10:
-                embed.add_field(
-                    name="📝 Description",
-                    value=description[:200] + "..." if len(description) > 200 else description,
-                    inline=False
-                )
-            
-            embed.set_footer(text="Random treasure from National Library of Israel")
             await interaction.followup.send(embed=embed)
-            
-        except Exception as e:
-            logger.error(f"Error in random_treasure: {e}")
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Could not get random treasure.",
-                color=discord.Color.red()
+            return
+        
+        embed = discord.Embed(
+            title="💎 Random Treasure from National Library of Israel",
+            color=_GOLD
+        )
+        
+        title = item.title
+        creator = item.creator
+        date = item.date
+        item_type = item.material_type
+        description = item.description
+        
+        embed.add_field(name="📚 Title", value=title, inline=False)
+        embed.add_field(name="👤 Creator", value=creator, inline=True)
+        embed.add_field(name="📅 Date", value=date, inline=True)
+        embed.add_field(name="🏷️ Type", value=item_type, inline=True)
+        
+        if description and len(description) > 10:
+            embed.add_field(
+                name="📝 Description",
+                value=_ellipsize(description, 200),
+                inline=False
             )
-            await interaction.followup.send(embed=embed)
+        
+        embed.set_footer(text="Random treasure from National Library of Israel")
+        await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="translate", description="Translate text to any language")
     @app_commands.describe(
         text="Text to translate",
         target_language="Target language (e.g., 'english', 'hebrew', 'spanish')"
     )
+    @safe_command("Could not translate text. Please check the target language.", title="❌ Translation Error")
     async def translate_text(self, interaction: discord.Interaction, text: str, target_language: str):
         """Translate text using Google Translate"""
         await interaction.response.defer()
         
         try:
-            try:
-                from deep_translator import GoogleTranslator
-            except ImportError:
-                embed = discord.Embed(
-                    title="❌ Translation Error",
-                    description="Translation service not available. Please contact administrator.",
-                    color=discord.Color.red()
-                )
-                await interaction.followup.send(embed=embed)
-                return
-            
-            # Initialize translator with auto-detection
-            translator = GoogleTranslator(source='auto', target=target_language.lower())
-            
-            # Translate text
-            result = translator.translate(text)
-            
-            # For display purposes (deep-translator doesn't provide confidence)
-            source_lang = 'auto-detected'
-            
-            embed = discord.Embed(
-                title="🌍 Translation",
-                color=discord.Color.blue()
-            )
-            
-            embed.add_field(
-                name="📝 Original Text",
-                value=f"```{text}```",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="🔤 Source Language",
-                value=f"**{source_lang}**",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="🎯 Target Language",
-                value=f"**{target_language}**",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="✨ Translation",
-                value=f"```{result}```",
-                inline=False
-            )
-            
-            embed.set_footer(text="Powered by Google Translate")
-            await interaction.followup.send(embed=embed)
-            
-        except Exception as e:
-            logger.error(f"Error in translate_text: {e}")
+            from deep_translator import GoogleTranslator
+        except ImportError:
             embed = discord.Embed(
                 title="❌ Translation Error",
-                description=f"Could not translate text. Error: {str(e)}",
-                color=discord.Color.red()
+                description="Translation service not available. Please contact administrator.",
+                color=_RED
             )
             await interaction.followup.send(embed=embed)
+            return
+        
+        # Initialize translator with auto-detection
+        translator = GoogleTranslator(source='auto', target=target_language.lower())
+        
+        # Translate text
+        result = translator.translate(text)
+        
+        # For display purposes (deep-translator doesn't provide confidence)
+        source_lang = 'auto-detected'
+        
+        embed = discord.Embed(
+            title="🌍 Translation",
+            color=_BLUE
+        )
+        
+        embed.add_field(
+            name="📝 Original Text",
+            value=f"```{text}```",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="🔤 Source Language",
+            value=f"**{source_lang}**",
+            inline=True
+        )
+        
+        embed.add_field(
+            name="🎯 Target Language",
+            value=f"**{target_language}**",
+            inline=True
+        )
+        
+        embed.add_field(
+            name="✨ Translation",
+            value=f"```{result}```",
+            inline=False
+        )
+        
+        embed.set_footer(text="Powered by Google Translate")
+        await interaction.followup.send(embed=embed)
     
     # Chabad.org Commands
     @app_commands.command(name="dailystudy", description="Get today's daily study from Chabad.org")
+    @safe_command("Could not get daily study content.")
     async def daily_study(self, interaction: discord.Interaction):
         """Get daily study content"""
         await interaction.response.defer()
         
-        try:
-            study = await self.chabad_client.get_daily_study()
-            
-            embed = discord.Embed(
-                title="📖 Today's Daily Study",
-                color=discord.Color.blue()
+        study = await asyncio.wait_for(self.chabad_client.get_daily_study(), _UPSTREAM_TIMEOUT)
+        
+        embed = discord.Embed(
+            title="📖 Today's Daily Study",
+            color=_BLUE
+        )
+        
+        if study and 'title' in study:
+            embed.add_field(
+                name="📚 Study Topic",
+                value=study['title'],
+                inline=False
             )
             
-            if study and 'title' in study:
-                embed.add_field(
-                    name="📚 Study Topic",
-                    value=study['title'],
-                    inline=False
-                )
-                
-                if 'description' in study:
-                    embed.add_field(
-                        name="📝 Description",
-                        value=study['description'][:500] + "..." if len(study['description']) > 500 else study['description'],
-                        inline=False
-                    )
-            else:
+            if 'description' in study:
                 embed.add_field(
-                    name="📖 Daily Study",
-                    value="Visit Chabad.org for today's daily study materials including Torah, Talmud, and Chassidic teachings.",
+                    name="📝 Description",
+                    value=_ellipsize(study['description'], 500),
                     inline=False
                 )
-            
+        else:
             embed.add_field(
-                name="🔗 Learn More",
-                value="Visit [Chabad.org Daily Study](https://www.chabad.org/library/article_cdo/aid/3146/jewish/Daily-Study.htm)",
+                name="📖 Daily Study",
+                value="Visit Chabad.org for today's daily study materials including Torah, Talmud, and Chassidic teachings.",
                 inline=False
             )
-            
-            embed.set_footer(text="Daily study from Chabad.org")
-            await interaction.followup.send(embed=embed)
-            
-        except Exception as e:
-            logger.error(f"Error in daily_study: {e}")
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Could not get daily study content.",
-                color=discord.Color.red()
-            )
-            await interaction.followup.send(embed=embed)
+        
+        embed.add_field(
+            name="🔗 Learn More",
+            value="Visit [Chabad.org Daily Study](https://www.chabad.org/library/article_cdo/aid/3146/jewish/Daily-Study.htm)",
+            inline=False
+        )
+        
+        embed.set_footer(text="Daily study from Chabad.org")
+        await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="dailywisdom", description="Get daily wisdom quote from Chabad.org")
+    @safe_command("Could not get daily wisdom content.")
     async def daily_wisdom(self, interaction: discord.Interaction):
         """Get daily wisdom content"""
         await interaction.response.defer()
         
-        try:
-            wisdom = await self.chabad_client.get_daily_wisdom()
-            
-            embed = discord.Embed(
-                title="💎 Today's Daily Wisdom",
-                color=discord.Color.gold()
+        wisdom = await asyncio.wait_for(self.chabad_client.get_daily_wisdom(), _UPSTREAM_TIMEOUT)
+        
+        embed = discord.Embed(
+            title="💎 Today's Daily Wisdom",
+            color=_GOLD
+        )
+        
+        if wisdom and 'title' in wisdom:
+            embed.add_field(
+                name="🌟 Wisdom",
+                value=wisdom['title'],
+                inline=False
             )
             
-            if wisdom and 'title' in wisdom:
-                embed.add_field(
-                    name="🌟 Wisdom",
-                    value=wisdom['title'],
-                    inline=False
-                )
-                
-                if 'description' in wisdom:
-                    embed.add_field(
-                        name="📖 Teaching",
-                        value=wisdom['description'][:400] + "..." if len(wisdom['description']) > 400 else wisdom['description'],
-                        inline=False
-                    )
-            else:
+            if 'description' in wisdom:
                 embed.add_field(
-                    name="🌟 Daily Wisdom",
-                    value="Daily inspiration from Chabad teachings, offering spiritual insights for modern life.",
+                    name="📖 Teaching",
+                    value=_ellipsize(wisdom['description'], 400),
                     inline=False
                 )
-            
+        else:
             embed.add_field(
-                name="🔗 More Wisdom",
-                value="Explore more at [Chabad.org Daily Wisdom](https://www.chabad.org/library/article_cdo/aid/3147/jewish/Daily-Wisdom.htm)",
+                name="🌟 Daily Wisdom",
+                value="Daily inspiration from Chabad teachings, offering spiritual insights for modern life.",
                 inline=False
             )
-            
-            embed.set_footer(text="Daily wisdom from Chabad.org")
-            await interaction.followup.send(embed=embed)
-            
-        except Exception as e:
-            logger.error(f"Error in daily_wisdom: {e}")
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Could not get daily wisdom content.",
-                color=discord.Color.red()
-            )
-            await interaction.followup.send(embed=embed)
+        
+        embed.add_field(
+            name="🔗 More Wisdom",
+            value="Explore more at [Chabad.org Daily Wisdom](https://www.chabad.org/library/article_cdo/aid/3147/jewish/Daily-Wisdom.htm)",
+            inline=False
+        )
+        
+        embed.set_footer(text="Daily wisdom from Chabad.org")
+        await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="tanya", description="Get today's Tanya lesson from Chabad.org")
+    @safe_command("Could not get Tanya lesson.")
     async def daily_tanya(self, interaction: discord.Interaction):
         """Get daily Tanya lesson"""
         await interaction.response.defer()
         
-        try:
-            tanya = await self.chabad_client.get_daily_tanya()
-            
-            embed = discord.Embed(
-                title="📜 Today's Tanya Lesson",
-                description="Daily wisdom from the foundational work of Chabad Chassidism",
-                color=discord.Color.purple()
+        tanya = await asyncio.wait_for(self.chabad_client.get_daily_tanya(), _UPSTREAM_TIMEOUT)
+        
+        embed = discord.Embed(
+            title="📜 Today's Tanya Lesson",
+            description="Daily wisdom from the foundational work of Chabad Chassidism",
+            color=_PURPLE
+        )
+        
+        if tanya and 'title' in tanya:
+            embed.add_field(
+                name="📖 Lesson",
+                value=tanya['title'],
+                inline=False
             )
             
-            if tanya and 'title' in tanya:
-                embed.add_field(
-                    name="📖 Lesson",
-                    value=tanya['title'],
-                    inline=False
-                )
-                
-                if 'description' in tanya:
-                    embed.add_field(
-                        name="🧠 Teaching",
-                        value=tanya['description'][:400] + "..." if len(tanya['description']) > 400 else tanya['description'],
-                        inline=False
-                    )
-            else:
+            if 'description' in tanya:
                 embed.add_field(
-                    name="📜 About Tanya",
-                    value="The Tanya is the fundamental work of Chabad Chassidic philosophy, teaching the path to spiritual growth through understanding the soul's divine nature.",
+                    name="🧠 Teaching",
+                    value=_ellipsize(tanya['description'], 400),
                     inline=False
                 )
-            
+        else:
             embed.add_field(
-                name="🔗 Study More",
-                value="Continue learning at [Chabad.org Tanya](https://www.chabad.org/library/tanya)",
+                name="📜 About Tanya",
+                value="The Tanya is the fundamental work of Chabad Chassidic philosophy, teaching the path to spiritual growth through understanding the soul's divine nature.",
                 inline=False
             )
-            
-            embed.set_footer(text="Tanya lessons from Chabad.org")
-            await interaction.followup.send(embed=embed)
-            
-        except Exception as e:
-            logger.error(f"Error in daily_tanya: {e}")
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Could not get Tanya lesson.",
-                color=discord.Color.red()
-            )
-            await interaction.followup.send(embed=embed)
+        
+        embed.add_field(
+            name="🔗 Study More",
+            value="Continue learning at [Chabad.org Tanya](https://www.chabad.org/library/tanya)",
+            inline=False
+        )
+        
+        embed.set_footer(text="Tanya lessons from Chabad.org")
+        await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="chabadcenters", description="Find Chabad centers near a location")
     @app_commands.describe(location="City or location to search for Chabad centers")
+    @safe_command("Could not search Chabad centers.")
     async def chabad_centers(self, interaction: discord.Interaction, location: str):
         """Find Chabad centers"""
         await interaction.response.defer()
         
-        try:
-            embed = discord.Embed(
-                title=f"🏛️ Chabad Centers near {location}",
-                description="Connect with your local Chabad community",
-                color=discord.Color.blue()
-            )
-            
-            embed.add_field(
-                name="🌍 Global Network",
-                value="Chabad operates over 5,000 centers worldwide, serving Jewish communities in 100+ countries.",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="🔍 Find Centers",
-                value=f"Search for Chabad centers at [Chabad.org Directory](https://www.chabad.org/centers/default_cdo/jewish/Chabad-Locator.htm?searchstring={quote(location)})",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="📞 Services",
-                value="• Shabbat services\n• Jewish education\n• Holiday celebrations\n• Community events\n• Rabbi consultations",
-                inline=False
-            )
-            
-            embed.set_footer(text="Chabad center directory from Chabad.org")
-            await interaction.followup.send(embed=embed)
-            
-        except Exception as e:
-            logger.error(f"Error in chabad_centers: {e}")
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Could not search Chabad centers.",
-                color=discord.Color.red()
-            )
-            await interaction.followup.send(embed=embed)
-    
-    # Unified Smart Commands - Combining Multiple APIs
-    @app_commands.command(name="chassidic", description="Explore Chassidic content from stories (Chabad) to books (Dicta)")
-    @app_commands.describe(type="Choose: stories, books, or all")
-    async def chassidic_unified(self, interaction: discord.Interaction, type: str = "all"):
-        """Unified Chassidic content from multiple sources"""
+        embed = discord.Embed(
+            title=f"🏛️ Chabad Centers near {location}",
+            description="Connect with your local Chabad community",
+            color=_BLUE
+        )
+        
+        embed.add_field(
+            name="🌍 Global Network",
+            value="Chabad operates over 5,000 centers worldwide, serving Jewish communities in 100+ countries.",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="🔍 Find Centers",
+            value=_CHABAD_LOCATOR_TMPL.format(quote_plus(location)),
+            inline=False
+        )
+        
+        embed.add_field(
+            name="📞 Services",
+            value="• Shabbat services\n• Jewish education\n• Holiday celebrations\n• Community events\n• Rabbi consultations",
+            inline=False
+        )
+        
+        embed.set_footer(text="Chabad center directory from Chabad.org")
+        await interaction.followup.send(embed=embed)
+    
+    # Unified Smart Commands - Combining Multiple APIs
+    @app_commands.command(name="chassidic", description="Explore Chassidic content from stories (Chabad) to books (Dicta)")
+    @app_commands.describe(type="Choose: stories, books, or all")
+    @app_commands.choices(type=[
+        app_commands.Choice(name="Stories", value="stories"),
+        app_commands.Choice(name="Books", value="books"),
+        app_commands.Choice(name="All", value="all"),
+    ])
+    @safe_command("Could not get Chassidic content.")
+    async def chassidic_unified(self, interaction: discord.Interaction, type: str = "all"):
+        """Unified Chassidic content from multiple sources"""
         await interaction.response.defer()
         
-        try:
-            embed = discord.Embed(
-                title="🔥 Chassidic Wisdom & Literature",
-                description="Stories, teachings, and digitized books from multiple sources",
-                color=discord.Color.gold()
-            )
-            
-            if type.lower() in ["stories", "all"]:
-                embed.add_field(
-                    name="📚 Chassidic Stories (Chabad.org)",
-                    value="Inspiring tales teaching faith, kindness, spiritual growth, and overcoming challenges through the wisdom of great rabbis.",
-                    inline=False
-                )
-                
-                embed.add_field(
-                    name="🔗 Read Stories",
-                    value="[Chabad.org Stories](https://www.chabad.org/library/article_cdo/aid/3149/jewish/Stories.htm)",
-                    inline=True
-                )
+        embed = discord.Embed(
+            title="🔥 Chassidic Wisdom & Literature",
+            description="Stories, teachings, and digitized books from multiple sources",
+            color=_GOLD
+        )
+        
+        if type in _CHASSIDIC_STORIES:
+            _add_fields(embed, _CHASSIDIC_STORY_FIELDS)
+        
+        if type in _CHASSIDIC_BOOKS:
+            # Get actual Chassidic books from Dicta
+            books = await retry_async(lambda: self.dicta_client.get_chassidic_books(limit=3))
             
-            if type.lower() in ["books", "all"]:
-                # Get actual Chassidic books from Dicta
-                books = await self.dicta_client.get_chassidic_books(limit=3)
-                
-                if books:
-                    books_text = ""
-                    for book in books[:3]:
-                        title = book.get('displayNameEnglish', book.get('displayName', 'Unknown'))
-                        author = book.get('authorEnglish', book.get('author', 'Unknown'))
-                        books_text += f"• **{title[:30]}{'...' if len(title) > 30 else ''}** by {author}\n"
-                    
-                    embed.add_field(
-                        name="📖 AI-Enhanced Chassidic Books (Dicta)",
-                        value=books_text,
-                        inline=False
-                    )
-                
-                embed.add_field(
-                    name="🤖 AI Features",
-                    value="Rashi script modernization • Automatic nikud • Enhanced readability",
-                    inline=True
-                )
+            if books:
+                book_lines = []
+                for book in books[:3]:
+                    title = book.get('displayNameEnglish', book.get('displayName', 'Unknown'))
+                    author = book.get('authorEnglish', book.get('author', 'Unknown'))
+                    book_lines.append(f"• **{_ellipsize(title, 30)}** by {author}")
+                books_text = "\n".join(book_lines)
                 
                 embed.add_field(
-                    name="🔗 Browse Library",
-                    value="[Dicta Library](https://library.dicta.org.il)",
-                    inline=True
+                    name="📖 AI-Enhanced Chassidic Books (Dicta)",
+                    value=books_text,
+                    inline=False
                 )
             
-            embed.set_footer(text="Chassidic content from Chabad.org & Dicta.org.il")
-            await interaction.followup.send(embed=embed)
-            
-        except Exception as e:
-            logger.error(f"Error in chassidic_unified: {e}")
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Could not get Chassidic content.",
-                color=discord.Color.red()
-            )
-            await interaction.followup.send(embed=embed)
+            _add_fields(embed, _DICTA_FEATURE_FIELDS)
+        
+        embed.set_footer(text="Chassidic content from Chabad.org & Dicta.org.il")
+        # Shield the reply so a dispatcher cancellation cannot drop the gathered results
+        await asyncio.shield(interaction.followup.send(embed=embed))
     
     @app_commands.command(name="dailylearning", description="Unified daily Jewish learning from multiple sources")
     @app_commands.describe(source="Choose: chabad, sefaria, all, or random")
+    @safe_command("Could not get daily learning content.")
     async def daily_learning_unified(self, interaction: discord.Interaction, source: str = "all"):
         """Unified daily learning content"""
         await interaction.response.defer()
         
-        try:
-            embed = discord.Embed(
-                title="📖 Daily Jewish Learning",
-                description="Comprehensive daily study from multiple authentic sources",
-                color=discord.Color.blue()
-            )
-            
-            if source.lower() in ["chabad", "all", "random"]:
-                embed.add_field(
-                    name="🎯 Daily Mitzvah",
-                    value="Daily commandments and spiritual practices guide Jewish life through 613 mitzvot (positive actions and prohibitions).",
-                    inline=False
-                )
-                
-                embed.add_field(
-                    name="💎 Daily Wisdom",
-                    value="Chassidic teachings offering spiritual insights for modern life from Chabad tradition.",
-                    inline=False
-                )
-                
-                embed.add_field(
-                    name="📜 Tanya Study",
-                    value="Foundational Chassidic philosophy teaching the soul's divine nature and spiritual growth.",
-                    inline=False
-                )
-            
-            if source.lower() in ["sefaria", "all", "random"]:
-                # Get daily text from Sefaria
-                daily_text = await self.sefaria_client.get_daily_text()
-                if daily_text and 'title' in daily_text:
-                    embed.add_field(
-                        name="📚 Daily Text (Sefaria)",
-                        value=daily_text['title'],
-                        inline=False
-                    )
-            
-            # Always include Torah portion
-            torah_reading = await self.hebcal_client.get_torah_reading()
-            if torah_reading and 'parsha' in torah_reading:
-                embed.add_field(
-                    name="📜 Weekly Torah Portion",
-                    value=f"**{torah_reading['parsha']}** - {torah_reading.get('reading', 'Current weekly portion')}",
-                    inline=False
-                )
-            
+        embed = discord.Embed(
+            title="📖 Daily Jewish Learning",
+            description="Comprehensive daily study from multiple authentic sources",
+            color=_BLUE
+        )
+        
+        source_key = source.casefold()
+        if source_key in _DAILY_CHABAD:
+            _add_fields(embed, _DAILY_MITZVAH_FIELDS)
+        
+        # Fetch the daily text and Torah portion concurrently
+        wants_sefaria = source_key in _DAILY_SEFARIA
+        daily_text, torah_reading = await asyncio.gather(
+            retry_async(lambda: self.sefaria_client.get_daily_text(), timeout=_COMPOSITE_TIMEOUT)
+            if wants_sefaria else asyncio.sleep(0),
+            retry_async(lambda: self.hebcal_client.get_torah_reading()),
+            return_exceptions=True
+        )
+        daily_text = _result_or_none(daily_text, "daily_learning_unified daily text")
+        torah_reading = _result_or_none(torah_reading, "daily_learning_unified Torah reading")
+        
+        if daily_text and 'title' in daily_text:
             embed.add_field(
-                name="🔗 Sources",
-                value="[Chabad.org](https://www.chabad.org) • [Sefaria.org](https://www.sefaria.org) • [Hebcal.com](https://www.hebcal.com)",
+                name="📚 Daily Text (Sefaria)",
+                value=daily_text['title'],
                 inline=False
             )
-            
-            embed.set_footer(text="Daily learning from multiple Jewish sources")
-            await interaction.followup.send(embed=embed)
-            
-        except Exception as e:
-            logger.error(f"Error in daily_learning_unified: {e}")
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Could not get daily learning content.",
-                color=discord.Color.red()
+        
+        # Always include Torah portion
+        if torah_reading and 'parsha' in torah_reading:
+            embed.add_field(
+                name="📜 Weekly Torah Portion",
+                value=f"**{torah_reading['parsha']}** - {torah_reading.get('reading', 'Current weekly portion')}",
+                inline=False
             )
-            await interaction.followup.send(embed=embed)
+        
+        _add_fields(embed, _DAILY_LEARNING_SOURCE_FIELDS)
+        
+        embed.set_footer(text="Daily learning from multiple Jewish sources")
+        await asyncio.shield(interaction.followup.send(embed=embed))
     
     @app_commands.command(name="jewishbooks", description="Search Jewish books across all libraries (Sefaria, Dicta, NLI)")
     @app_commands.describe(
@@ -1605,151 +1712,145 @@ class SefariaCommands(commands.Cog):
         source="Choose source: dicta, nli, sefaria, or all",
         language="Language preference for multi-source search"
     )
+    @safe_command("Could not search Jewish books.")
     async def jewish_books_unified(self, interaction: discord.Interaction, query: str, source: str = "all", language: str = "both"):
         """Unified Jewish book search across multiple libraries"""
         await interaction.response.defer()
         
-        try:
-            embed = discord.Embed(
-                title=f"📚 Jewish Books: {query}",
-                description="Comprehensive search across multiple Jewish libraries",
-                color=discord.Color.purple()
-            )
-            
-            results_found = False
-            
-            # Search Dicta AI-enhanced books
-            if source.lower() in ["dicta", "all"]:
-                dicta_books = await self.dicta_client.search_books(query, limit=3)
-                if dicta_books:
-                    results_found = True
-                    books_text = ""
-                    for book in dicta_books:
-                        title = book.get('displayNameEnglish', book.get('displayName', 'Unknown'))
-                        author = book.get('authorEnglish', book.get('author', 'Unknown'))
-                        books_text += f"• **{title[:35]}{'...' if len(title) > 35 else ''}**\n  by {author}\n"
-                    
-                    embed.add_field(
-                        name="🤖 AI-Enhanced Books (Dicta - 800+ books)",
-                        value=books_text,
-                        inline=False
-                    )
-            
-            # Search National Library of Israel
-            if source.lower() in ["nli", "all"]:
-                nli_books = await self.nli_client.search_jewish_books(query, language, limit=3)
-                if nli_books:
-                    results_found = True
-                    books_text = ""
-                    for book in nli_books:
-                        title = book.get('title', 'Unknown Title')
-                        creator = book.get('creator', 'Unknown Creator')
-                        books_text += f"• **{title[:35]}{'...' if len(title) > 35 else ''}**\n  by {creator}\n"
-                    
-                    embed.add_field(
-                        name="🏛️ Historical Archives (National Library)",
-                        value=books_text,
-                        inline=False
-                    )
-            
-            # Search Sefaria texts
-            if source.lower() in ["sefaria", "all"]:
-                sefaria_results = await self.sefaria_client.search_texts(query, limit=3)
-                if sefaria_results:
-                    results_found = True
-                    texts_text = ""
-                    for result in sefaria_results:
-                        title = result.get('title', 'Unknown Text')
-                        texts_text += f"• **{title[:40]}{'...' if len(title) > 40 else ''}**\n"
-                    
-                    embed.add_field(
-                        name="📜 Classical Texts (Sefaria)",
-                        value=texts_text,
-                        inline=False
-                    )
-            
-            if not results_found:
-                embed.description = f"No books found for: **{query}** in selected sources"
-                embed.color = discord.Color.orange()
+        embed = discord.Embed(
+            title=f"📚 Jewish Books: {query}",
+            description="Comprehensive search across multiple Jewish libraries",
+            color=_PURPLE
+        )
+        
+        results_found = False
+        
+        # Schedule only the selected sources, then search them concurrently
+        searches = {}
+        source_key = source.casefold()
+        if source_key in _BOOKS_DICTA:
+            searches["dicta"] = retry_async(lambda: self.dicta_client.search_books(query, limit=3))
+        if source_key in _BOOKS_NLI:
+            searches["nli"] = retry_async(lambda: self.nli_client.search_jewish_books(query, language, limit=3))
+        if source_key in _BOOKS_SEFARIA:
+            searches["sefaria"] = retry_async(lambda: self.sefaria_client.search_texts(query, limit=3),
+                                             timeout=_COMPOSITE_TIMEOUT)
+        done = await _gather_dict(searches, "jewish_books_unified")
+        
+        # Dicta AI-enhanced books
+        dicta_books = done.get("dicta")
+        if dicta_books:
+            results_found = True
+            book_lines = []
+            for book in dicta_books:
+                title = book.get('displayNameEnglish', book.get('displayName', 'Unknown'))
+                author = book.get('authorEnglish', book.get('author', 'Unknown'))
+                book_lines.append(f"• **{_ellipsize(title, 35)}**\n  by {author}")
+            books_text = "\n".join(book_lines)
             
             embed.add_field(
-                name="🔗 Explore Libraries",
-                value="[Dicta AI Books](https://library.dicta.org.il) • [National Library](https://www.nli.org.il) • [Sefaria Texts](https://www.sefaria.org)",
+                name="🤖 AI-Enhanced Books (Dicta - 800+ books)",
+                value=books_text,
                 inline=False
             )
+        
+        # National Library of Israel
+        nli_books = done.get("nli")
+        if nli_books:
+            results_found = True
+            book_lines = []
+            for book in nli_books:
+                title = book.title
+                creator = book.creator
+                book_lines.append(f"• **{_ellipsize(title, 35)}**\n  by {creator}")
+            books_text = "\n".join(book_lines)
             
-            embed.set_footer(text="Books from multiple Jewish libraries and archives")
-            await interaction.followup.send(embed=embed)
+            embed.add_field(
+                name="🏛️ Historical Archives (National Library)",
+                value=books_text,
+                inline=False
+            )
+        
+        # Sefaria texts
+        sefaria_results = done.get("sefaria")
+        if sefaria_results:
+            results_found = True
+            text_lines = []
+            for result in sefaria_results:
+                title = result.get('title', 'Unknown Text')
+                text_lines.append(f"• **{_ellipsize(title, 40)}**")
+            texts_text = "\n".join(text_lines)
             
-        except Exception as e:
-            logger.error(f"Error in jewish_books_unified: {e}")
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Could not search Jewish books.",
-                color=discord.Color.red()
+            embed.add_field(
+                name="📜 Classical Texts (Sefaria)",
+                value=texts_text,
+                inline=False
             )
-            await interaction.followup.send(embed=embed)
+        
+        if not results_found:
+            embed.description = f"No books found for: **{query}** in selected sources"
+            embed.color = _ORANGE
+        
+        embed.add_field(
+            name="🔗 Explore Libraries",
+            value="[Dicta AI Books](https://library.dicta.org.il) • [National Library](https://www.nli.org.il) • [Sefaria Texts](https://www.sefaria.org)",
+            inline=False
+        )
+        
+        embed.set_footer(text="Books from multiple Jewish libraries and archives")
+        await asyncio.shield(interaction.followup.send(embed=embed))
     
     # Revolutionary New Commands: TorahCalc + OpenTorah Integration
     @app_commands.command(name="calculate", description="Natural language Jewish calculations using TorahCalc")
     @app_commands.describe(query="Natural language calculation (e.g., 'Convert 3 amos to feet')")
+    @safe_command("Could not process calculation.")
     async def torah_calculate(self, interaction: discord.Interaction, query: str):
         """Perform advanced Jewish calculations using natural language"""
         await interaction.response.defer()
         
-        try:
-            # Use TorahCalc's natural language processing
-            result = await self.torahcalc_client.natural_language_query(query)
-            
-            embed = discord.Embed(
-                title="🧮 TorahCalc Calculation",
-                description=f"**Query:** {query}",
-                color=discord.Color.blue()
+        # Use TorahCalc's natural language processing
+        result = await retry_async(lambda: self.torahcalc_client.natural_language_query(query))
+        
+        embed = discord.Embed(
+            title="🧮 TorahCalc Calculation",
+            description=f"**Query:** {query}",
+            color=_BLUE
+        )
+        
+        if result and 'result' in result:
+            embed.add_field(
+                name="📊 Result",
+                value=result['result'],
+                inline=False
             )
             
-            if result and 'result' in result:
-                embed.add_field(
-                    name="📊 Result",
-                    value=result['result'],
-                    inline=False
-                )
-                
-                if 'explanation' in result:
-                    embed.add_field(
-                        name="💡 Explanation",
-                        value=result['explanation'],
-                        inline=False
-                    )
-            else:
-                embed.add_field(
-                    name="🔍 Processing",
-                    value=f"TorahCalc is processing: '{query}'\nThis includes biblical unit conversions, gematria, and halachic calculations.",
-                    inline=False
-                )
-                
+            if 'explanation' in result:
                 embed.add_field(
-                    name="💫 TorahCalc Features",
-                    value="• Biblical & Talmudic unit conversions\n• Gematria calculations\n• Hebrew calendar conversions\n• Halachic time calculations\n• Natural language processing",
+                    name="💡 Explanation",
+                    value=result['explanation'],
                     inline=False
                 )
-            
+        else:
             embed.add_field(
-                name="🔗 TorahCalc Website",
-                value="[www.torahcalc.com](https://www.torahcalc.com) - The Jewish Wolfram Alpha",
+                name="🔍 Processing",
+                value=f"TorahCalc is processing: '{query}'\nThis includes biblical unit conversions, gematria, and halachic calculations.",
                 inline=False
             )
             
-            embed.set_footer(text="Powered by TorahCalc - Advanced Jewish calculations")
-            await interaction.followup.send(embed=embed)
-            
-        except Exception as e:
-            logger.error(f"Error in torah_calculate: {e}")
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Could not process calculation.",
-                color=discord.Color.red()
+            embed.add_field(
+                name="💫 TorahCalc Features",
+                value="• Biblical & Talmudic unit conversions\n• Gematria calculations\n• Hebrew calendar conversions\n• Halachic time calculations\n• Natural language processing",
+                inline=False
             )
-            await interaction.followup.send(embed=embed)
+        
+        embed.add_field(
+            name="🔗 TorahCalc Website",
+            value="[www.torahcalc.com](https://www.torahcalc.com) - The Jewish Wolfram Alpha",
+            inline=False
+        )
+        
+        embed.set_footer(text="Powered by TorahCalc - Advanced Jewish calculations")
+        await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="measurements", description="Convert between biblical and modern units")
     @app_commands.describe(
@@ -1758,239 +1859,250 @@ class SefariaCommands(commands.Cog):
         to_unit="Unit to convert to", 
         amount="Amount to convert"
     )
+    @safe_command("Could not convert measurements.")
     async def biblical_measurements(self, interaction: discord.Interaction, unit_type: str, 
                                   from_unit: str, to_unit: str, amount: float = 1.0):
         """Convert between biblical and modern measurement units"""
         await interaction.response.defer()
         
-        try:
-            # Use TorahCalc for precise biblical conversions
-            result = await self.torahcalc_client.convert_biblical_units(
-                unit_type, from_unit, to_unit, amount
-            )
-            
-            embed = discord.Embed(
-                title="📏 Biblical Unit Conversion",
-                description=f"Converting {amount} {from_unit} to {to_unit}",
-                color=discord.Color.green()
+        # Use TorahCalc for precise biblical conversions
+        result = await retry_async(lambda: self.torahcalc_client.convert_biblical_units(
+            unit_type, from_unit, to_unit, amount
+        ))
+        
+        embed = discord.Embed(
+            title="📏 Biblical Unit Conversion",
+            description=f"Converting {amount} {from_unit} to {to_unit}",
+            color=_GREEN
+        )
+        
+        if result and 'result' in result:
+            embed.add_field(
+                name="🔄 Conversion Result",
+                value=f"**{amount} {from_unit}** = **{result['result']} {to_unit}**",
+                inline=False
             )
             
-            if result and 'result' in result:
-                embed.add_field(
-                    name="🔄 Conversion Result",
-                    value=f"**{amount} {from_unit}** = **{result['result']} {to_unit}**",
-                    inline=False
-                )
-                
-                if 'opinion' in result:
-                    embed.add_field(
-                        name="👨‍🏫 Halachic Opinion",
-                        value=f"Based on: {result['opinion']}",
-                        inline=False
-                    )
-            else:
+            if 'opinion' in result:
                 embed.add_field(
-                    name="📐 Unit Types Available",
-                    value="• **Length:** amah, tefach, etzbah, mil, parsah\n• **Volume:** kezayis, kav, seah, kor\n• **Weight:** shekel, mane, kikar\n• **Time:** shaah, et, chelek\n• **Coins:** shekel, dinar, maah",
+                    name="👨‍🏫 Halachic Opinion",
+                    value=f"Based on: {result['opinion']}",
                     inline=False
                 )
-            
-            embed.add_field(
-                name="🎯 Pro Tip",
-                value="Use `/calculate` for natural language: 'Convert 3 amos to feet'",
-                inline=False
-            )
-            
-            embed.set_footer(text="Biblical measurements from TorahCalc")
-            await interaction.followup.send(embed=embed)
-            
-        except Exception as e:
-            logger.error(f"Error in biblical_measurements: {e}")
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Could not convert measurements.",
-                color=discord.Color.red()
-            )
-            await interaction.followup.send(embed=embed)
+        else:
+            _add_fields(embed, _UNIT_TYPE_FIELDS)
+        
+        _add_fields(embed, _MEASUREMENT_TIP_FIELDS)
+        
+        embed.set_footer(text="Biblical measurements from TorahCalc")
+        await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="torahstudy", description="Comprehensive daily Torah study combining all sources")
     @app_commands.describe(date="Date in YYYY-MM-DD format (optional)")
+    @safe_command("Could not get comprehensive study data.")
     async def comprehensive_torah_study(self, interaction: discord.Interaction, date: str = None):
         """Get comprehensive daily Torah study from all sources"""
         await interaction.response.defer()
         
-        try:
-            embed = discord.Embed(
-                title="📚 Comprehensive Torah Study",
-                description="Daily learning from multiple authentic sources",
-                color=discord.Color.purple()
-            )
-            
-            # Get TorahCalc daily learning data
-            torahcalc_learning = await self.torahcalc_client.get_daily_learning(date)
-            if torahcalc_learning:
-                learning_text = ""
-                if 'dafYomi' in torahcalc_learning:
-                    learning_text += f"**Daf Yomi:** {torahcalc_learning['dafYomi']}\n"
-                if 'mishnahYomi' in torahcalc_learning:
-                    learning_text += f"**Mishnah Yomi:** {torahcalc_learning['mishnahYomi']}\n"
-                if 'dailyRambam' in torahcalc_learning:
-                    learning_text += f"**Daily Rambam:** {torahcalc_learning['dailyRambam']}\n"
-                
-                if learning_text:
-                    embed.add_field(
-                        name="📖 Daily Learning Schedule (TorahCalc)",
-                        value=learning_text,
-                        inline=False
-                    )
-            
-            # Get Hebrew date from TorahCalc
-            hebrew_date = await self.torahcalc_client.convert_date_greg_to_hebrew()
-            if hebrew_date and 'hebrewDate' in hebrew_date:
-                embed.add_field(
-                    name="📅 Hebrew Date",
-                    value=hebrew_date['hebrewDate'],
-                    inline=True
-                )
-            
-            # Get Torah portion from Hebcal
-            torah_reading = await self.hebcal_client.get_torah_reading()
-            if torah_reading and 'parsha' in torah_reading:
-                embed.add_field(
-                    name="📜 Weekly Torah Portion",
-                    value=f"**{torah_reading['parsha']}**",
-                    inline=True
-                )
-            
-            # Get daily text from Sefaria
-            daily_text = await self.sefaria_client.get_daily_text()
-            if daily_text and 'title' in daily_text:
-                embed.add_field(
-                    name="📚 Sefaria Daily Text",
-                    value=daily_text['title'],
-                    inline=False
-                )
-            
-            # Get Chabad daily content
-            chabad_wisdom = await self.chabad_client.get_daily_wisdom()
-            if chabad_wisdom and 'content' in chabad_wisdom:
-                embed.add_field(
-                    name="💎 Chabad Daily Wisdom",
-                    value=chabad_wisdom['content'][:200] + "..." if len(chabad_wisdom['content']) > 200 else chabad_wisdom['content'],
-                    inline=False
-                )
-            
-            # Get OpenTorah calendar info
-            calendar_info = await self.opentorah_client.get_jewish_calendar_data()
-            if calendar_info:
+        embed = discord.Embed(
+            title="📚 Comprehensive Torah Study",
+            description="Daily learning from multiple authentic sources",
+            color=_PURPLE
+        )
+        
+        # All six sources are independent, so fetch them concurrently and
+        # render whichever have answered by the deadline; stragglers are dropped
+        tasks = [asyncio.create_task(coro) for coro in (
+            retry_async(lambda: self.torahcalc_client.get_daily_learning(date)),
+            retry_async(lambda: self.torahcalc_client.convert_date_greg_to_hebrew()),
+            retry_async(lambda: self.hebcal_client.get_torah_reading()),
+            retry_async(lambda: self.sefaria_client.get_daily_text()),
+            retry_async(lambda: self.chabad_client.get_daily_wisdom()),
+            retry_async(lambda: self.opentorah_client.get_jewish_calendar_data()),
+        )]
+        done, pending = await asyncio.wait(tasks, timeout=_TORAHSTUDY_DEADLINE)
+        for task in pending:
+            task.cancel()
+        (torahcalc_learning, hebrew_date, torah_reading,
+         daily_text, chabad_wisdom, calendar_info) = (
+            _result_or_none(task.exception() or task.result(), "comprehensive_torah_study")
+            if task in done else None
+            for task in tasks
+        )
+        
+        # TorahCalc daily learning data
+        if torahcalc_learning:
+            learning_lines = []
+            if 'dafYomi' in torahcalc_learning:
+                learning_lines.append(f"**Daf Yomi:** {torahcalc_learning['dafYomi']}")
+            if 'mishnahYomi' in torahcalc_learning:
+                learning_lines.append(f"**Mishnah Yomi:** {torahcalc_learning['mishnahYomi']}")
+            if 'dailyRambam' in torahcalc_learning:
+                learning_lines.append(f"**Daily Rambam:** {torahcalc_learning['dailyRambam']}")
+            learning_text = "\n".join(learning_lines)
+            
+            if learning_text:
                 embed.add_field(
-                    name="🗓️ Calendar Features (OpenTorah)",
-                    value="Advanced astronomical & arithmetic calculations\nPrecise zmanim computations",
+                    name="📖 Daily Learning Schedule (TorahCalc)",
+                    value=learning_text,
                     inline=False
                 )
-            
+        
+        # Hebrew date from TorahCalc
+        if hebrew_date and 'hebrewDate' in hebrew_date:
+            embed.add_field(
+                name="📅 Hebrew Date",
+                value=hebrew_date['hebrewDate'],
+                inline=True
+            )
+        
+        # Torah portion from Hebcal
+        if torah_reading and 'parsha' in torah_reading:
             embed.add_field(
-                name="🔗 Study Resources",
-                value="[TorahCalc](https://www.torahcalc.com) • [Sefaria](https://www.sefaria.org) • [Chabad](https://www.chabad.org) • [OpenTorah](https://www.opentorah.org)",
+                name="📜 Weekly Torah Portion",
+                value=f"**{torah_reading['parsha']}**",
+                inline=True
+            )
+        
+        # Daily text from Sefaria
+        if daily_text and 'title' in daily_text:
+            embed.add_field(
+                name="📚 Sefaria Daily Text",
+                value=daily_text['title'],
                 inline=False
             )
-            
-            embed.set_footer(text="Comprehensive study from 6 major Jewish institutions")
-            await interaction.followup.send(embed=embed)
-            
-        except Exception as e:
-            logger.error(f"Error in comprehensive_torah_study: {e}")
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Could not get comprehensive study data.",
-                color=discord.Color.red()
+        
+        # Chabad daily content
+        if chabad_wisdom and 'content' in chabad_wisdom:
+            embed.add_field(
+                name="💎 Chabad Daily Wisdom",
+                value=_ellipsize(chabad_wisdom['content'], 200),
+                inline=False
             )
-            await interaction.followup.send(embed=embed)
+        
+        # OpenTorah calendar info
+        if calendar_info:
+            embed.add_field(
+                name="🗓️ Calendar Features (OpenTorah)",
+                value="Advanced astronomical & arithmetic calculations\nPrecise zmanim computations",
+                inline=False
+            )
+        
+        embed.add_field(
+            name="🔗 Study Resources",
+            value="[TorahCalc](https://www.torahcalc.com) • [Sefaria](https://www.sefaria.org) • [Chabad](https://www.chabad.org) • [OpenTorah](https://www.opentorah.org)",
+            inline=False
+        )
+        
+        embed.set_footer(text="Comprehensive study from 6 major Jewish institutions")
+        await asyncio.shield(interaction.followup.send(embed=embed))
     
     @app_commands.command(name="archives", description="Search across all Jewish digital archives and collections")
     @app_commands.describe(query="Search term for historical documents and texts")
+    @safe_command("Could not search digital archives.")
     async def digital_archives_search(self, interaction: discord.Interaction, query: str):
         """Search across all digital Jewish archives"""
         await interaction.response.defer()
         
-        try:
-            embed = discord.Embed(
-                title=f"🏛️ Digital Jewish Archives: {query}",
-                description="Comprehensive search across historical collections",
-                color=discord.Color.gold()
-            )
-            
-            results_found = False
-            
-            # Search OpenTorah archives
-            opentorah_results = await self.opentorah_client.search_all_archives(query, limit=2)
-            if opentorah_results:
-                results_found = True
-                archives_text = ""
-                for result in opentorah_results:
-                    archives_text += f"• **{result['source']}:** {result['title']}\n"
-                
-                embed.add_field(
-                    name="📜 OpenTorah Digital Archives",
-                    value=archives_text,
-                    inline=False
-                )
-            
-            # Search National Library of Israel
-            if any(keyword in query.lower() for keyword in ['manuscript', 'historical', 'photo', 'map']):
-                nli_results = await self.nli_client.search_hebrew_manuscripts(query, limit=2)
-                if nli_results:
-                    results_found = True
-                    manuscripts_text = ""
-                    for result in nli_results:
-                        title = result.get('title', 'Unknown')
-                        manuscripts_text += f"• **{title[:40]}{'...' if len(title) > 40 else ''}**\n"
-                    
-                    embed.add_field(
-                        name="📋 Historical Manuscripts (NLI)",
-                        value=manuscripts_text,
-                        inline=False
-                    )
-            
-            # Search Dicta AI-enhanced books
-            dicta_results = await self.dicta_client.search_books(query, limit=2)
-            if dicta_results:
-                results_found = True
-                books_text = ""
-                for book in dicta_results:
-                    title = book.get('displayNameEnglish', book.get('displayName', 'Unknown'))
-                    books_text += f"• **{title[:35]}{'...' if len(title) > 35 else ''}**\n"
-                
-                embed.add_field(
-                    name="🤖 AI-Enhanced Texts (Dicta)",
-                    value=books_text,
-                    inline=False
-                )
-            
-            if not results_found:
-                embed.add_field(
-                    name="🔍 Available Archives",
-                    value="• **OpenTorah:** Early Chabad history & TEI texts\n• **National Library:** Hebrew manuscripts & photos\n• **Dicta:** 800+ AI-enhanced Jewish books\n• **Alter Rebbe Archive:** Foundational Chabad documents",
-                    inline=False
-                )
+        embed = discord.Embed(
+            title=f"🏛️ Digital Jewish Archives: {query}",
+            description="Comprehensive search across historical collections",
+            color=_GOLD
+        )
+        
+        results_found = False
+        
+        # Decide on the NLI fan-out up front, then query every archive concurrently
+        searches = {
+            "opentorah": retry_async(lambda: self.opentorah_client.search_all_archives(query, limit=2),
+                                     timeout=_COMPOSITE_TIMEOUT),
+            "dicta": retry_async(lambda: self.dicta_client.search_books(query, limit=2)),
+        }
+        query_key = query.casefold()
+        if any(keyword in query_key for keyword in _NLI_TRIGGER):
+            searches["nli"] = self._search_nli_collections(query, limit=2)
+        done = await _gather_dict(searches, "digital_archives_search")
+        
+        # OpenTorah archives
+        opentorah_results = done.get("opentorah")
+        if opentorah_results:
+            results_found = True
+            archive_lines = []
+            for result in opentorah_results:
+                archive_lines.append(f"• **{result['source']}:** {result['title']}")
+            archives_text = "\n".join(archive_lines)
             
             embed.add_field(
-                name="🏛️ Archive Features",
-                value="Historical preservation • Scholarly annotations • Digital accessibility • Advanced search",
+                name="📜 OpenTorah Digital Archives",
+                value=archives_text,
                 inline=False
             )
+        
+        # National Library of Israel collections
+        nli_results = done.get("nli")
+        if nli_results:
+            results_found = True
+            collection_lines = []
+            for icon, item in nli_results:
+                title = item.title
+                collection_lines.append(f"{icon} **{_ellipsize(title, 40)}**")
+            collections_text = "\n".join(collection_lines)
             
-            embed.set_footer(text="Searching across multiple Jewish digital archives")
-            await interaction.followup.send(embed=embed)
+            embed.add_field(
+                name="📋 National Library of Israel",
+                value=collections_text,
+                inline=False
+            )
+        
+        # Dicta AI-enhanced books
+        dicta_results = done.get("dicta")
+        if dicta_results:
+            results_found = True
+            book_lines = []
+            for book in dicta_results:
+                title = book.get('displayNameEnglish', book.get('displayName', 'Unknown'))
+                book_lines.append(f"• **{_ellipsize(title, 35)}**")
+            books_text = "\n".join(book_lines)
             
-        except Exception as e:
-            logger.error(f"Error in digital_archives_search: {e}")
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Could not search digital archives.",
-                color=discord.Color.red()
+            embed.add_field(
+                name="🤖 AI-Enhanced Texts (Dicta)",
+                value=books_text,
+                inline=False
             )
-            await interaction.followup.send(embed=embed)
+        
+        if not results_found:
+            embed.add_field(
+                name="🔍 Available Archives",
+                value="• **OpenTorah:** Early Chabad history & TEI texts\n• **National Library:** Hebrew manuscripts & photos\n• **Dicta:** 800+ AI-enhanced Jewish books\n• **Alter Rebbe Archive:** Foundational Chabad documents",
+                inline=False
+            )
+        
+        embed.add_field(
+            name="🏛️ Archive Features",
+            value="Historical preservation • Scholarly annotations • Digital accessibility • Advanced search",
+            inline=False
+        )
+        
+        embed.set_footer(text="Searching across multiple Jewish digital archives")
+        await asyncio.shield(interaction.followup.send(embed=embed))
+    
+    async def _search_nli_collections(self, query: str, limit: int = 2) -> List[Tuple[str, NLIItem]]:
+        """Search NLI manuscripts, photos, books and maps in one concurrent batch"""
+        searches = (
+            ("📜", asyncio.wait_for(self.nli_client.search_hebrew_manuscripts(query, limit=limit), _UPSTREAM_TIMEOUT)),
+            ("📸", asyncio.wait_for(self.nli_client.search_historical_photos(query, limit=limit), _UPSTREAM_TIMEOUT)),
+            ("📚", asyncio.wait_for(self.nli_client.search_jewish_books(query, 'heb', limit=limit), _UPSTREAM_TIMEOUT)),
+            ("🗺️", asyncio.wait_for(self.nli_client.search_maps(query, limit=limit), _UPSTREAM_TIMEOUT)),
+        )
+        results = await asyncio.gather(*(search for _, search in searches), return_exceptions=True)
+        
+        merged = []
+        for (icon, _), items in zip(searches, results):
+            if isinstance(items, Exception):
+                logger.error("Error in NLI collection search: %s", items, exc_info=items)
+                continue
+            merged.extend((icon, item) for item in items or [])
+        return merged
     
     # Revolutionary new commands showcasing the ultimate Jewish software ecosystem
     
@@ -1999,214 +2111,131 @@ class SefariaCommands(commands.Cog):
         query="Search query for books or topics",
         category="Book category to search within"
     )
+    @safe_command("Error accessing Orayta library. Please try again.")
     async def orayta_library(self, interaction: discord.Interaction, query: str, category: str = ""):
         """Access Orayta's cross-platform Jewish library"""
         await interaction.response.defer()
         
-        try:
-            results = await self.orayta_client.search_books(query, category, limit=5)
-            
-            embed = discord.Embed(
-                title="🏛️ Orayta Jewish Library Search",
-                description=f"Search results for: **{query}**",
-                color=0x4A90E2
-            )
-            
-            for result in results:
-                embed.add_field(
-                    name=f"📚 {result['title']}",
-                    value=f"**Category**: {result['category']}\n"
-                          f"**Description**: {result['description']}\n"
-                          f"**Language**: {result['language']}\n"
-                          f"**Status**: {result['availability']}",
-                    inline=False
-                )
-            
-            # Add library info
-            stats = await self.orayta_client.get_library_statistics()
+        results = await retry_async(lambda: self.orayta_client.search_books(query, category, limit=5))
+        
+        embed = discord.Embed(
+            title="🏛️ Orayta Jewish Library Search",
+            description=f"Search results for: **{query}**",
+            color=_ORAYTA_BLUE
+        )
+        
+        for result in results:
             embed.add_field(
-                name="📊 Library Information",
-                value=f"**Total Books**: {stats['total_books']}\n"
-                      f"**Platform**: {stats['platform']}\n"
-                      f"**Scope**: {stats['historical_scope']}",
-                inline=True
+                name=f"📚 {result['title']}",
+                value=f"**Category**: {result['category']}\n"
+                      f"**Description**: {result['description']}\n"
+                      f"**Language**: {result['language']}\n"
+                      f"**Status**: {result['availability']}",
+                inline=False
             )
-            
-            embed.set_footer(text="Orayta: Cross-platform Jewish texts library")
-            await interaction.followup.send(embed=embed)
-            
-        except Exception as e:
-            logger.error(f"Error in orayta_library: {e}")
-            await interaction.followup.send("❌ Error accessing Orayta library. Please try again.")
+        
+        # Add library info
+        stats = await asyncio.wait_for(self.orayta_client.get_library_statistics(), _UPSTREAM_TIMEOUT)
+        embed.add_field(
+            name="📊 Library Information",
+            value=f"**Total Books**: {stats['total_books']}\n"
+                  f"**Platform**: {stats['platform']}\n"
+                  f"**Scope**: {stats['historical_scope']}",
+            inline=True
+        )
+        
+        embed.set_footer(text="Orayta: Cross-platform Jewish texts library")
+        await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="siddur", description="Create custom Jewish liturgical books with OpenSiddur")
     @app_commands.describe(
         prayer_type="Type of prayer or liturgy to search",
         tradition="Jewish tradition (ashkenazi, sephardic, reform, etc.)"
     )
+    @safe_command("Error accessing OpenSiddur platform. Please try again.")
     async def opensiddur_liturgy(self, interaction: discord.Interaction, prayer_type: str, tradition: str = ""):
         """Access OpenSiddur's customizable liturgical platform"""
         await interaction.response.defer()
         
-        try:
-            results = await self.opensiddur_client.search_prayers(prayer_type, tradition, limit=3)
-            platform_info = await self.opensiddur_client.get_siddur_builder_info()
-            
-            embed = discord.Embed(
-                title="🕊️ OpenSiddur Liturgical Platform",
-                description=f"Custom liturgy for: **{prayer_type}**",
-                color=0x8B4513
-            )
-            
-            for result in results:
-                traditions_str = ", ".join(result.get('traditions', ['All traditions']))
-                languages_str = ", ".join(result.get('languages', ['Hebrew', 'English']))
-                
-                embed.add_field(
-                    name=f"📿 {result['title']}",
-                    value=f"**Category**: {result['category']}\n"
-                          f"**Description**: {result['description']}\n"
-                          f"**Traditions**: {traditions_str}\n"
-                          f"**Languages**: {languages_str}\n"
-                          f"**Customizable**: {'✅' if result.get('customizable') else '❌'}",
-                    inline=False
-                )
+        results = await asyncio.wait_for(self.opensiddur_client.search_prayers(prayer_type, tradition, limit=3), _UPSTREAM_TIMEOUT)
+        platform_info = await asyncio.wait_for(self.opensiddur_client.get_siddur_builder_info(), _UPSTREAM_TIMEOUT)
+        
+        embed = discord.Embed(
+            title="🕊️ OpenSiddur Liturgical Platform",
+            description=f"Custom liturgy for: **{prayer_type}**",
+            color=_SIDDUR_BROWN
+        )
+        
+        for result in results:
+            traditions_str = ", ".join(result.get('traditions', ['All traditions']))
+            languages_str = ", ".join(result.get('languages', ['Hebrew', 'English']))
             
-            # Add platform capabilities
             embed.add_field(
-                name="🔧 Platform Features",
-                value=f"**Mission**: {platform_info['mission']}\n"
-                      f"**Core Values**: Pluralism, Historical Awareness, Individual Freedom\n"
-                      f"**Formats**: Print, Screen, Mobile, Accessible",
+                name=f"📿 {result['title']}",
+                value=f"**Category**: {result['category']}\n"
+                      f"**Description**: {result['description']}\n"
+                      f"**Traditions**: {traditions_str}\n"
+                      f"**Languages**: {languages_str}\n"
+                      f"**Customizable**: {'✅' if result.get('customizable') else '❌'}",
                 inline=False
             )
-            
-            embed.set_footer(text="OpenSiddur: Free software toolkit for Jewish liturgical books")
-            await interaction.followup.send(embed=embed)
-            
-        except Exception as e:
-            logger.error(f"Error in opensiddur_liturgy: {e}")
-            await interaction.followup.send("❌ Error accessing OpenSiddur platform. Please try again.")
+        
+        # Add platform capabilities
+        embed.add_field(
+            name="🔧 Platform Features",
+            value=_OPENSIDDUR_FEATURES_TMPL.format(platform_info['mission']),
+            inline=False
+        )
+        
+        embed.set_footer(text="OpenSiddur: Free software toolkit for Jewish liturgical books")
+        await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="chiddush", description="Share and discover Torah insights on Pninim")
     @app_commands.describe(
         topic="Torah topic or insight category",
         author_type="Type of contributor (scholars, students, educators, community)"
     )
+    @safe_command("Error accessing Pninim platform. Please try again.")
     async def pninim_insights(self, interaction: discord.Interaction, topic: str, author_type: str = ""):
         """Access Pninim's Torah insights sharing platform"""
         await interaction.response.defer()
         
-        try:
-            insights = await self.pninim_client.search_insights(topic, limit=3)
-            platform_info = await self.pninim_client.get_platform_info()
-            
-            embed = discord.Embed(
-                title="💡 Pninim Torah Insights Platform",
-                description=f"**{platform_info['tagline']}**\nInsights on: **{topic}**",
-                color=0xFF6B35
-            )
-            
-            for insight in insights:
-                embed.add_field(
-                    name=f"✨ {insight['type']}",
-                    value=f"**Category**: {insight['category']}\n"
-                          f"**Preview**: {insight['preview']}\n"
-                          f"**Engagement**: {insight['engagement']}\n"
-                          f"**Learning Value**: {insight['learning_value']}",
-                    inline=False
-                )
-            
-            # Add community info
-            community = await self.pninim_client.get_community_features()
+        insights = await asyncio.wait_for(self.pninim_client.search_insights(topic, limit=3), _UPSTREAM_TIMEOUT)
+        platform_info = await asyncio.wait_for(self.pninim_client.get_platform_info(), _UPSTREAM_TIMEOUT)
+        
+        embed = discord.Embed(
+            title="💡 Pninim Torah Insights Platform",
+            description=f"**{platform_info['tagline']}**\nInsights on: **{topic}**",
+            color=_PNINIM_ORANGE
+        )
+        
+        for insight in insights:
             embed.add_field(
-                name="🤝 Community Platform",
-                value=f"**Mission**: {platform_info['mission']}\n"
-                      f"**Features**: Social Torah learning, Peer collaboration\n"
-                      f"**Benefits**: Accessible scholarship, Rapid insight sharing",
+                name=f"✨ {insight['type']}",
+                value=f"**Category**: {insight['category']}\n"
+                      f"**Preview**: {insight['preview']}\n"
+                      f"**Engagement**: {insight['engagement']}\n"
+                      f"**Learning Value**: {insight['learning_value']}",
                 inline=False
             )
-            
-            embed.set_footer(text="Pninim: Twitter for Torah insights and Chiddushim")
-            await interaction.followup.send(embed=embed)
-            
-        except Exception as e:
-            logger.error(f"Error in pninim_insights: {e}")
-            await interaction.followup.send("❌ Error accessing Pninim platform. Please try again.")
+        
+        # Add community info
+        embed.add_field(
+            name="🤝 Community Platform",
+            value=f"**Mission**: {platform_info['mission']}\n"
+                  f"**Features**: Social Torah learning, Peer collaboration\n"
+                  f"**Benefits**: Accessible scholarship, Rapid insight sharing",
+            inline=False
+        )
+        
+        embed.set_footer(text="Pninim: Twitter for Torah insights and Chiddushim")
+        await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="ecosystem", description="Overview of the complete Jewish software ecosystem")
+    @safe_command("Error displaying ecosystem overview. Please try again.")
     async def jewish_software_ecosystem(self, interaction: discord.Interaction):
         """Display the comprehensive Jewish software ecosystem integrated in this bot"""
-        await interaction.response.defer()
-        
-        try:
-            embed = discord.Embed(
-                title="🌟 Complete Jewish Software Ecosystem",
-                description="The most comprehensive Discord bot for Jewish learning and practice",
-                color=0x9932CC
-            )
-            
-            # Core text sources
-            embed.add_field(
-                name="📚 Core Text Libraries",
-                value="**Sefaria**: Digital library of Jewish texts\n"
-                      "**Dicta**: 800+ AI-enhanced books\n"
-                      "**Orayta**: Cross-platform Jewish library\n"
-                      "**OpenTorah**: Early Chabad archives",
-                inline=True
-            )
-            
-            # Historical and cultural resources
-            embed.add_field(
-                name="🏛️ Historical Archives",
-                value="**National Library of Israel**: Manuscripts, photos\n"
-                      "**Chabad.org**: Daily wisdom, Tanya, stories\n"
-                      "**Hebcal**: Jewish calendar and holidays",
-                inline=True
-            )
-            
-            # Modern tools and platforms
-            embed.add_field(
-                name="🔧 Modern Platforms",
-                value="**TorahCalc**: Jewish calculations & gematria\n"
-                      "**OpenSiddur**: Custom liturgical books\n"
-                      "**Pninim**: Torah insights sharing\n"
-                      "**AI Integration**: OpenAI-powered responses",
-                inline=True
-            )
-            
-            # Capabilities summary
-            embed.add_field(
-                name="🚀 Unprecedented Capabilities",
-                value="✅ **40+ specialized commands**\n"
-                      "✅ **10+ major Jewish institutions**\n"
-                      "✅ **AI-enhanced text processing**\n"
-                      "✅ **Biblical calculations & gematria**\n"
-                      "✅ **Historical manuscript access**\n"
-                      "✅ **Custom liturgy creation**\n"
-                      "✅ **Social Torah learning**\n"
-                      "✅ **Multilingual support**",
-                inline=False
-            )
-            
-            # Revolutionary features
-            embed.add_field(
-                name="🎯 Revolutionary Features",
-                value="🔬 **Smart unified commands** combining multiple APIs\n"
-                      "🧮 **Natural language Torah calculations**\n"
-                      "🏛️ **Cross-archive digital searches**\n"
-                      "📚 **Comprehensive daily study aggregation**\n"
-                      "💡 **Community-driven insight sharing**\n"
-                      "🕊️ **Customizable liturgical creation**",
-                inline=False
-            )
-            
-            embed.set_footer(text="The Ultimate Jewish Discord Bot - No longer just 'the best' but 'the only one you'll ever need'")
-            await interaction.followup.send(embed=embed)
-            
-        except Exception as e:
-            logger.error(f"Error in jewish_software_ecosystem: {e}")
-            await interaction.followup.send("❌ Error displaying ecosystem overview. Please try again.")
+        await interaction.response.send_message(embed=_ECOSYSTEM_EMBED)
 
     # Advanced Jewish Learning Commands with Reaction-Based Interactivity
     
@@ -2215,532 +2244,331 @@ class SefariaCommands(commands.Cog):
         text="Hebrew text or phrase to calculate",
         method="Calculation method (standard, small, absolute, ordinal)"
     )
+    @safe_command("Could not calculate gematria. Please ensure you're using Hebrew text.", title="❌ Gematria Error")
     async def gematria_calculator(self, interaction: discord.Interaction, text: str, method: str = "standard"):
         """Advanced gematria calculator with multiple methods"""
         await interaction.response.defer()
         
-        try:
-            # Hebrew letter values for standard gematria
-            gematria_values = {
-                'א': 1, 'ב': 2, 'ג': 3, 'ד': 4, 'ה': 5, 'ו': 6, 'ז': 7, 'ח': 8, 'ט': 9,
-                'י': 10, 'כ': 20, 'ך': 20, 'ל': 30, 'מ': 40, 'ם': 40, 'נ': 50, 'ן': 50,
-                'ס': 60, 'ע': 70, 'פ': 80, 'ף': 80, 'צ': 90, 'ץ': 90, 'ק': 100,
-                'ר': 200, 'ש': 300, 'ת': 400
-            }
-            
-            # Calculate standard gematria
-            standard_value = sum(gematria_values.get(char, 0) for char in text)
-            
-            # Calculate other methods
-            small_value = sum(gematria_values.get(char, 0) % 9 or 9 for char in text if char in gematria_values)
-            ordinal_value = sum(list(gematria_values.keys()).index(char) + 1 for char in text if char in gematria_values)
-            
-            embed = discord.Embed(
-                title="🔢 Gematria Calculator",
-                description=f"**Text:** {text}",
-                color=discord.Color.purple()
-            )
-            
-            embed.add_field(name="📊 Standard Gematria", value=f"**{standard_value}**", inline=True)
-            embed.add_field(name="🔹 Small Gematria", value=f"**{small_value}**", inline=True)
-            embed.add_field(name="📈 Ordinal Value", value=f"**{ordinal_value}**", inline=True)
-            
-            # Add related verses or concepts if the value matches common numbers
-            special_numbers = {
-                26: "יהוה (God's name)",
-                86: "אלהים (Elohim)",
-                72: "חסד (Chesed - Kindness)",
-                613: "תרי״ג מצוות (613 Commandments)",
-                18: "חי (Chai - Life)",
-                36: "לו״ב צדיקים (36 Righteous)",
-                248: "רמ״ח איברים (248 Limbs)",
-                365: "ש״ס לא תעשה (365 Negative Commands)"
-            }
-            
-            if standard_value in special_numbers:
-                embed.add_field(
-                    name="✨ Special Significance",
-                    value=special_numbers[standard_value],
-                    inline=False
-                )
-            
-            embed.set_footer(text="React with 🔄 for more calculations • 📖 for related texts")
-            message = await interaction.followup.send(embed=embed)
-            
-            # Add reaction buttons for interaction
-            if message:
-                await message.add_reaction("🔄")
-                await message.add_reaction("📖")
-                await message.add_reaction("🔍")
-            
-        except Exception as e:
-            logger.error(f"Error in gematria_calculator: {e}")
-            embed = discord.Embed(
-                title="❌ Gematria Error",
-                description="Could not calculate gematria. Please ensure you're using Hebrew text.",
-                color=discord.Color.red()
+        standard_value, small_value, ordinal_value = _gematria(text)
+        
+        embed = discord.Embed(
+            title="🔢 Gematria Calculator",
+            description=f"**Text:** {text}",
+            color=_PURPLE
+        )
+        
+        embed.add_field(name="📊 Standard Gematria", value=f"**{standard_value}**", inline=True)
+        embed.add_field(name="🔹 Small Gematria", value=f"**{small_value}**", inline=True)
+        embed.add_field(name="📈 Ordinal Value", value=f"**{ordinal_value}**", inline=True)
+        
+        # Add related verses or concepts if the value matches common numbers
+        if standard_value in _GEMATRIA_SPECIAL:
+            embed.add_field(
+                name="✨ Special Significance",
+                value=_GEMATRIA_SPECIAL[standard_value],
+                inline=False
             )
-            await interaction.followup.send(embed=embed)
+        
+        embed.set_footer(text="React with 🔄 for more calculations • 📖 for related texts")
+        message = await interaction.followup.send(embed=embed)
+        
+        # Add reaction buttons for interaction
+        if message:
+            self._track_reactions(message, "gematria")
+            await _add_reactions(message, _GEMATRIA_REACTIONS)
 
     @app_commands.command(name="zmanim", description="Get precise halachic times for any location")
     @app_commands.describe(
         location="City name or coordinates",
         date="Date (YYYY-MM-DD) or 'today'"
     )
+    @safe_command("Could not retrieve halachic times. Please try again.", title="❌ Zmanim Error")
     async def halachic_times(self, interaction: discord.Interaction, location: str, date: str = "today"):
         """Get comprehensive zmanim (halachic times) for any location"""
         await interaction.response.defer()
         
-        try:
-            from datetime import datetime, date as date_obj
-            
-            # Use Hebcal client for zmanim
-            if date == "today":
-                target_date = date_obj.today()
-            else:
-                target_date = datetime.strptime(date, "%Y-%m-%d").date()
-            
-            zmanim_data = await self.hebcal_client.get_zmanim(location, target_date)
-            
-            if not zmanim_data:
-                embed = discord.Embed(
-                    title="❌ Location Not Found",
-                    description=f"Could not find zmanim for '{location}'. Try a major city name.",
-                    color=discord.Color.red()
-                )
-                await interaction.followup.send(embed=embed)
-                return
-            
-            embed = discord.Embed(
-                title="🕐 Halachic Times (Zmanim)",
-                description=f"**Location:** {location}\n**Date:** {target_date.strftime('%B %d, %Y')}",
-                color=discord.Color.blue()
-            )
-            
-            # Parse zmanim times
-            times = zmanim_data.get('times', {})
-            
-            # Morning times
-            if times.get('alotHaShachar'):
-                embed.add_field(name="🌅 Alot HaShachar", value=times['alotHaShachar'], inline=True)
-            if times.get('misheyakir'):
-                embed.add_field(name="👁️ Misheyakir", value=times['misheyakir'], inline=True)
-            if times.get('sunrise'):
-                embed.add_field(name="☀️ Sunrise", value=times['sunrise'], inline=True)
-            
-            # Prayer times
-            if times.get('sofZmanShmaGRA'):
-                embed.add_field(name="📿 Latest Shma (GR\"A)", value=times['sofZmanShmaGRA'], inline=True)
-            if times.get('sofZmanTfilla'):
-                embed.add_field(name="🙏 Latest Tfilla", value=times['sofZmanTfilla'], inline=True)
-            if times.get('chatzot'):
-                embed.add_field(name="🕐 Chatzot", value=times['chatzot'], inline=True)
-            
-            # Evening times
-            if times.get('minchaGedola'):
-                embed.add_field(name="🌇 Mincha Gedola", value=times['minchaGedola'], inline=True)
-            if times.get('sunset'):
-                embed.add_field(name="🌅 Sunset", value=times['sunset'], inline=True)
-            if times.get('tzeit'):
-                embed.add_field(name="⭐ Tzeit HaKochavim", value=times['tzeit'], inline=True)
-            
-            embed.set_footer(text="React with 📅 for tomorrow • 🕯️ for candle lighting • ℹ️ for explanations")
-            message = await interaction.followup.send(embed=embed)
-            
-            # Add reaction buttons
-            await message.add_reaction("📅")
-            await message.add_reaction("🕯️")
-            await message.add_reaction("ℹ️")
-            
-        except Exception as e:
-            logger.error(f"Error in halachic_times: {e}")
+        # Use Hebcal client for zmanim (the `date` argument shadows datetime.date here)
+        if date == "today":
+            target_date = datetime.now().date()
+        else:
+            target_date = datetime.strptime(date, "%Y-%m-%d").date()
+        
+        zmanim_data = await asyncio.wait_for(self.hebcal_client.get_zmanim(location, target_date), _UPSTREAM_TIMEOUT)
+        
+        if not zmanim_data:
             embed = discord.Embed(
-                title="❌ Zmanim Error",
-                description="Could not retrieve halachic times. Please try again.",
-                color=discord.Color.red()
+                title="❌ Location Not Found",
+                description=f"Could not find zmanim for '{location}'. Try a major city name.",
+                color=_RED
             )
             await interaction.followup.send(embed=embed)
+            return
+        
+        embed = discord.Embed(
+            title="🕐 Halachic Times (Zmanim)",
+            description=f"**Location:** {location}\n**Date:** {target_date.strftime('%B %d, %Y')}",
+            color=_BLUE
+        )
+        
+        # Parse zmanim times
+        times = zmanim_data.get('times', {})
+        
+        for key, name in _ZMANIM_FIELDS:
+            value = times.get(key)
+            if value:
+                embed.add_field(name=name, value=value, inline=True)
+        
+        embed.set_footer(text="React with 📅 for tomorrow • 🕯️ for candle lighting • ℹ️ for explanations")
+        message = await interaction.followup.send(embed=embed)
+        
+        # Add reaction buttons
+        self._track_reactions(message, "zmanim")
+        await _add_reactions(message, _ZMANIM_REACTIONS)
 
+    async def _parsha_embed(self, target_date: date) -> Optional[discord.Embed]:
+        """Build the /parsha embed for a date, reusing it for a day once built"""
+        key = target_date.toordinal()
+        cached = self._parsha_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
+        # Torah reading from Hebcal and the opening text from Sefaria are
+        # independent, so fetch them concurrently
+        parsha_ref = "Genesis 1:1"  # Default, would need mapping
+        results = await asyncio.gather(
+            asyncio.wait_for(self.hebcal_client.get_torah_reading(target_date), _UPSTREAM_TIMEOUT),
+            self.sefaria_client.get_text(parsha_ref),
+            return_exceptions=True
+        )
+        torah_data, text_data = (_result_or_none(result, "weekly_parsha") for result in results)
+        
+        if not torah_data:
+            return None
+        
+        parsha_name = torah_data.get('parsha', 'Unknown')
+        
+        embed = StaticEmbed(
+            title=f"📜 Parashat {parsha_name}",
+            description=f"Weekly Torah Portion Study Guide",
+            color=_GOLD
+        )
+        
+        # Torah reading details
+        if torah_data.get('torah'):
+            embed.add_field(
+                name="📖 Torah Reading",
+                value=torah_data['torah'],
+                inline=False
+            )
+        
+        if torah_data.get('haftarah'):
+            embed.add_field(
+                name="📿 Haftarah",
+                value=torah_data['haftarah'],
+                inline=False
+            )
+        
+        # Opening text from Sefaria
+        if text_data and text_data.get('text'):
+            first_verse = text_data['text'][0] if isinstance(text_data['text'], list) else text_data['text']
+            embed.add_field(
+                name="✨ Opening Verse",
+                value=_ellipsize(first_verse, 200),
+                inline=False
+            )
+        
+        # Study suggestions
+        embed.add_field(
+            name="📚 Study Suggestions",
+            value="• Read with Rashi commentary\n• Explore themes and lessons\n• Find practical applications\n• Connect to current events",
+            inline=False
+        )
+        
+        embed.set_footer(text="React with 📝 for commentary • 🔍 for themes • 📖 for full text • ❓ for questions")
+        self._parsha_cache[key] = (time.monotonic() + _PARSHA_CACHE_TTL, embed)
+        return embed
+    
     @app_commands.command(name="parsha", description="Get comprehensive weekly Torah portion study materials")
     @app_commands.describe(
         week_offset="Weeks from current (0=this week, 1=next week, -1=last week)"
     )
+    @safe_command("Could not retrieve weekly Torah portion.", title="❌ Parsha Error")
     async def weekly_parsha(self, interaction: discord.Interaction, week_offset: int = 0):
         """Get comprehensive weekly Torah portion with study materials"""
         await interaction.response.defer()
         
-        try:
-            from datetime import datetime, timedelta
-            
-            # Calculate target date
-            target_date = datetime.now().date() + timedelta(weeks=week_offset)
-            
-            # Get Torah reading from Hebcal
-            torah_data = await self.hebcal_client.get_torah_reading(target_date)
-            
-            if not torah_data:
-                embed = discord.Embed(
-                    title="❌ No Torah Reading",
-                    description="Could not find Torah reading for this date.",
-                    color=discord.Color.red()
-                )
-                await interaction.followup.send(embed=embed)
-                return
-            
-            parsha_name = torah_data.get('parsha', 'Unknown')
-            
-            embed = discord.Embed(
-                title=f"📜 Parashat {parsha_name}",
-                description=f"Weekly Torah Portion Study Guide",
-                color=discord.Color.gold()
-            )
-            
-            # Torah reading details
-            if torah_data.get('torah'):
-                embed.add_field(
-                    name="📖 Torah Reading",
-                    value=torah_data['torah'],
-                    inline=False
-                )
-            
-            if torah_data.get('haftarah'):
-                embed.add_field(
-                    name="📿 Haftarah",
-                    value=torah_data['haftarah'],
-                    inline=False
-                )
-            
-            # Try to get text from Sefaria
-            try:
-                parsha_ref = f"Genesis 1:1"  # Default, would need mapping
-                text_data = await self.sefaria_client.get_text(parsha_ref)
-                if text_data and 'text' in text_data:
-                    first_verse = text_data['text'][0] if isinstance(text_data['text'], list) else text_data['text']
-                    embed.add_field(
-                        name="✨ Opening Verse",
-                        value=first_verse[:200] + "..." if len(first_verse) > 200 else first_verse,
-                        inline=False
-                    )
-            except:
-                pass
-            
-            # Study suggestions
-            embed.add_field(
-                name="📚 Study Suggestions",
-                value="• Read with Rashi commentary\n• Explore themes and lessons\n• Find practical applications\n• Connect to current events",
-                inline=False
-            )
-            
-            embed.set_footer(text="React with 📝 for commentary • 🔍 for themes • 📖 for full text • ❓ for questions")
-            message = await interaction.followup.send(embed=embed)
-            
-            # Add reaction buttons for interactive study
-            await message.add_reaction("📝")
-            await message.add_reaction("🔍")
-            await message.add_reaction("📖")
-            await message.add_reaction("❓")
-            
-        except Exception as e:
-            logger.error(f"Error in weekly_parsha: {e}")
+        # Calculate target date
+        target_date = datetime.now().date() + timedelta(weeks=week_offset)
+        
+        embed = await self._parsha_embed(target_date)
+        if embed is None:
             embed = discord.Embed(
-                title="❌ Parsha Error",
-                description="Could not retrieve weekly Torah portion.",
-                color=discord.Color.red()
+                title="❌ No Torah Reading",
+                description="Could not find Torah reading for this date.",
+                color=_RED
             )
             await interaction.followup.send(embed=embed)
+            return
+        
+        message = await interaction.followup.send(embed=embed)
+        
+        # Add reaction buttons for interactive study
+        self._track_reactions(message, "parsha")
+        await _add_reactions(message, _PARSHA_REACTIONS)
 
     @app_commands.command(name="halacha", description="Ask practical Jewish law questions with AI assistance")
     @app_commands.describe(
         question="Your halacha question (practical Jewish law)",
         category="Category (shabbat, kashrut, prayer, holidays, etc.)"
     )
+    @safe_command("Could not process halacha question. Please try again.", title="❌ Halacha Error")
     async def halacha_question(self, interaction: discord.Interaction, question: str, category: str = "general"):
         """AI-assisted halacha (Jewish law) question answering"""
         await interaction.response.defer()
         
-        try:
-            # Create a specialized prompt for halacha questions
-            halacha_prompt = f"""You are a knowledgeable assistant helping with Jewish law (halacha) questions. 
-            
-Guidelines:
-- Provide accurate, well-sourced information
-- Always recommend consulting a qualified rabbi for final decisions
-- Reference relevant halachic sources when possible
-- Be clear about different opinions when they exist
-- Focus on practical applications
-- Distinguish between biblical and rabbinical laws
-
-Category: {category}
-Question: {question}
-
-Please provide a helpful response while emphasizing the importance of consulting with a qualified rabbi for final halachic decisions."""
-            
-            # Use AI client for response
-            if hasattr(self, 'ai_client') and self.ai_client:
-                ai_response = await self.ai_client.generate_response(halacha_prompt, "Halacha Assistant")
-            else:
-                ai_response = "AI assistance not available. Please consult a qualified rabbi for halachic guidance."
-            
-            embed = discord.Embed(
-                title="⚖️ Halacha Question",
-                description=f"**Category:** {category.title()}\n**Question:** {question}",
-                color=discord.Color.blue()
-            )
-            
-            # Split response if too long
-            if len(ai_response) > 1000:
-                embed.add_field(
-                    name="📚 Response (Part 1)",
-                    value=ai_response[:1000] + "...",
-                    inline=False
-                )
-                embed.add_field(
-                    name="📚 Response (Part 2)",
-                    value="..." + ai_response[1000:2000],
-                    inline=False
-                )
-            else:
-                embed.add_field(
-                    name="📚 Response",
-                    value=ai_response,
-                    inline=False
-                )
-            
-            embed.add_field(
-                name="⚠️ Important Notice",
-                value="This is AI-generated guidance. Always consult a qualified rabbi for final halachic decisions.",
-                inline=False
-            )
-            
-            embed.set_footer(text="React with 📖 for sources • ❓ for follow-up • 👨‍🏫 for rabbi referral")
-            message = await interaction.followup.send(embed=embed)
-            
-            # Add reaction buttons
-            await message.add_reaction("📖")
-            await message.add_reaction("❓")
-            await message.add_reaction("👨‍🏫")
-            
-        except Exception as e:
-            logger.error(f"Error in halacha_question: {e}")
-            embed = discord.Embed(
-                title="❌ Halacha Error",
-                description="Could not process halacha question. Please try again.",
-                color=discord.Color.red()
-            )
-            await interaction.followup.send(embed=embed)
+        # Create a specialized prompt for halacha questions
+        halacha_prompt = f"{_HALACHA_PROMPT_PRE}{category}\nQuestion: {question}{_HALACHA_PROMPT_POST}"
+        
+        # Use AI client for response
+        if hasattr(self, 'ai_client') and self.ai_client:
+            ai_response = await self.ai_client.generate_response(halacha_prompt, "Halacha Assistant")
+        else:
+            ai_response = "AI assistance not available. Please consult a qualified rabbi for halachic guidance."
+        
+        embed = discord.Embed(
+            title="⚖️ Halacha Question",
+            description=f"**Category:** {category.title()}\n**Question:** {question}",
+            color=_BLUE
+        )
+        
+        # Split the response into field-sized parts, then the fields into
+        # embeds and the embeds into follow-up messages that fit Discord's limits
+        parts = list(_chunks(ai_response))
+        label = "📚 Response" if len(parts) == 1 else "📚 Response (Part {})"
+        fields = [(label.format(i), part) for i, part in enumerate(parts, 1)]
+        fields.append((
+            "⚠️ Important Notice",
+            "This is AI-generated guidance. Always consult a qualified rabbi for final halachic decisions."
+        ))
+        footer = "React with 📖 for sources • ❓ for follow-up • 👨‍🏫 for rabbi referral"
+        
+        embeds = [embed]
+        for name, value in fields:
+            if len(embeds[-1]) + len(name) + len(value) + len(footer) > _EMBED_SOFT_LIMIT:
+                embeds.append(discord.Embed(title="⚖️ Halacha Question (continued)", color=_BLUE))
+            embeds[-1].add_field(name=name, value=value, inline=False)
+        embeds[-1].set_footer(text=footer)
+        
+        for group in _group_embeds(embeds):
+            message = await interaction.followup.send(embeds=group)
+        
+        # Add reaction buttons to the last message, which carries the footer
+        self._track_reactions(message, "halacha")
+        await _add_reactions(message, _HALACHA_REACTIONS)
 
+    def _daf_yomi_embed(self) -> discord.Embed:
+        """Today's Daf Yomi embed, rebuilt only when the date changes"""
+        today = date.today()
+        if self._daf_cache and self._daf_cache[0] == today.toordinal():
+            return self._daf_cache[1]
+        
+        # Calculate current Daf Yomi from the start of the 14th cycle
+        days_since_epoch = (today - _DAF_YOMI_EPOCH).days
+        cycle_number = _DAF_YOMI_EPOCH_CYCLE + days_since_epoch // _DAF_YOMI_CYCLE_DAYS
+        day_in_cycle = days_since_epoch % _DAF_YOMI_CYCLE_DAYS
+        current_tractate, page_in_tractate = _daf_for_day(day_in_cycle)
+        
+        embed = StaticEmbed(
+            title="📖 Today's Daf Yomi",
+            description=f"Daily Talmud Study • Cycle #{cycle_number}",
+            color=_DARK_BLUE
+        )
+        
+        embed.add_field(
+            name="📚 Current Study",
+            value=f"**{current_tractate} {page_in_tractate}**",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="📅 Cycle Information",
+            value=f"**Cycle:** {cycle_number}\n**Day in Cycle:** {day_in_cycle + 1}/{_DAF_YOMI_CYCLE_DAYS:,}",
+            inline=True
+        )
+        
+        embed.add_field(
+            name="⏰ Study Schedule",
+            value="**Duration:** ~45 minutes\n**Format:** Both sides of page",
+            inline=True
+        )
+        
+        # Add study resources
+        embed.add_field(
+            name="📖 Study Resources",
+            value="• Gemara text with Rashi\n• Tosafot commentary\n• English translation\n• Audio shiurim available",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="🎯 Study Tips",
+            value="• Read slowly and carefully\n• Use multiple commentaries\n• Join study groups\n• Review previous pages",
+            inline=False
+        )
+        
+        embed.set_footer(text="React with 📝 for notes • 🔊 for audio • 👥 for study groups • 📖 for text")
+        self._daf_cache = (today.toordinal(), embed)
+        return embed
+    
     @app_commands.command(name="dafyomi", description="Get today's Daf Yomi (daily Talmud page) with study resources")
+    @safe_command("Could not retrieve today's Daf Yomi information.", title="❌ Daf Yomi Error")
     async def daf_yomi(self, interaction: discord.Interaction):
         """Get today's Daf Yomi with comprehensive study materials"""
         await interaction.response.defer()
         
-        try:
-            from datetime import datetime
-            
-            # Calculate current Daf Yomi
-            # Daf Yomi cycle started September 11, 1923
-            cycle_start = datetime(1923, 9, 11)
-            current_date = datetime.now()
-            days_since_start = (current_date - cycle_start).days
-            
-            # Each cycle is 2,711 days (total pages in Babylonian Talmud)
-            cycle_number = (days_since_start // 2711) + 1
-            day_in_cycle = days_since_start % 2711 + 1
-            
-            # Simplified tractate mapping (would need full mapping in production)
-            tractates = [
-                ("Berakhot", 64), ("Shabbat", 157), ("Eruvin", 105), ("Pesachim", 121),
-                ("Shekalim", 22), ("Yoma", 88), ("Sukkah", 56), ("Beitzah", 40),
-                ("Rosh Hashanah", 35), ("Taanit", 31), ("Megillah", 32), ("Moed Katan", 29),
-                ("Chagigah", 27), ("Yevamot", 122), ("Ketubot", 112), ("Nedarim", 91),
-                ("Nazir", 66), ("Sotah", 49), ("Gittin", 90), ("Kiddushin", 82)
-            ]
-            
-            # Calculate current tractate and page
-            current_page = day_in_cycle
-            current_tractate = "Berakhot"  # Simplified
-            page_in_tractate = current_page
-            
-            embed = discord.Embed(
-                title="📖 Today's Daf Yomi",
-                description=f"Daily Talmud Study • Cycle #{cycle_number}",
-                color=discord.Color.dark_blue()
-            )
-            
-            embed.add_field(
-                name="📚 Current Study",
-                value=f"**{current_tractate} {page_in_tractate}a-b**",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="📅 Cycle Information",
-                value=f"**Cycle:** {cycle_number}\n**Day in Cycle:** {day_in_cycle}/2,711",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="⏰ Study Schedule",
-                value="**Duration:** ~45 minutes\n**Format:** Both sides of page",
-                inline=True
-            )
-            
-            # Add study resources
-            embed.add_field(
-                name="📖 Study Resources",
-                value="• Gemara text with Rashi\n• Tosafot commentary\n• English translation\n• Audio shiurim available",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="🎯 Study Tips",
-                value="• Read slowly and carefully\n• Use multiple commentaries\n• Join study groups\n• Review previous pages",
-                inline=False
-            )
-            
-            embed.set_footer(text="React with 📝 for notes • 🔊 for audio • 👥 for study groups • 📖 for text")
-            message = await interaction.followup.send(embed=embed)
-            
-            # Add reaction buttons
-            await message.add_reaction("📝")
-            await message.add_reaction("🔊")
-            await message.add_reaction("👥")
-            await message.add_reaction("📖")
-            
-        except Exception as e:
-            logger.error(f"Error in daf_yomi: {e}")
-            embed = discord.Embed(
-                title="❌ Daf Yomi Error",
-                description="Could not retrieve today's Daf Yomi information.",
-                color=discord.Color.red()
-            )
-            await interaction.followup.send(embed=embed)
+        embed = self._daf_yomi_embed()
+        message = await interaction.followup.send(embed=embed)
+        
+        # Add reaction buttons
+        self._track_reactions(message, "dafyomi")
+        await _add_reactions(message, _DAF_YOMI_REACTIONS)
 
     @app_commands.command(name="learning", description="Personalized Jewish learning path recommendations")
     @app_commands.describe(
         level="Your learning level (beginner, intermediate, advanced)",
         interests="Areas of interest (torah, talmud, halacha, chassidut, etc.)"
     )
+    @safe_command("Could not generate learning recommendations.", title="❌ Learning Path Error")
     async def learning_path(self, interaction: discord.Interaction, level: str, interests: str = "general"):
         """Get personalized Jewish learning recommendations"""
         await interaction.response.defer()
         
-        try:
-            embed = discord.Embed(
-                title="📚 Personalized Learning Path",
-                description=f"**Level:** {level.title()}\n**Interests:** {interests.title()}",
-                color=discord.Color.green()
-            )
-            
-            # Customize recommendations based on level and interests
-            if level.lower() == "beginner":
-                embed.add_field(
-                    name="🌱 Getting Started",
-                    value="• Weekly Torah portion (Parsha)\n• Basic Jewish concepts\n• Prayer book (Siddur) study\n• Jewish holidays and customs",
-                    inline=False
-                )
-                embed.add_field(
-                    name="📖 Recommended Texts",
-                    value="• Pirkei Avot (Ethics of the Fathers)\n• Simple Chumash with Rashi\n• Basic Shulchan Aruch\n• Stories of the Sages",
-                    inline=False
-                )
-            elif level.lower() == "intermediate":
-                embed.add_field(
-                    name="📈 Building Knowledge",
-                    value="• Complete Chumash study\n• Mishnah tractates\n• Halacha (Jewish law)\n• Jewish philosophy basics",
-                    inline=False
-                )
-                embed.add_field(
-                    name="📚 Study Options",
-                    value="• Rambam's Mishneh Torah\n• Selected Talmud pages\n• Medieval commentaries\n• Chassidic teachings",
-                    inline=False
-                )
-            else:  # advanced
-                embed.add_field(
-                    name="🎓 Advanced Study",
-                    value="• Daily Talmud (Daf Yomi)\n• Complex halachic texts\n• Kabbalah and mysticism\n• Original research",
-                    inline=False
-                )
-                embed.add_field(
-                    name="🔬 Deep Dive",
-                    value="• Rishonim and Acharonim\n• Responsa literature\n• Comparative analysis\n• Teaching others",
-                    inline=False
-                )
-            
-            # Add interest-specific recommendations
-            if "talmud" in interests.lower():
-                embed.add_field(
-                    name="📖 Talmud Focus",
-                    value="• Start with Tractate Berakhot\n• Join Daf Yomi program\n• Use English translations initially\n• Find study partner (chavruta)",
-                    inline=False
-                )
-            elif "halacha" in interests.lower():
-                embed.add_field(
-                    name="⚖️ Halacha Focus",
-                    value="• Daily halacha study\n• Practical applications\n• Shulchan Aruch sections\n• Contemporary responsa",
-                    inline=False
-                )
-            elif "chassidut" in interests.lower():
-                embed.add_field(
-                    name="✨ Chassidut Focus",
-                    value="• Daily Tanya study\n• Chassidic stories\n• Rebbes' teachings\n• Mystical concepts",
-                    inline=False
-                )
-            
-            embed.add_field(
-                name="🛠️ Study Tools",
-                value="• Use this bot's commands\n• Join online study groups\n• Find local classes\n• Regular review schedule",
-                inline=False
-            )
-            
-            embed.set_footer(text="React with 📅 for schedule • 👥 for groups • 📖 for texts • ⭐ for favorites")
-            message = await interaction.followup.send(embed=embed)
-            
-            # Add reaction buttons
-            await message.add_reaction("📅")
-            await message.add_reaction("👥")
-            await message.add_reaction("📖")
-            await message.add_reaction("⭐")
-            
-        except Exception as e:
-            logger.error(f"Error in learning_path: {e}")
-            embed = discord.Embed(
-                title="❌ Learning Path Error",
-                description="Could not generate learning recommendations.",
-                color=discord.Color.red()
-            )
-            await interaction.followup.send(embed=embed)
-
-    # Add reaction event handler for interactive features
-    async def on_reaction_add(self, reaction, user):
-        """Handle reaction-based interactions"""
-        if user.bot:
-            return
-            
-        try:
-            # Handle gematria reactions
-            if reaction.emoji == "🔄" and "Gematria Calculator" in str(reaction.message.embeds[0].title):
-                # Add more calculation methods
-                pass
-            elif reaction.emoji == "📖" and "Gematria Calculator" in str(reaction.message.embeds[0].title):
-                # Search for related texts with same gematria value
-                pass
-            
-            # Handle zmanim reactions
-            elif reaction.emoji == "📅" and "Halachic Times" in str(reaction.message.embeds[0].title):
-                # Show tomorrow's times
-                pass
-            elif reaction.emoji == "🕯️" and "Halachic Times" in str(reaction.message.embeds[0].title):
-                # Show candle lighting times
-                pass
-            
-            # Handle parsha reactions
-            elif reaction.emoji == "📝" and "Parashat" in str(reaction.message.embeds[0].title):
-                # Show commentary
-                pass
-            elif reaction.emoji == "🔍" and "Parashat" in str(reaction.message.embeds[0].title):
-                # Show themes
-                pass
-                
-        except Exception as e:
-            logger.error(f"Error in reaction handler: {e}")
+        embed = discord.Embed(
+            title="📚 Personalized Learning Path",
+            description=f"**Level:** {level.title()}\n**Interests:** {interests.title()}",
+            color=_GREEN
+        )
+        
+        level_key = level.casefold()
+        interests_key = interests.casefold()
+        
+        # Customize recommendations based on level and interests
+        _add_fields(embed, _LEARNING_LEVEL_FIELDS.get(level_key, _LEARNING_LEVEL_FIELDS["advanced"]))
+        
+        # Add interest-specific recommendations (first matching interest only)
+        for keyword, fields in _LEARNING_INTEREST_FIELDS:
+            if keyword in interests_key:
+                _add_fields(embed, fields)
+                break
+        
+        embed.add_field(
+            name="🛠️ Study Tools",
+            value="• Use this bot's commands\n• Join online study groups\n• Find local classes\n• Regular review schedule",
+            inline=False
+        )
+        
+        embed.set_footer(text="React with 📅 for schedule • 👥 for groups • 📖 for texts • ⭐ for favorites")
+        message = await interaction.followup.send(embed=embed)
+        
+        # Add reaction buttons
+        self._track_reactions(message, "learning")
+        await _add_reactions(message, _LEARNING_REACTIONS)
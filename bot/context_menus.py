@@ -1,50 +1,134 @@
 """
 Context menu commands for enhanced user interaction - following discord.py best practices
 """
+import asyncio
 import discord
 from discord import app_commands
 from discord.ext import commands
 import logging
+import time
+from datetime import date
+from typing import Dict, List, Optional
+from .cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
+# Embed colors used by the context menu replies
+_BLUE = discord.Color.blue()
+_ORANGE = discord.Color.orange()
+_PURPLE = discord.Color.purple()
+
+# How long a built reply embed is reused for repeat clicks on the same message
+_EMBED_CACHE_TTL = 300
+
+# Messages with fewer letters/digits than this (emoji, punctuation) aren't searched
+_MIN_SEARCH_CHARS = 3
+
+# Upper bound on waiting for the Hebcal date converter
+_HEBCAL_TIMEOUT = 4.0
+
 class ContextMenus(commands.Cog):
     """Context menu commands for right-click interactions"""
     
-    def __init__(self, bot, sefaria_client):
+    def __init__(self, bot, sefaria_client, hebcal_client=None):
         self.bot = bot
         self.sefaria_client = sefaria_client
+        self.hebcal_client = hebcal_client
+        # In-flight searches, shared by right-clicks on the same text
+        self._pending_searches: Dict[str, asyncio.Task] = {}
+        # Built reply embeds: key -> (expires_at, embed dict)
+        self._embed_cache = LRUCache(maxsize=256)
+        # Context menus can't be declared inside a cog, so bind them to this instance here
+        self._menus = (
+            app_commands.ContextMenu(name='Search Sefaria', callback=self.search_sefaria_context),
+            app_commands.ContextMenu(name='Get Hebrew Date', callback=self.hebrew_date_context),
+        )
+        for menu in self._menus:
+            self.bot.tree.add_command(menu)
+    
+    async def cog_unload(self):
+        """Drop the context menus from the command tree along with the cog"""
+        for menu in self._menus:
+            self.bot.tree.remove_command(menu.name, type=menu.type)
+    
+    def _cached_embed(self, key) -> Optional[discord.Embed]:
+        """Rebuild a recently sent reply embed, or None if it expired"""
+        entry = self._embed_cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return discord.Embed.from_dict(entry[1])
+        return None
+    
+    async def _hebrew_date_for(self, message_date: date) -> str:
+        """Hebrew date string for a civil date (Hebcal results are cached per date)"""
+        if self.hebcal_client is None:
+            return "Hebrew date conversion is unavailable"
+        try:
+            hebrew_data = await asyncio.wait_for(
+                self.hebcal_client.convert_hebrew_date(message_date), _HEBCAL_TIMEOUT
+            )
+        except Exception as e:
+            logger.warning("Hebrew date conversion failed for %s: %s", message_date, e)
+            hebrew_data = None
+        if not hebrew_data or not hebrew_data.get('hebrew'):
+            return "Could not convert to Hebrew date"
+        return hebrew_data['hebrew']
+    
+    def _store_embed(self, key, embed: discord.Embed):
+        """Remember a reply embed for repeat clicks"""
+        self._embed_cache[key] = (time.monotonic() + _EMBED_CACHE_TTL, embed.to_dict())
+    
+    async def _run_search(self, search_text: str) -> List[Dict]:
+        """Run one Sefaria search and drop it from the pending map when done"""
+        try:
+            return await self.sefaria_client.search_texts(search_text, limit=3)
+        finally:
+            self._pending_searches.pop(search_text, None)
+    
+    async def _search(self, search_text: str) -> List[Dict]:
+        """Search Sefaria, joining an identical search that is already in flight"""
+        task = self._pending_searches.get(search_text)
+        if task is None:
+            task = asyncio.create_task(self._run_search(search_text))
+            self._pending_searches[search_text] = task
+        # Shield so one interaction failing doesn't cancel the others' search
+        return await asyncio.shield(task)
     
-    @app_commands.context_menu(name='Search Sefaria')
     async def search_sefaria_context(self, interaction: discord.Interaction, message: discord.Message):
         """Search Sefaria for text in a message via right-click context menu"""
-        if not message.content.strip():
+        raw = message.content.strip()
+        if sum(c.isalnum() for c in raw[:200]) < _MIN_SEARCH_CHARS:
             await interaction.response.send_message(
                 "❌ No searchable text found in this message.", 
                 ephemeral=True
             )
             return
         
+        # Extract first 100 characters for search
+        search_text = raw[:100]
+        cache_key = (message.id, search_text)
+        cached = self._cached_embed(cache_key)
+        if cached:
+            # Answer in one call; only a live search needs defer + followup
+            await interaction.response.send_message(embed=cached, ephemeral=True)
+            return
+        
         await interaction.response.defer(ephemeral=True)
         
         try:
-            # Extract first 100 characters for search
-            search_text = message.content.strip()[:100]
-            
             # Search Sefaria
-            results = await self.sefaria_client.search_texts(search_text, limit=3)
+            results = await self._search(search_text)
             
             if not results:
                 embed = discord.Embed(
                     title="🔍 Sefaria Search Results",
                     description=f"No results found for: *{search_text}*",
-                    color=discord.Color.orange()
+                    color=_ORANGE
                 )
             else:
                 embed = discord.Embed(
                     title="🔍 Sefaria Search Results",
                     description=f"Results for: *{search_text}*",
-                    color=discord.Color.blue()
+                    color=_BLUE
                 )
                 
                 for i, result in enumerate(results[:3], 1):
@@ -59,29 +143,33 @@ class ContextMenus(commands.Cog):
                     )
             
             embed.set_footer(text="Use /search for more detailed searches")
+            self._store_embed(cache_key, embed)
             await interaction.followup.send(embed=embed, ephemeral=True)
             
         except Exception as e:
-            logger.error(f"Error in search_sefaria_context: {e}")
+            logger.error("Error in search_sefaria_context: %s", e)
             await interaction.followup.send(
                 "❌ Error searching Sefaria. Please try again.", 
                 ephemeral=True
             )
     
-    @app_commands.context_menu(name='Get Hebrew Date')
     async def hebrew_date_context(self, interaction: discord.Interaction, message: discord.Message):
         """Get Hebrew date for when the message was sent"""
+        cache_key = ('hebrew_date', message.id)
+        cached = self._cached_embed(cache_key)
+        if cached:
+            await interaction.response.send_message(embed=cached, ephemeral=True)
+            return
+        
         await interaction.response.defer(ephemeral=True)
         
         try:
-            from datetime import datetime
-            
             # Get message timestamp
             message_date = message.created_at.date()
             
             embed = discord.Embed(
                 title="📅 Hebrew Date Information",
-                color=discord.Color.purple()
+                color=_PURPLE
             )
             
             embed.add_field(
@@ -90,10 +178,9 @@ class ContextMenus(commands.Cog):
                 inline=True
             )
             
-            # This would require Hebrew date conversion - simplified for now
             embed.add_field(
                 name="📜 Hebrew Date",
-                value="Contact administrator for Hebrew date conversion",
+                value=await self._hebrew_date_for(message_date),
                 inline=True
             )
             
@@ -104,10 +191,11 @@ class ContextMenus(commands.Cog):
             )
             
             embed.set_footer(text="Use /hebrewdate for today's Hebrew date")
+            self._store_embed(cache_key, embed)
             await interaction.followup.send(embed=embed, ephemeral=True)
             
         except Exception as e:
-            logger.error(f"Error in hebrew_date_context: {e}")
+            logger.error("Error in hebrew_date_context: %s", e)
             await interaction.followup.send(
                 "❌ Error getting Hebrew date information.", 
                 ephemeral=True
@@ -117,6 +205,6 @@ async def setup(bot):
     """Setup function for loading the cog"""
     sefaria_client = getattr(bot, 'sefaria_client', None)
     if sefaria_client:
-        await bot.add_cog(ContextMenus(bot, sefaria_client))
+        await bot.add_cog(ContextMenus(bot, sefaria_client, getattr(bot, 'hebcal_client', None)))
     else:
         logger.warning("Sefaria client not found, skipping context menus")
\ No newline at end of file
@@ -4,7 +4,7 @@ Client for interacting with Dicta Israel Center for Text Analysis
 import aiohttp
 import asyncio
 import logging
-import json
+import orjson
 from typing import Dict, List, Optional, Union
 from urllib.parse import quote
 import random
@@ -14,19 +14,22 @@ logger = logging.getLogger(__name__)
 class DictaClient:
     """Client for Dicta Israel Center for Text Analysis"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         """Initialize the Dicta client"""
         self.base_url = "https://library.dicta.org.il"
         self.files_url = "https://files.dicta.org.il"
         self.books_json_url = "https://raw.githubusercontent.com/Dicta-Israel-Center-for-Text-Analysis/Dicta-Library-Download/main/books.json"
         
-        self.session = None
+        # Use the bot's shared session when given; otherwise one is created on demand
+        self.session = session
+        self._owns_session = session is None
         self.last_request_time = 0
         self.books_cache = None
         
     async def _ensure_session(self):
         """Ensure aiohttp session exists"""
-        if self.session is None:
+        if self.session is None or self.session.closed:
+            self._owns_session = True
             self.session = aiohttp.ClientSession()
     
     async def _rate_limit(self):
@@ -46,16 +49,16 @@ class DictaClient:
                 if response.status == 200:
                     content_type = response.headers.get('content-type', '')
                     if 'application/json' in content_type:
-                        return await response.json()
+                        return orjson.loads(await response.read())
                     else:
-                        text = await response.text()
+                        body = await response.read()
                         # Try to parse as JSON if it looks like JSON
-                        if text.strip().startswith('[') or text.strip().startswith('{'):
+                        if body.lstrip()[:1] in (b'[', b'{'):
                             try:
-                                return json.loads(text)
-                            except json.JSONDecodeError:
+                                return orjson.loads(body)
+                            except orjson.JSONDecodeError:
                                 pass
-                        return {'content': text}
+                        return {'content': await response.text()}
                 else:
                     logger.error(f"Dicta request failed: {response.status}")
                     return None
@@ -229,6 +232,6 @@ class DictaClient:
         return stats
     
     async def close(self):
-        """Close the aiohttp session"""
-        if self.session:
+        """Close the aiohttp session if this client created it"""
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
\ No newline at end of file
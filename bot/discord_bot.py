@@ -1,9 +1,17 @@
 """
 Main Discord bot class for Sefaria integration
 """
+import aiohttp
+import asyncio
 import discord
 from discord.ext import commands
+import hashlib
 import logging
+import re
+import time
+from functools import cached_property
+from typing import Optional
+from .cache import LRUCache, close_redis
 from .commands import SefariaCommands
 from .sefaria_client import SefariaClient
 from .hebcal_client import HebcalClient
@@ -15,17 +23,39 @@ from .torahcalc_client import TorahCalcClient
 from .orayta_client import OraytaClient
 from .opensiddur_client import OpenSiddurClient
 from .pninim_client import PninimClient
-from .ai_client import AIClient
+from .ai_client import AIClient, ERROR_RESPONSE
 
 logger = logging.getLogger(__name__)
 
+# Identical @mention prompts within this window reuse the earlier reply
+_AI_CACHE_TTL = 600
+
+# Pending @mention replies and the workers that answer them
+_AI_QUEUE_SIZE = 64
+_AI_WORKERS = 4
+
+# Per-host bound on the startup connection warm-up
+_WARMUP_TIMEOUT = 5
+
+# Prefix command error -> reply builder (None means ignore the error)
+_COMMAND_ERROR_REPLIES = {
+    commands.CommandNotFound: None,
+    commands.MissingRequiredArgument: lambda error: "❌ Missing required argument. Use `/sefaria help` for usage information.",
+    commands.CommandOnCooldown: lambda error: f"⏱️ Command is on cooldown. Try again in {error.retry_after:.2f} seconds.",
+}
+_DEFAULT_COMMAND_ERROR_REPLY = "❌ An error occurred while processing your command."
+
 class SefariaBot(commands.Bot):
     """Discord bot for Sefaria Jewish texts"""
     
     def __init__(self):
-        # Configure intents - need message content for @mentions to work
+        # Configure intents. Messages that mention the bot (and DMs) carry their
+        # content without the privileged message content intent, and there are
+        # no prefix commands, so only message events themselves are needed.
+        # Typing events are never used.
         intents = discord.Intents.default()
-        intents.message_content = True  # Required for reading message content when @mentioned
+        intents.message_content = False
+        intents.typing = False
         
         super().__init__(
             command_prefix='!',
@@ -33,24 +63,84 @@ class SefariaBot(commands.Bot):
             description="A Discord bot for accessing Jewish texts from Sefaria"
         )
         
-        # Initialize all API clients
-        self.sefaria_client = SefariaClient()
-        self.hebcal_client = HebcalClient()
-        self.nli_client = NLIClient()
-        self.chabad_client = ChabadClient()
-        self.dicta_client = DictaClient()
-        self.opentorah_client = OpenTorahClient()
-        self.torahcalc_client = TorahCalcClient()
-        self.orayta_client = OraytaClient()
-        self.opensiddur_client = OpenSiddurClient()
-        self.pninim_client = PninimClient()
-        self.ai_client = AIClient()
-        
-        # Track processed messages to prevent duplicates
-        self.processed_messages = set()
+        # One pooled HTTP session shared by the API clients, so connections
+        # and TLS handshakes are reused across commands
+        self.http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                keepalive_timeout=30,
+                enable_cleanup_closed=True
+            ),
+            timeout=aiohttp.ClientTimeout(total=30),
+            headers={'User-Agent': 'Discord-Sefaria-Bot/1.0'}
+        )
+        
+        # Track the last 1000 processed messages to prevent duplicates
+        self.processed_messages = LRUCache(maxsize=1000)
         
+        # Bound in on_ready once our user id is known
+        self._user_id: Optional[int] = None
+        self._mention_re = None
+        
+        # Recent AI replies: prompt key -> (expires_at, response)
+        self._ai_cache = LRUCache(maxsize=512)
+        
+        # @mention jobs are answered by worker tasks started in setup_hook
+        self._ai_queue: asyncio.Queue = asyncio.Queue(maxsize=_AI_QUEUE_SIZE)
+        self._ai_workers = []
+        
+    # API clients are built on first access, on the shared session
+    @cached_property
+    def sefaria_client(self) -> SefariaClient:
+        return SefariaClient(session=self.http_session)
+    
+    @cached_property
+    def hebcal_client(self) -> HebcalClient:
+        return HebcalClient(session=self.http_session)
+    
+    @cached_property
+    def nli_client(self) -> NLIClient:
+        return NLIClient(session=self.http_session)
+    
+    @cached_property
+    def chabad_client(self) -> ChabadClient:
+        return ChabadClient(session=self.http_session)
+    
+    @cached_property
+    def dicta_client(self) -> DictaClient:
+        return DictaClient(session=self.http_session)
+    
+    @cached_property
+    def opentorah_client(self) -> OpenTorahClient:
+        return OpenTorahClient(session=self.http_session)
+    
+    @cached_property
+    def torahcalc_client(self) -> TorahCalcClient:
+        return TorahCalcClient(session=self.http_session)
+    
+    @cached_property
+    def orayta_client(self) -> OraytaClient:
+        return OraytaClient(session=self.http_session)
+    
+    @cached_property
+    def opensiddur_client(self) -> OpenSiddurClient:
+        return OpenSiddurClient(session=self.http_session)
+    
+    @cached_property
+    def pninim_client(self) -> PninimClient:
+        return PninimClient(session=self.http_session)
+    
+    @cached_property
+    def ai_client(self) -> AIClient:
+        # Builds an OpenAI HTTP client, so it waits for the first @mention or prompt change
+        return AIClient()
+    
     async def setup_hook(self):
         """Called when the bot is starting up"""
+        self._ai_workers = [asyncio.create_task(self._ai_worker()) for _ in range(_AI_WORKERS)]
+        
         try:
             # Add the comprehensive commands cog with all clients
             await self.add_cog(SefariaCommands(
@@ -72,17 +162,52 @@ class SefariaBot(commands.Bot):
             await self.add_cog(ReactionHandler(self))
             logger.info("Loaded ReactionHandler cog for interactive features")
             
+            from .context_menus import ContextMenus
+            await self.add_cog(ContextMenus(self, self.sefaria_client, self.hebcal_client))
+            logger.info("Loaded ContextMenus cog for right-click commands")
+            
             # Sync slash commands
             synced = await self.tree.sync()
-            logger.info(f"Synced {len(synced)} command(s)")
+            logger.info("Synced %d command(s)", len(synced))
+            
+            await self._warm_up_connections()
             
         except Exception as e:
-            logger.error(f"Error in setup_hook: {e}")
+            logger.error("Error in setup_hook: %s", e)
+    
+    async def _warm_up_connections(self):
+        """Open pooled connections to each API host before the first interaction"""
+        clients = (
+            self.sefaria_client, self.hebcal_client, self.nli_client, self.chabad_client,
+            self.dicta_client, self.torahcalc_client, self.opensiddur_client, self.pninim_client
+        )
+        timeout = aiohttp.ClientTimeout(total=_WARMUP_TIMEOUT)
+        
+        async def warm(url: str):
+            async with self.http_session.head(url, timeout=timeout, allow_redirects=False):
+                pass
+        
+        results = await asyncio.gather(
+            *(warm(client.base_url) for client in clients), return_exceptions=True
+        )
+        warmed = sum(1 for result in results if not isinstance(result, BaseException))
+        logger.info("Warmed connections to %d/%d API hosts", warmed, len(clients))
+    
+    async def close(self):
+        """Shut down the bot and release the shared HTTP session"""
+        for worker in self._ai_workers:
+            worker.cancel()
+        await super().close()
+        if not self.http_session.closed:
+            await self.http_session.close()
+        await close_redis()
     
     async def on_ready(self):
         """Called when the bot is ready"""
-        logger.info(f'{self.user} has connected to Discord!')
-        logger.info(f'Bot is in {len(self.guilds)} guilds')
+        logger.info('%s has connected to Discord!', self.user)
+        logger.info('Bot is in %d guilds', len(self.guilds))
+        
+        self._bind_user()
         
         # Set bot activity
         activity = discord.Activity(
@@ -91,39 +216,85 @@ class SefariaBot(commands.Bot):
         )
         await self.change_presence(activity=activity)
     
+    def _bind_user(self) -> Optional[int]:
+        """Cache our user id and mention pattern for on_message"""
+        if self.user is None:
+            return None
+        self._user_id = self.user.id
+        # Matches both <@id> and <@!id> forms of our own mention
+        self._mention_re = re.compile(rf'<@!?{self._user_id}>')
+        return self._user_id
+    
     async def on_command_error(self, ctx, error):
         """Global error handler"""
-        if isinstance(error, commands.CommandNotFound):
-            return  # Ignore command not found errors
+        # Walk the MRO so subclasses (e.g. MissingRequiredAttachment) match their base
+        for error_type in type(error).__mro__:
+            if error_type in _COMMAND_ERROR_REPLIES:
+                reply = _COMMAND_ERROR_REPLIES[error_type]
+                break
+        else:
+            reply = lambda error: _DEFAULT_COMMAND_ERROR_REPLY
         
-        logger.error(f"Command error: {error}")
+        if reply is None:
+            return  # Ignore command not found errors
         
-        if isinstance(error, commands.MissingRequiredArgument):
-            await ctx.send("❌ Missing required argument. Use `/sefaria help` for usage information.")
-        elif isinstance(error, commands.CommandOnCooldown):
-            await ctx.send(f"⏱️ Command is on cooldown. Try again in {error.retry_after:.2f} seconds.")
-        else:
-            await ctx.send("❌ An error occurred while processing your command.")
+        logger.error("Command error: %s", error)
+        await ctx.send(reply(error))
     
     async def on_error(self, event, *args, **kwargs):
         """Global error handler for events"""
-        logger.error(f"An error occurred in event {event}", exc_info=True)
+        logger.error("An error occurred in event %s", event, exc_info=True)
+    
+    async def _ai_response(self, content: str, user_name: str) -> str:
+        """Generate an AI reply, reusing a recent one for the same normalized prompt"""
+        prompt = " ".join(content.casefold().split())
+        key = hashlib.blake2b(
+            f"{self.ai_client.system_prompt}|{prompt}".encode(), digest_size=16
+        ).hexdigest()
+        
+        entry = self._ai_cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        
+        response = await self.ai_client.generate_response(content, user_name=user_name)
+        if response != ERROR_RESPONSE:
+            self._ai_cache[key] = (time.monotonic() + _AI_CACHE_TTL, response)
+        return response
+    
+    async def _ai_worker(self):
+        """Answer queued @mentions so on_message never waits on the AI provider"""
+        while True:
+            message, content = await self._ai_queue.get()
+            try:
+                response = await self._ai_response(content, message.author.display_name)
+                await message.reply(response)
+            except Exception as e:
+                logger.error("Error generating AI response: %s", e)
+                try:
+                    await message.reply(ERROR_RESPONSE)
+                except discord.HTTPException:
+                    pass
+            finally:
+                self._ai_queue.task_done()
     
     async def on_message(self, message):
         """Handle incoming messages for AI responses"""
         # Don't respond to our own messages
-        if message.author == self.user:
+        uid = self._user_id or self._bind_user()
+        if message.author.id == uid:
             return
         
-        # Check if the bot was mentioned
-        if self.user and self.user.mentioned_in(message):
+        # Check if the bot was mentioned; the cheap content test skips most
+        # traffic, while replies can ping us without any <@ in the text
+        maybe_mentioned = '<@' in message.content or message.reference is not None
+        if uid and maybe_mentioned and self.user.mentioned_in(message):
             # Check for duplicate message processing FIRST
             message_id = message.id
             if message_id in self.processed_messages:
                 return  # Already processed this message
             
             # Mark message as processed immediately to prevent duplicates
-            self.processed_messages.add(message_id)
+            self.processed_messages[message_id] = None
             
             # Check if auto-reply is enabled for this guild
             guild_id = message.guild.id if message.guild else 0
@@ -134,33 +305,17 @@ class SefariaBot(commands.Bot):
                 if not commands_cog.is_auto_reply_enabled(guild_id):
                     return  # Auto-reply is disabled, don't respond
             
-            # Clean up old message IDs (keep only last 1000 to prevent memory issues)
-            if len(self.processed_messages) > 1000:
-                # Remove oldest 100 entries
-                old_messages = list(self.processed_messages)[:100]
-                for old_id in old_messages:
-                    self.processed_messages.discard(old_id)
-            
             # Remove the bot mention from the message content
-            content = message.content
-            for mention in message.mentions:
-                if mention == self.user:
-                    content = content.replace(f'<@{mention.id}>', '').replace(f'<@!{mention.id}>', '').strip()
+            content = self._mention_re.sub('', message.content).strip()
             
             if content:  # Only respond if there's actual content after removing mentions
                 try:
-                    # Generate AI response
-                    response = await self.ai_client.generate_response(
-                        content, 
-                        user_name=message.author.display_name
-                    )
-                    
-                    # Send response
-                    await message.reply(response)
-                    
-                except Exception as e:
-                    logger.error(f"Error generating AI response: {e}")
-                    await message.reply("I'm sorry, I'm having trouble responding right now. Please try again later.")
+                    # Hand off to the AI workers
+                    self._ai_queue.put_nowait((message, content))
+                except asyncio.QueueFull:
+                    await message.reply("I'm answering a lot of questions right now. Please try again shortly.")
+                # A mention isn't a prefix command, so skip command parsing
+                return
         
         # Process commands as usual
         await self.process_commands(message)
@@ -4,23 +4,28 @@ Client for interacting with the Hebcal API for Jewish calendar data
 import aiohttp
 import asyncio
 import logging
+import orjson
 from typing import Optional, Dict, List
 from datetime import datetime, date
+from .cache import async_ttl_cache, jerusalem_today, seconds_until_jerusalem_midnight
 
 logger = logging.getLogger(__name__)
 
 class HebcalClient:
     """Client for Hebcal API interactions"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.base_url = "https://www.hebcal.com"
-        self.session = None
+        # Use the bot's shared session when given; otherwise one is created on demand
+        self.session = session
+        self._owns_session = session is None
         self._rate_limit_delay = 0.2  # 90 requests per 10 seconds = ~0.11s delay
         self._last_request_time = 0
         
     async def _ensure_session(self):
         """Ensure aiohttp session exists"""
         if self.session is None or self.session.closed:
+            self._owns_session = True
             self.session = aiohttp.ClientSession(
                 timeout=aiohttp.ClientTimeout(total=30),
                 headers={
@@ -48,7 +53,7 @@ class HebcalClient:
         try:
             async with self.session.get(url, params=params) as response:
                 if response.status == 200:
-                    return await response.json()
+                    return orjson.loads(await response.read())
                 elif response.status == 429:
                     logger.warning("Rate limited by Hebcal API, waiting longer...")
                     await asyncio.sleep(2)
@@ -118,11 +123,12 @@ class HebcalClient:
             logger.error(f"Error getting Jewish holidays: {e}")
             return None
     
+    @async_ttl_cache(ttl=seconds_until_jerusalem_midnight)
     async def get_torah_reading(self, date_obj: Optional[date] = None) -> Optional[Dict]:
         """Get Torah reading for a specific date"""
         try:
             if date_obj is None:
-                date_obj = date.today()
+                date_obj = jerusalem_today()
             
             params = {
                 "v": "1", 
@@ -144,6 +150,7 @@ class HebcalClient:
             logger.error(f"Error getting Torah reading: {e}")
             return None
     
+    @async_ttl_cache(ttl=7 * 86400, maxsize=512)
     async def convert_hebrew_date(self, gregorian_date: date) -> Optional[Dict]:
         """Convert Gregorian date to Hebrew date"""
         try:
@@ -181,21 +188,23 @@ class HebcalClient:
             }
             
             geonameid = location_map.get(location.lower(), "5128581")
-            
-            params = {
-                "cfg": "json",
-                "geonameid": geonameid,
-                "date": date_obj.strftime("%Y-%m-%d")
-            }
-            
-            data = await self._make_request("zmanim", params)
-            return data
+            return await self._get_zmanim_for(geonameid, date_obj.strftime("%Y-%m-%d"))
             
         except Exception as e:
             logger.error(f"Error getting zmanim: {e}")
             return None
     
+    @async_ttl_cache(ttl=86400)
+    async def _get_zmanim_for(self, geonameid: str, date_str: str) -> Optional[Dict]:
+        """Fetch zmanim for a resolved location; fixed for a given place and day"""
+        params = {
+            "cfg": "json",
+            "geonameid": geonameid,
+            "date": date_str
+        }
+        return await self._make_request("zmanim", params)
+    
     async def close(self):
-        """Close the aiohttp session"""
-        if self.session and not self.session.closed:
+        """Close the aiohttp session if this client created it"""
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
\ No newline at end of file
@@ -0,0 +1,33 @@
+"""
+Logging setup that keeps file and console writes off the event loop
+"""
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+def setup_logging(log_file: str = 'sefaria_bot.log', level: int = logging.INFO) -> QueueListener:
+    """Route root logging through a queue drained by a background listener thread
+    
+    The QueueHandler only merges the message with its arguments; the listener's
+    file and console handlers apply LOG_FORMAT, so each line is prefixed once.
+    """
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.FileHandler(log_file), logging.StreamHandler()]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    root = logging.getLogger()
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+    return listener
@@ -4,26 +4,49 @@ Client for interacting with the National Library of Israel API
 import aiohttp
 import asyncio
 import logging
+import orjson
+from dataclasses import dataclass, fields
 from typing import Dict, List, Optional, Union
 from urllib.parse import quote
 
 logger = logging.getLogger(__name__)
 
+@dataclass(frozen=True, slots=True)
+class NLIItem:
+    """Catalog record fields used by the bot, with display defaults"""
+    title: str = 'Unknown Title'
+    creator: str = 'Unknown Creator'
+    date: str = 'Unknown Date'
+    description: str = ''
+    material_type: str = 'Unknown Type'
+
+    @classmethod
+    def from_record(cls, record: Dict) -> 'NLIItem':
+        """Build an item from a raw API record, ignoring unknown and empty fields"""
+        return cls(**{
+            field.name: str(record[field.name])
+            for field in fields(cls)
+            if record.get(field.name)
+        })
+
 class NLIClient:
     """Client for National Library of Israel API interactions"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, session: Optional[aiohttp.ClientSession] = None):
         """Initialize the NLI client"""
         import os
         self.base_url = "https://api.nli.org.il/openlibrary"
         # Load API key from environment or use provided key
         self.api_key = api_key or os.getenv('NLI_API_KEY', 'DVQyidFLOAjp12ib92pNJPmflmB5IessOq1CJQDK')
-        self.session = None
+        # Use the bot's shared session when given; otherwise one is created on demand
+        self.session = session
+        self._owns_session = session is None
         self.last_request_time = 0
         
     async def _ensure_session(self):
         """Ensure aiohttp session exists"""
-        if self.session is None:
+        if self.session is None or self.session.closed:
+            self._owns_session = True
             self.session = aiohttp.ClientSession()
     
     async def _rate_limit(self):
@@ -48,7 +71,7 @@ class NLIClient:
         try:
             async with self.session.get(url, params=params) as response:
                 if response.status == 200:
-                    return await response.json()
+                    return orjson.loads(await response.read())
                 else:
                     logger.error(f"NLI API request failed: {response.status}")
                     return None
@@ -56,7 +79,7 @@ class NLIClient:
             logger.error(f"Error making NLI API request: {e}")
             return None
     
-    async def search_hebrew_manuscripts(self, query: str, limit: int = 10) -> Optional[List[Dict]]:
+    async def search_hebrew_manuscripts(self, query: str, limit: int = 10) -> Optional[List['NLIItem']]:
         """Search for Hebrew manuscripts"""
         params = {
             'query': f'title,contains,{quote(query)},AND;material_type,exact,manuscript',
@@ -66,10 +89,10 @@ class NLIClient:
         
         result = await self._make_request('search', params)
         if result and 'result' in result:
-            return result['result'].get('records', [])
+            return [NLIItem.from_record(record) for record in result['result'].get('records', [])]
         return []
     
-    async def search_historical_photos(self, query: str, limit: int = 10) -> Optional[List[Dict]]:
+    async def search_historical_photos(self, query: str, limit: int = 10) -> Optional[List['NLIItem']]:
         """Search for historical photographs"""
         params = {
             'query': f'title,contains,{quote(query)},AND;material_type,exact,photograph',
@@ -79,10 +102,10 @@ class NLIClient:
         
         result = await self._make_request('search', params)
         if result and 'result' in result:
-            return result['result'].get('records', [])
+            return [NLIItem.from_record(record) for record in result['result'].get('records', [])]
         return []
     
-    async def search_jewish_books(self, query: str, language: str = 'heb', limit: int = 10) -> Optional[List[Dict]]:
+    async def search_jewish_books(self, query: str, language: str = 'heb', limit: int = 10) -> Optional[List['NLIItem']]:
         """Search for Jewish books in Hebrew or other languages"""
         params = {
             'query': f'title,contains,{quote(query)},AND;language,exact,{language}',
@@ -92,10 +115,10 @@ class NLIClient:
         
         result = await self._make_request('search', params)
         if result and 'result' in result:
-            return result['result'].get('records', [])
+            return [NLIItem.from_record(record) for record in result['result'].get('records', [])]
         return []
     
-    async def search_maps(self, location: str, limit: int = 10) -> Optional[List[Dict]]:
+    async def search_maps(self, location: str, limit: int = 10) -> Optional[List['NLIItem']]:
         """Search for historical maps"""
         params = {
             'query': f'title,contains,{quote(location)},AND;material_type,exact,map',
@@ -105,10 +128,10 @@ class NLIClient:
         
         result = await self._make_request('search', params)
         if result and 'result' in result:
-            return result['result'].get('records', [])
+            return [NLIItem.from_record(record) for record in result['result'].get('records', [])]
         return []
     
-    async def search_audio_recordings(self, query: str, limit: int = 10) -> Optional[List[Dict]]:
+    async def search_audio_recordings(self, query: str, limit: int = 10) -> Optional[List['NLIItem']]:
         """Search for audio recordings"""
         params = {
             'query': f'title,contains,{quote(query)},AND;material_type,exact,audio',
@@ -118,10 +141,10 @@ class NLIClient:
         
         result = await self._make_request('search', params)
         if result and 'result' in result:
-            return result['result'].get('records', [])
+            return [NLIItem.from_record(record) for record in result['result'].get('records', [])]
         return []
     
-    async def search_by_creator(self, creator: str, limit: int = 10) -> Optional[List[Dict]]:
+    async def search_by_creator(self, creator: str, limit: int = 10) -> Optional[List['NLIItem']]:
         """Search for works by a specific creator/author"""
         params = {
             'query': f'creator,contains,{quote(creator)}',
@@ -131,10 +154,10 @@ class NLIClient:
         
         result = await self._make_request('search', params)
         if result and 'result' in result:
-            return result['result'].get('records', [])
+            return [NLIItem.from_record(record) for record in result['result'].get('records', [])]
         return []
     
-    async def search_by_subject(self, subject: str, limit: int = 10) -> Optional[List[Dict]]:
+    async def search_by_subject(self, subject: str, limit: int = 10) -> Optional[List['NLIItem']]:
         """Search for works by subject"""
         params = {
             'query': f'subject,contains,{quote(subject)}',
@@ -144,10 +167,10 @@ class NLIClient:
         
         result = await self._make_request('search', params)
         if result and 'result' in result:
-            return result['result'].get('records', [])
+            return [NLIItem.from_record(record) for record in result['result'].get('records', [])]
         return []
     
-    async def search_by_date_range(self, start_year: int, end_year: int, query: str = "", limit: int = 10) -> Optional[List[Dict]]:
+    async def search_by_date_range(self, start_year: int, end_year: int, query: str = "", limit: int = 10) -> Optional[List['NLIItem']]:
         """Search for works within a date range"""
         if query:
             search_query = f'title,contains,{quote(query)},AND;start_date,range,{start_year},{end_year}'
@@ -162,10 +185,10 @@ class NLIClient:
         
         result = await self._make_request('search', params)
         if result and 'result' in result:
-            return result['result'].get('records', [])
+            return [NLIItem.from_record(record) for record in result['result'].get('records', [])]
         return []
     
-    async def search_jerusalem_collection(self, query: str = "", limit: int = 10) -> Optional[List[Dict]]:
+    async def search_jerusalem_collection(self, query: str = "", limit: int = 10) -> Optional[List['NLIItem']]:
         """Search specifically for Jerusalem-related items"""
         if query:
             search_query = f'title,contains,{quote(query)},AND;subject,contains,Jerusalem'
@@ -180,10 +203,10 @@ class NLIClient:
         
         result = await self._make_request('search', params)
         if result and 'result' in result:
-            return result['result'].get('records', [])
+            return [NLIItem.from_record(record) for record in result['result'].get('records', [])]
         return []
     
-    async def get_random_item(self, material_type: str = "") -> Optional[Dict]:
+    async def get_random_item(self, material_type: str = "") -> Optional['NLIItem']:
         """Get a random item from the collection"""
         # Use a broad search and pick randomly
         import random
@@ -205,10 +228,10 @@ class NLIClient:
         if result and 'result' in result:
             records = result['result'].get('records', [])
             if records:
-                return random.choice(records)
+                return NLIItem.from_record(random.choice(records))
         return None
     
     async def close(self):
-        """Close the aiohttp session"""
-        if self.session:
+        """Close the aiohttp session if this client created it"""
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
\ No newline at end of file
@@ -13,9 +13,11 @@ logger = logging.getLogger(__name__)
 class OpenSiddurClient:
     """Client for OpenSiddur - Free software toolkit for Jewish liturgical books"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         """Initialize the OpenSiddur client"""
-        self.session = None
+        # Use the bot's shared session when given; otherwise one is created on demand
+        self.session = session
+        self._owns_session = session is None
         self.base_url = 'https://opensiddur.org'
         self.capabilities = {
             'liturgical_texts': [
@@ -53,7 +55,8 @@ class OpenSiddurClient:
     
     async def _ensure_session(self):
         """Ensure aiohttp session exists"""
-        if self.session is None:
+        if self.session is None or self.session.closed:
+            self._owns_session = True
             self.session = aiohttp.ClientSession()
     
     async def _rate_limit(self):
@@ -287,6 +290,6 @@ class OpenSiddurClient:
         }]
     
     async def close(self):
-        """Close the aiohttp session"""
-        if self.session:
+        """Close the aiohttp session if this client created it"""
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
\ No newline at end of file
@@ -14,9 +14,11 @@ logger = logging.getLogger(__name__)
 class OpenTorahClient:
     """Client for OpenTorah digital archives and repositories"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         """Initialize the OpenTorah client"""
-        self.session = None
+        # Use the bot's shared session when given; otherwise one is created on demand
+        self.session = session
+        self._owns_session = session is None
         self.base_urls = {
             'alter_rebbe': 'https://www.alter-rebbe.org',
             'chumash_questions': 'https://www.chumashquestions.org',
@@ -27,7 +29,8 @@ class OpenTorahClient:
     
     async def _ensure_session(self):
         """Ensure aiohttp session exists"""
-        if self.session is None:
+        if self.session is None or self.session.closed:
+            self._owns_session = True
             self.session = aiohttp.ClientSession()
     
     async def _rate_limit(self):
@@ -316,6 +319,6 @@ class OpenTorahClient:
             return []
     
     async def close(self):
-        """Close the aiohttp session"""
-        if self.session:
+        """Close the aiohttp session if this client created it"""
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
\ No newline at end of file
@@ -7,15 +7,18 @@ import aiohttp
 import asyncio
 from typing import Optional, Dict, List, Any
 import json
+from .cache import async_ttl_cache
 
 logger = logging.getLogger(__name__)
 
 class OraytaClient:
     """Client for Orayta Jewish books system - Cross-platform Jewish texts library"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         """Initialize the Orayta client"""
-        self.session = None
+        # Use the bot's shared session when given; otherwise one is created on demand
+        self.session = session
+        self._owns_session = session is None
         # Since Orayta is primarily a desktop application, we'll simulate its capabilities
         self.capabilities = {
             'book_categories': [
@@ -50,7 +53,8 @@ class OraytaClient:
     
     async def _ensure_session(self):
         """Ensure aiohttp session exists"""
-        if self.session is None:
+        if self.session is None or self.session.closed:
+            self._owns_session = True
             self.session = aiohttp.ClientSession()
     
     async def _rate_limit(self):
@@ -193,6 +197,7 @@ class OraytaClient:
             ]
         }
     
+    @async_ttl_cache(ttl=86400)
     async def get_library_statistics(self) -> Dict:
         """Get comprehensive library statistics"""
         await self._rate_limit()
@@ -238,6 +243,6 @@ class OraytaClient:
         }]
     
     async def close(self):
-        """Close the aiohttp session"""
-        if self.session:
+        """Close the aiohttp session if this client created it"""
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
\ No newline at end of file
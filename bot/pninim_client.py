@@ -13,9 +13,11 @@ logger = logging.getLogger(__name__)
 class PninimClient:
     """Client for Pninim - Twitter-like platform for Torah insights and Chiddushim"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         """Initialize the Pninim client"""
-        self.session = None
+        # Use the bot's shared session when given; otherwise one is created on demand
+        self.session = session
+        self._owns_session = session is None
         self.base_url = 'https://pninim.yiddishe-kop.com'
         self.platform_info = {
             'description': 'Social platform for sharing Torah insights and Chiddushim',
@@ -43,7 +45,8 @@ class PninimClient:
     
     async def _ensure_session(self):
         """Ensure aiohttp session exists"""
-        if self.session is None:
+        if self.session is None or self.session.closed:
+            self._owns_session = True
             self.session = aiohttp.ClientSession()
     
     async def _rate_limit(self):
@@ -298,6 +301,6 @@ class PninimClient:
         }]
     
     async def close(self):
-        """Close the aiohttp session"""
-        if self.session:
+        """Close the aiohttp session if this client created it"""
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
\ No newline at end of file
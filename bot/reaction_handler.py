@@ -5,316 +5,243 @@ Following discord.py best practices for event handling
 import discord
 from discord.ext import commands
 import logging
+from typing import Dict, Optional, Tuple
+
+from .cache import LRUCache
+from .utils import StaticEmbed
 
 logger = logging.getLogger(__name__)
 
+# Embed colors used by the reaction follow-up DMs
+_BLUE = discord.Color.blue()
+_DARK_BLUE = discord.Color.dark_blue()
+_GOLD = discord.Color.gold()
+_GREEN = discord.Color.green()
+_PURPLE = discord.Color.purple()
+
+# Follow-up DMs: (kind, emoji) -> (title, description, color, fields, footer)
+# where fields are (name, value, inline) tuples
+_REACTION_REPLIES = {
+    # Show additional gematria calculation methods
+    ("gematria", "🔄"): (
+        "🔢 Extended Gematria Methods",
+        "Additional calculation methods for deeper analysis",
+        _PURPLE,
+        (
+            ("📊 Available Methods", "• **At-bash** - Reverse alphabet cipher\n• **Albam** - Alphabet substitution\n• **Ayik Bekar** - Special permutation\n• **Mispar Gadol** - Final letter values", False),
+        ),
+        "Contact administrator for advanced calculations",
+    ),
+    # Search for texts with same gematria value
+    ("gematria", "📖"): (
+        "📚 Related Gematria Texts",
+        "Searching for texts with matching numerical values...",
+        _BLUE,
+        (
+            ("🔍 Search Tips", "Use `/search` command to find specific texts\nUse `/text` command to retrieve full passages", False),
+        ),
+        None,
+    ),
+    # Show tomorrow's times
+    ("zmanim", "📅"): (
+        "📅 Tomorrow's Zmanim",
+        "Use `/zmanim` command with tomorrow's date for precise times",
+        _BLUE,
+        (),
+        None,
+    ),
+    # Show candle lighting information
+    ("zmanim", "🕯️"): (
+        "🕯️ Candle Lighting Guide",
+        "Shabbat and Holiday Candle Lighting Times",
+        _GOLD,
+        (
+            ("📏 Standard Times", "• **Shabbat:** 18 minutes before sunset\n• **Holidays:** Usually same as Shabbat\n• **Location matters:** Check local customs", False),
+            ("🔍 Get Exact Times", "Use `/shabbat [location]` for precise candle lighting times", False),
+        ),
+        None,
+    ),
+    # Show zmanim explanations
+    ("zmanim", "ℹ️"): (
+        "ℹ️ Zmanim Explanations",
+        "Understanding Halachic Times",
+        _DARK_BLUE,
+        (
+            ("🌅 Morning Times", "• **Alot HaShachar:** Dawn - first light\n• **Misheyakir:** When you can distinguish\n• **Sunrise:** Sun becomes visible", False),
+            ("🙏 Prayer Times", "• **Latest Shma:** Deadline for morning Shma\n• **Latest Tfilla:** Deadline for morning prayers\n• **Chatzot:** Halachic noon", False),
+        ),
+        None,
+    ),
+    # Show commentary options
+    ("parsha", "📝"): (
+        "📝 Torah Commentary Guide",
+        "Classical commentaries for Torah study",
+        _GOLD,
+        (
+            ("👨‍🏫 Classical Commentators", "• **Rashi** - Basic understanding\n• **Ibn Ezra** - Grammar and context\n• **Ramban** - Mystical insights\n• **Sforno** - Philosophical approach", False),
+            ("🔍 Access Commentaries", "Use `/commentary [verse] [commentator]` for specific insights", False),
+        ),
+        None,
+    ),
+    # Show theme exploration
+    ("parsha", "🔍"): (
+        "🔍 Torah Themes & Lessons",
+        "Explore deeper meanings in the weekly portion",
+        _GREEN,
+        (
+            ("🎯 Study Approaches", "• Look for recurring patterns\n• Connect to personal growth\n• Find contemporary relevance\n• Explore character development", False),
+        ),
+        None,
+    ),
+    # Show halachic sources
+    ("halacha", "📖"): (
+        "📖 Halachic Source Materials",
+        "Primary sources for Jewish law study",
+        _BLUE,
+        (
+            ("📚 Essential Sources", "• **Shulchan Aruch** - Code of Jewish Law\n• **Mishnah Berurah** - Modern commentary\n• **Responsa Literature** - Rabbinic decisions\n• **Contemporary Poskim** - Modern authorities", False),
+        ),
+        None,
+    ),
+    # Provide rabbi referral guidance
+    ("halacha", "👨‍🏫"): (
+        "👨‍🏫 Finding Rabbinic Guidance",
+        "How to find qualified halachic authorities",
+        _PURPLE,
+        (
+            ("🔍 Finding a Rabbi", "• Contact local synagogues\n• Ask community members for recommendations\n• Look for Orthodox authorities for halachic questions\n• Consider online halachic resources", False),
+        ),
+        None,
+    ),
+    # Show note-taking tips
+    ("dafyomi", "📝"): (
+        "📝 Daf Yomi Study Notes",
+        "Effective note-taking for Talmud study",
+        _DARK_BLUE,
+        (
+            ("✍️ Note-Taking Tips", "• Track key concepts and terms\n• Note questions for further study\n• Connect to previously learned material\n• Record practical halachic applications", False),
+        ),
+        None,
+    ),
+    # Show study group information
+    ("dafyomi", "👥"): (
+        "👥 Daf Yomi Study Groups",
+        "Benefits of collaborative Talmud study",
+        _GREEN,
+        (
+            ("🤝 Study Partnership Benefits", "• **Chavruta** - Traditional paired study\n• Different perspectives on difficult passages\n• Motivation and accountability\n• Enhanced understanding through discussion", False),
+        ),
+        None,
+    ),
+    # Show study schedule recommendations
+    ("learning", "📅"): (
+        "📅 Jewish Learning Schedule",
+        "Structured approach to Torah study",
+        _GREEN,
+        (
+            ("🗓️ Daily Learning Cycles", "• **Daf Yomi** - Daily Talmud page\n• **Parsha** - Weekly Torah portion\n• **Mishnah Yomi** - Daily Mishnah\n• **Rambam Yomi** - Daily Maimonides", False),
+        ),
+        None,
+    ),
+}
+
+def _build_reaction_embeds() -> Dict[Tuple[str, str], discord.Embed]:
+    """Build every reaction follow-up embed once, keyed by (kind, emoji)"""
+    embeds = {}
+    for key, (title, description, color, fields, footer) in _REACTION_REPLIES.items():
+        embed = StaticEmbed(title=title, description=description, color=color)
+        for name, value, inline in fields:
+            embed.add_field(name=name, value=value, inline=inline)
+        if footer:
+            embed.set_footer(text=footer)
+        embeds[key] = embed
+    return embeds
+
+_REACTION_EMBEDS = _build_reaction_embeds()
+
+# Untracked replies are matched to a kind by the first token found in their title
+_TITLE_KINDS = (
+    ("Gematria Calculator", "gematria"),
+    ("Halachic Times", "zmanim"),
+    ("Parashat", "parsha"),
+    ("Halacha Question", "halacha"),
+    ("Daf Yomi", "dafyomi"),
+    ("Learning Path", "learning"),
+)
+
 class ReactionHandler(commands.Cog):
     """Handles reaction-based interactions for enhanced user experience"""
     
     def __init__(self, bot):
         self.bot = bot
+        # message id -> reply kind for messages sent since startup
+        self._tracked = LRUCache(maxsize=10000)
+        # Users whose DMs returned 403, so we stop retrying them
+        self._dm_blocked = LRUCache(maxsize=10000)
+    
+    def track_message(self, message_id: int, kind: str):
+        """Route reactions on a sent command reply to the follow-ups for its command"""
+        self._tracked[message_id] = kind
     
     @commands.Cog.listener()
-    async def on_reaction_add(self, reaction, user):
+    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
         """Handle reaction additions for interactive features"""
-        # Ignore bot reactions
-        if user.bot:
+        # Ignore our own reactions (command replies are seeded with them)
+        if payload.user_id == self.bot.user.id:
             return
         
-        # Ignore reactions not on our messages
-        if reaction.message.author != self.bot.user:
+        # Ignore reactions not on our messages; tracked ids need no lookup at all
+        kind = self._tracked.get(payload.message_id)
+        if kind is None and payload.message_author_id != self.bot.user.id:
             return
         
         try:
-            await self._handle_interactive_reaction(reaction, user)
+            await self._handle_interactive_reaction(payload, kind)
         except Exception as e:
-            logger.error(f"Error handling reaction: {e}")
+            logger.error("Error handling reaction: %s", e)
     
-    async def _handle_interactive_reaction(self, reaction, user):
+    async def _handle_interactive_reaction(self, payload: discord.RawReactionActionEvent, kind: Optional[str]):
         """Process specific reaction interactions"""
-        message = reaction.message
-        embeds = message.embeds
+        user = payload.member or self.bot.get_user(payload.user_id)
+        if user is None:
+            user = await self.bot.fetch_user(payload.user_id)
         
-        if not embeds:
+        # Ignore bot reactions
+        if user.bot:
             return
         
-        embed = embeds[0]
-        title = embed.title or ""
-        
-        # Handle gematria calculator reactions
-        if "Gematria Calculator" in title:
-            await self._handle_gematria_reactions(reaction, user, embed)
-        
-        # Handle zmanim (halachic times) reactions
-        elif "Halachic Times" in title:
-            await self._handle_zmanim_reactions(reaction, user, embed)
+        if kind is None:
+            # Messages sent before a restart aren't tracked; fall back to the title
+            kind = await self._kind_from_title(payload)
+            if kind is None:
+                return
         
-        # Handle parsha study reactions
-        elif "Parashat" in title:
-            await self._handle_parsha_reactions(reaction, user, embed)
-        
-        # Handle halacha question reactions
-        elif "Halacha Question" in title:
-            await self._handle_halacha_reactions(reaction, user, embed)
-        
-        # Handle Daf Yomi reactions
-        elif "Daf Yomi" in title:
-            await self._handle_dafyomi_reactions(reaction, user, embed)
-        
-        # Handle learning path reactions
-        elif "Learning Path" in title:
-            await self._handle_learning_reactions(reaction, user, embed)
+        new_embed = _REACTION_EMBEDS.get((kind, str(payload.emoji)))
+        if new_embed:
+            await self._safe_dm(user, new_embed)
     
-    async def _handle_gematria_reactions(self, reaction, user, embed):
-        """Handle gematria calculator interactive reactions"""
-        emoji = str(reaction.emoji)
-        
-        if emoji == "🔄":
-            # Show additional gematria calculation methods
-            new_embed = discord.Embed(
-                title="🔢 Extended Gematria Methods",
-                description="Additional calculation methods for deeper analysis",
-                color=discord.Color.purple()
-            )
-            new_embed.add_field(
-                name="📊 Available Methods",
-                value="• **At-bash** - Reverse alphabet cipher\n• **Albam** - Alphabet substitution\n• **Ayik Bekar** - Special permutation\n• **Mispar Gadol** - Final letter values",
-                inline=False
-            )
-            new_embed.set_footer(text="Contact administrator for advanced calculations")
-            
-            try:
-                await user.send(embed=new_embed)
-            except discord.Forbidden:
-                pass  # User has DMs disabled
-        
-        elif emoji == "📖":
-            # Search for texts with same gematria value
-            new_embed = discord.Embed(
-                title="📚 Related Gematria Texts",
-                description="Searching for texts with matching numerical values...",
-                color=discord.Color.blue()
-            )
-            new_embed.add_field(
-                name="🔍 Search Tips",
-                value="Use `/search` command to find specific texts\nUse `/text` command to retrieve full passages",
-                inline=False
-            )
-            
-            try:
-                await user.send(embed=new_embed)
-            except discord.Forbidden:
-                pass
-    
-    async def _handle_zmanim_reactions(self, reaction, user, embed):
-        """Handle zmanim (halachic times) interactive reactions"""
-        emoji = str(reaction.emoji)
-        
-        if emoji == "📅":
-            # Show tomorrow's times
-            new_embed = discord.Embed(
-                title="📅 Tomorrow's Zmanim",
-                description="Use `/zmanim` command with tomorrow's date for precise times",
-                color=discord.Color.blue()
-            )
-            
-            try:
-                await user.send(embed=new_embed)
-            except discord.Forbidden:
-                pass
-        
-        elif emoji == "🕯️":
-            # Show candle lighting information
-            new_embed = discord.Embed(
-                title="🕯️ Candle Lighting Guide",
-                description="Shabbat and Holiday Candle Lighting Times",
-                color=discord.Color.gold()
-            )
-            new_embed.add_field(
-                name="📏 Standard Times",
-                value="• **Shabbat:** 18 minutes before sunset\n• **Holidays:** Usually same as Shabbat\n• **Location matters:** Check local customs",
-                inline=False
-            )
-            new_embed.add_field(
-                name="🔍 Get Exact Times",
-                value="Use `/shabbat [location]` for precise candle lighting times",
-                inline=False
-            )
-            
-            try:
-                await user.send(embed=new_embed)
-            except discord.Forbidden:
-                pass
-        
-        elif emoji == "ℹ️":
-            # Show zmanim explanations
-            new_embed = discord.Embed(
-                title="ℹ️ Zmanim Explanations",
-                description="Understanding Halachic Times",
-                color=discord.Color.dark_blue()
-            )
-            new_embed.add_field(
-                name="🌅 Morning Times",
-                value="• **Alot HaShachar:** Dawn - first light\n• **Misheyakir:** When you can distinguish\n• **Sunrise:** Sun becomes visible",
-                inline=False
-            )
-            new_embed.add_field(
-                name="🙏 Prayer Times",
-                value="• **Latest Shma:** Deadline for morning Shma\n• **Latest Tfilla:** Deadline for morning prayers\n• **Chatzot:** Halachic noon",
-                inline=False
-            )
-            
-            try:
-                await user.send(embed=new_embed)
-            except discord.Forbidden:
-                pass
-    
-    async def _handle_parsha_reactions(self, reaction, user, embed):
-        """Handle Torah portion study interactive reactions"""
-        emoji = str(reaction.emoji)
-        
-        if emoji == "📝":
-            # Show commentary options
-            new_embed = discord.Embed(
-                title="📝 Torah Commentary Guide",
-                description="Classical commentaries for Torah study",
-                color=discord.Color.gold()
-            )
-            new_embed.add_field(
-                name="👨‍🏫 Classical Commentators",
-                value="• **Rashi** - Basic understanding\n• **Ibn Ezra** - Grammar and context\n• **Ramban** - Mystical insights\n• **Sforno** - Philosophical approach",
-                inline=False
-            )
-            new_embed.add_field(
-                name="🔍 Access Commentaries",
-                value="Use `/commentary [verse] [commentator]` for specific insights",
-                inline=False
-            )
-            
-            try:
-                await user.send(embed=new_embed)
-            except discord.Forbidden:
-                pass
-        
-        elif emoji == "🔍":
-            # Show theme exploration
-            new_embed = discord.Embed(
-                title="🔍 Torah Themes & Lessons",
-                description="Explore deeper meanings in the weekly portion",
-                color=discord.Color.green()
-            )
-            new_embed.add_field(
-                name="🎯 Study Approaches",
-                value="• Look for recurring patterns\n• Connect to personal growth\n• Find contemporary relevance\n• Explore character development",
-                inline=False
-            )
-            
-            try:
-                await user.send(embed=new_embed)
-            except discord.Forbidden:
-                pass
+    async def _kind_from_title(self, payload: discord.RawReactionActionEvent) -> Optional[str]:
+        """Fetch an untracked message of ours and match its embed title to a reply kind"""
+        channel = self.bot.get_channel(payload.channel_id)
+        if channel is None:
+            channel = await self.bot.fetch_channel(payload.channel_id)
+        message = await channel.fetch_message(payload.message_id)
+        
+        if not message.embeds:
+            return None
+        
+        title = message.embeds[0].title or ""
+        return next((kind for token, kind in _TITLE_KINDS if token in title), None)
     
-    async def _handle_halacha_reactions(self, reaction, user, embed):
-        """Handle halacha question interactive reactions"""
-        emoji = str(reaction.emoji)
-        
-        if emoji == "📖":
-            # Show halachic sources
-            new_embed = discord.Embed(
-                title="📖 Halachic Source Materials",
-                description="Primary sources for Jewish law study",
-                color=discord.Color.blue()
-            )
-            new_embed.add_field(
-                name="📚 Essential Sources",
-                value="• **Shulchan Aruch** - Code of Jewish Law\n• **Mishnah Berurah** - Modern commentary\n• **Responsa Literature** - Rabbinic decisions\n• **Contemporary Poskim** - Modern authorities",
-                inline=False
-            )
-            
-            try:
-                await user.send(embed=new_embed)
-            except discord.Forbidden:
-                pass
-        
-        elif emoji == "👨‍🏫":
-            # Provide rabbi referral guidance
-            new_embed = discord.Embed(
-                title="👨‍🏫 Finding Rabbinic Guidance",
-                description="How to find qualified halachic authorities",
-                color=discord.Color.purple()
-            )
-            new_embed.add_field(
-                name="🔍 Finding a Rabbi",
-                value="• Contact local synagogues\n• Ask community members for recommendations\n• Look for Orthodox authorities for halachic questions\n• Consider online halachic resources",
-                inline=False
-            )
-            
-            try:
-                await user.send(embed=new_embed)
-            except discord.Forbidden:
-                pass
-    
-    async def _handle_dafyomi_reactions(self, reaction, user, embed):
-        """Handle Daf Yomi study interactive reactions"""
-        emoji = str(reaction.emoji)
-        
-        if emoji == "📝":
-            # Show note-taking tips
-            new_embed = discord.Embed(
-                title="📝 Daf Yomi Study Notes",
-                description="Effective note-taking for Talmud study",
-                color=discord.Color.dark_blue()
-            )
-            new_embed.add_field(
-                name="✍️ Note-Taking Tips",
-                value="• Track key concepts and terms\n• Note questions for further study\n• Connect to previously learned material\n• Record practical halachic applications",
-                inline=False
-            )
-            
-            try:
-                await user.send(embed=new_embed)
-            except discord.Forbidden:
-                pass
-        
-        elif emoji == "👥":
-            # Show study group information
-            new_embed = discord.Embed(
-                title="👥 Daf Yomi Study Groups",
-                description="Benefits of collaborative Talmud study",
-                color=discord.Color.green()
-            )
-            new_embed.add_field(
-                name="🤝 Study Partnership Benefits",
-                value="• **Chavruta** - Traditional paired study\n• Different perspectives on difficult passages\n• Motivation and accountability\n• Enhanced understanding through discussion",
-                inline=False
-            )
-            
-            try:
-                await user.send(embed=new_embed)
-            except discord.Forbidden:
-                pass
-    
-    async def _handle_learning_reactions(self, reaction, user, embed):
-        """Handle learning path interactive reactions"""
-        emoji = str(reaction.emoji)
+    async def _safe_dm(self, user, embed: discord.Embed):
+        """DM a follow-up embed, skipping users already known to have DMs disabled"""
+        if user.id in self._dm_blocked:
+            return
         
-        if emoji == "📅":
-            # Show study schedule recommendations
-            new_embed = discord.Embed(
-                title="📅 Jewish Learning Schedule",
-                description="Structured approach to Torah study",
-                color=discord.Color.green()
-            )
-            new_embed.add_field(
-                name="🗓️ Daily Learning Cycles",
-                value="• **Daf Yomi** - Daily Talmud page\n• **Parsha** - Weekly Torah portion\n• **Mishnah Yomi** - Daily Mishnah\n• **Rambam Yomi** - Daily Maimonides",
-                inline=False
-            )
-            
-            try:
-                await user.send(embed=new_embed)
-            except discord.Forbidden:
-                pass
+        try:
+            await user.send(embed=embed)
+        except discord.Forbidden:
+            self._dm_blocked[user.id] = None  # User has DMs disabled
 
 async def setup(bot):
     """Setup function for loading the cog"""
@@ -0,0 +1,44 @@
+"""
+Retry helper for transient upstream API failures
+"""
+import aiohttp
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+async def retry_async(coro_factory: Callable[[], Awaitable[Optional[T]]], attempts: int = 3,
+                      base: float = 0.2, timeout: float = 4.0) -> Optional[T]:
+    """Await a fresh coroutine from coro_factory, retrying failed upstream requests
+
+    The API clients report connection errors, error statuses and bad payloads
+    by returning None, so a None result (or an aiohttp.ClientError that escapes
+    a client) is retried with exponential backoff (base, 2*base, ...). The last
+    None is returned and the last error re-raised.
+
+    The whole call is bounded by `timeout` seconds and timeouts are not
+    retried: a second attempt on a cached client method would only rejoin the
+    same in-flight request, and elsewhere it would multiply the wait.
+    """
+    async def attempt_all() -> Optional[T]:
+        for attempt in range(attempts):
+            try:
+                result = await coro_factory()
+                error = None
+            except aiohttp.ClientError as e:
+                result, error = None, e
+            if result is not None:
+                return result
+            if attempt == attempts - 1:
+                if error:
+                    raise error
+                return None
+            delay = base * 2 ** attempt
+            logger.warning("Upstream request failed (%s), retrying in %.1fs",
+                           repr(error) if error else "no data", delay)
+            await asyncio.sleep(delay)
+
+    return await asyncio.wait_for(attempt_all(), timeout=timeout)
@@ -4,24 +4,37 @@ Client for interacting with the Sefaria API
 import aiohttp
 import asyncio
 import logging
+import orjson
 import random
 from typing import Optional, Dict, List, Any
 from urllib.parse import quote
 
+from .cache import async_ttl_cache, jerusalem_today, seconds_until_jerusalem_midnight
+
 logger = logging.getLogger(__name__)
 
+# Budget for each HTTP request, counted after the rate-limit spacing, so
+# methods that chain several requests get a fresh budget per request
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=4)
+# The full /api/index listing is large; its budget stays above the /categories
+# deadline so that the caller's deadline is what bounds it
+_INDEX_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
 class SefariaClient:
     """Client for Sefaria API interactions"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.base_url = "https://www.sefaria.org/api"
-        self.session = None
+        # Use the bot's shared session when given; otherwise one is created on demand
+        self.session = session
+        self._owns_session = session is None
         self._rate_limit_delay = 1.0  # Seconds between requests
         self._last_request_time = 0
         
     async def _ensure_session(self):
         """Ensure aiohttp session exists"""
         if self.session is None or self.session.closed:
+            self._owns_session = True
             self.session = aiohttp.ClientSession(
                 timeout=aiohttp.ClientTimeout(total=30),
                 headers={
@@ -39,7 +52,8 @@ class SefariaClient:
         
         self._last_request_time = asyncio.get_event_loop().time()
     
-    async def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
+    async def _make_request(self, endpoint: str, params: Optional[Dict] = None,
+                            timeout: aiohttp.ClientTimeout = _REQUEST_TIMEOUT) -> Optional[Dict]:
         """Make a request to the Sefaria API"""
         await self._ensure_session()
         await self._rate_limit()
@@ -47,9 +61,9 @@ class SefariaClient:
         url = f"{self.base_url}/{endpoint}"
         
         try:
-            async with self.session.get(url, params=params) as response:
+            async with self.session.get(url, params=params, timeout=timeout) as response:
                 if response.status == 200:
-                    return await response.json()
+                    return orjson.loads(await response.read())
                 elif response.status == 404:
                     logger.warning(f"Resource not found: {url}")
                     return None
@@ -70,7 +84,7 @@ class SefariaClient:
             # First, get a list of texts
             if category:
                 # Get texts from specific category
-                texts_data = await self._make_request(f"index")
+                texts_data = await self._make_request("index", timeout=_INDEX_TIMEOUT)
                 if not texts_data:
                     return None
                 
@@ -86,7 +100,7 @@ class SefariaClient:
                     available_texts = [text['title'] for text in texts_data if isinstance(text, dict) and 'title' in text]
             else:
                 # Get all available texts
-                texts_data = await self._make_request("index")
+                texts_data = await self._make_request("index", timeout=_INDEX_TIMEOUT)
                 if not texts_data:
                     return None
                 
@@ -181,6 +195,7 @@ class SefariaClient:
             logger.error(f"Error searching texts for query '{query}': {e}")
             return []
     
+    @async_ttl_cache(ttl=seconds_until_jerusalem_midnight)
     async def get_daily_text(self) -> Optional[Dict]:
         """Get today's daily text (Torah portion, etc.)"""
         try:
@@ -193,9 +208,8 @@ class SefariaClient:
                 "Deuteronomy 6:4"  # Shema
             ]
             
-            # Pick a daily text based on today's date (simple rotation)
-            import datetime
-            today = datetime.date.today()
+            # Pick a daily text based on today's date in Israel (simple rotation)
+            today = jerusalem_today()
             daily_index = today.toordinal() % len(daily_options)
             chosen_ref = daily_options[daily_index]
             
@@ -206,10 +220,13 @@ class SefariaClient:
             logger.error(f"Error getting daily text: {e}")
             return None
     
-    async def get_categories(self) -> List[str]:
-        """Get list of available text categories"""
+    async def get_categories(self, deadline_ms: Optional[float] = None) -> List[str]:
+        """Get list of available text categories, optionally bounded by a deadline"""
         try:
-            index_data = await self._make_request("index")
+            request = self._make_request("index", timeout=_INDEX_TIMEOUT)
+            if deadline_ms is not None:
+                request = asyncio.wait_for(request, timeout=deadline_ms / 1000)
+            index_data = await request
             
             if not index_data:
                 return []
@@ -223,11 +240,14 @@ class SefariaClient:
             
             return sorted(list(categories))
             
+        except asyncio.TimeoutError:
+            logger.warning(f"Getting categories exceeded deadline of {deadline_ms:.0f}ms")
+            raise
         except Exception as e:
             logger.error(f"Error getting categories: {e}")
             return []
     
     async def close(self):
-        """Close the aiohttp session"""
-        if self.session and not self.session.closed:
+        """Close the aiohttp session if this client created it"""
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
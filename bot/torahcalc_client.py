@@ -3,27 +3,32 @@ Client for interacting with TorahCalc API - "The Jewish Wolfram Alpha"
 """
 
 import logging
+import orjson
 import aiohttp
 import asyncio
 from datetime import datetime, date
 from typing import Optional, Dict, List, Any, Union
 import json
+from .cache import async_ttl_cache, jerusalem_today, seconds_until_jerusalem_midnight, fetch_with_swr
 
 logger = logging.getLogger(__name__)
 
 class TorahCalcClient:
     """Client for TorahCalc API - Advanced Jewish calculations and conversions"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         """Initialize the TorahCalc client"""
-        self.session = None
+        # Use the bot's shared session when given; otherwise one is created on demand
+        self.session = session
+        self._owns_session = session is None
         self.base_url = 'https://www.torahcalc.com/api'
         self.last_request_time = 0
         self.rate_limit_delay = 0.5  # 500ms between requests
     
     async def _ensure_session(self):
         """Ensure aiohttp session exists"""
-        if self.session is None:
+        if self.session is None or self.session.closed:
+            self._owns_session = True
             self.session = aiohttp.ClientSession()
     
     async def _rate_limit(self):
@@ -44,7 +49,7 @@ class TorahCalcClient:
         try:
             async with self.session.get(url, params=params) as response:
                 if response.status == 200:
-                    return await response.json()
+                    return orjson.loads(await response.read())
                 else:
                     logger.error(f"HTTP {response.status} for {url}")
                     return None
@@ -55,7 +60,8 @@ class TorahCalcClient:
     async def natural_language_query(self, query: str) -> Optional[Dict]:
         """Process natural language queries for calculations"""
         params = {'query': query}
-        return await self._make_request('input', params)
+        key = ('natural_language_query', query.strip().lower())
+        return await fetch_with_swr(key, lambda: self._make_request('input', params))
     
     async def convert_biblical_units(self, unit_type: str, from_unit: str, to_unit: str, 
                                    amount: float = 1, opinion: str = None) -> Optional[Dict]:
@@ -69,7 +75,9 @@ class TorahCalcClient:
         if opinion:
             params['opinion'] = opinion
         
-        return await self._make_request('unitconverter', params)
+        key = ('convert_biblical_units', unit_type.strip().lower(), from_unit.strip().lower(),
+               to_unit.strip().lower(), amount, (opinion or '').strip().lower())
+        return await fetch_with_swr(key, lambda: self._make_request('unitconverter', params))
     
     async def get_all_unit_conversions(self, unit_type: str, from_unit: str, 
                                      amount: float = 1, opinion: str = None) -> Optional[Dict]:
@@ -90,14 +98,15 @@ class TorahCalcClient:
         query = f"Gematria of {text}"
         return await self.natural_language_query(query)
     
+    @async_ttl_cache(ttl=seconds_until_jerusalem_midnight)
     async def get_daily_learning(self, date_str: str = None) -> Optional[Dict]:
         """Get comprehensive daily learning schedule"""
-        params = {}
-        if date_str:
-            params['date'] = date_str
+        # Ask for the Israel date explicitly so it matches the cache key
+        params = {'date': date_str or jerusalem_today().isoformat()}
         
         return await self._make_request('dailylearning', params)
     
+    @async_ttl_cache(ttl=3600)
     async def convert_date_greg_to_hebrew(self, year: int = None, month: int = None, 
                                         day: int = None, after_sunset: bool = False) -> Optional[Dict]:
         """Convert Gregorian date to Hebrew date"""
@@ -254,6 +263,6 @@ class TorahCalcClient:
             return None
     
     async def close(self):
-        """Close the aiohttp session"""
-        if self.session:
+        """Close the aiohttp session if this client created it"""
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
\ No newline at end of file
@@ -5,6 +5,19 @@ import discord
 import re
 from typing import Dict, Optional
 
+_TEXT_COLOR = discord.Color.blue()
+_SEFARIA_FOOTER_TEXT = "Powered by Sefaria • sefaria.org"
+_SEFARIA_FOOTER_ICON = "https://www.sefaria.org/static/img/logo.png"
+
+class StaticEmbed(discord.Embed):
+    """Embed that is fully built once and never modified, so its payload is serialized only once"""
+    
+    def to_dict(self) -> Dict:
+        payload = self.__dict__.get('_payload')
+        if payload is None:
+            payload = self.__dict__['_payload'] = super().to_dict()
+        return payload
+
 def format_text_response(text_data: Dict, language: Optional[str] = "both") -> discord.Embed:
     """Format text data into a Discord embed"""
     # Extract basic information
@@ -35,7 +48,7 @@ def format_text_response(text_data: Dict, language: Optional[str] = "both") -> d
     # Create embed
     embed = discord.Embed(
         title=title,
-        color=discord.Color.blue()
+        color=_TEXT_COLOR
     )
     
     # Check if text was truncated
@@ -111,8 +124,8 @@ def format_text_response(text_data: Dict, language: Optional[str] = "both") -> d
     
     # Set footer
     embed.set_footer(
-        text="Powered by Sefaria • sefaria.org",
-        icon_url="https://www.sefaria.org/static/img/logo.png"
+        text=_SEFARIA_FOOTER_TEXT,
+        icon_url=_SEFARIA_FOOTER_ICON
     )
     
     return embed
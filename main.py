@@ -3,46 +3,57 @@
 Main entry point for the Sefaria Discord Bot with web server for health checks
 """
 import asyncio
+import atexit
 import logging
 import os
+import signal
+import sys
+import threading
+from concurrent.futures import Future
+import orjson
 from aiohttp import web
 from dotenv import load_dotenv
 from bot.discord_bot import SefariaBot
+from bot.logging_config import setup_logging
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('sefaria_bot.log'),
-        logging.StreamHandler()
-    ]
-)
+# Configure logging; records are written by a background thread so log
+# calls on the event loop never block on file or console I/O
+setup_logging('sefaria_bot.log')
 
 logger = logging.getLogger(__name__)
 
+# The endpoint payloads never change, so they are serialized once at import
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "Sefaria Discord Bot",
+    "version": "1.0.0"
+})
+
+_INDEX_BODY = orjson.dumps({
+    "name": "Sefaria Discord Bot",
+    "description": "A Discord bot that integrates with the Sefaria API to provide access to Jewish texts",
+    "status": "running",
+    "endpoints": {
+        "/": "Bot information",
+        "/health": "Health check"
+    }
+})
+
 async def health_check(request):
     """Health check endpoint for deployment platform"""
-    return web.json_response({
-        "status": "healthy",
-        "service": "Sefaria Discord Bot",
-        "version": "1.0.0"
-    })
+    return web.Response(body=_HEALTH_BODY, content_type='application/json')
 
 async def index(request):
     """Root endpoint showing bot information"""
-    return web.json_response({
-        "name": "Sefaria Discord Bot",
-        "description": "A Discord bot that integrates with the Sefaria API to provide access to Jewish texts",
-        "status": "running",
-        "endpoints": {
-            "/": "Bot information",
-            "/health": "Health check"
-        }
-    })
+    return web.Response(body=_INDEX_BODY, content_type='application/json')
 
 async def create_web_app():
     """Create the web application for health checks"""
@@ -52,18 +63,32 @@ async def create_web_app():
     app.router.add_get('/status', health_check)  # Alternative health check endpoint
     return app
 
-async def start_web_server():
-    """Start the web server for health checks"""
-    app = await create_web_app()
-    runner = web.AppRunner(app)
-    await runner.setup()
+async def _serve_health_checks(port: int, started: Future):
+    """Bind the health check server, report the outcome through `started`, then serve forever"""
+    # Probes arrive every few seconds, so skip access logging for them and keep
+    # their connections alive between probes. Signals belong to the main thread.
+    runner = web.AppRunner(
+        await create_web_app(),
+        access_log=None,
+        keepalive_timeout=75,
+        handle_signals=False
+    )
+    try:
+        await runner.setup()
+        await web.TCPSite(runner, host='0.0.0.0', port=port).start()
+    except Exception as e:
+        started.set_exception(e)
+        await runner.cleanup()
+        return
     
-    # Use port from environment or default to 8080 for Fly.io deployment
-    port = int(os.getenv('PORT', 8080))
-    site = web.TCPSite(runner, '0.0.0.0', port)
-    await site.start()
-    logger.info(f"Web server started on port {port}")
-    return runner
+    started.set_result(None)
+    logger.info("Health check server listening on port %d", port)
+    await asyncio.Event().wait()
+
+def serve_health_checks(port: int, started: Future):
+    """Run the health check server on its own event loop (in a background thread)"""
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+        runner.run(_serve_health_checks(port, started))
 
 async def start_discord_bot():
     """Start the Discord bot"""
@@ -87,10 +112,45 @@ async def start_discord_bot():
         logger.info("Discord bot started")
         return bot_task, bot
     except Exception as e:
-        logger.error(f"Failed to create Discord bot: {e}")
+        logger.error("Failed to create Discord bot: %s", e)
         return None
 
-async def main():
+async def run_bot():
+    """Run the Discord bot until SIGTERM/SIGINT; the health server outlives bot failures"""
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except (NotImplementedError, RuntimeError):
+            pass  # Signal handlers aren't available on this platform
+    
+    bot_result = await start_discord_bot()
+    if bot_result is None:
+        logger.warning("Discord bot failed to start, but web server will continue running")
+        await stop_event.wait()
+        return
+    
+    bot_task, bot = bot_result
+    logger.info("Both web server and Discord bot are running")
+    
+    stop_task = asyncio.create_task(stop_event.wait())
+    try:
+        await asyncio.wait((bot_task, stop_task), return_when=asyncio.FIRST_COMPLETED)
+        if bot_task.done() and not bot_task.cancelled() and bot_task.exception():
+            logger.error("Discord bot error: %s", bot_task.exception())
+            # Even if bot fails, keep web server running
+            logger.info("Keeping web server running for health checks")
+            await stop_task
+    finally:
+        logger.info("Application shutting down...")
+        stop_task.cancel()
+        try:
+            await bot.close()
+        except Exception as e:
+            logger.error("Error during cleanup: %s", e)
+
+def main():
     """Main function to start both web server and Discord bot"""
     # Prevent multiple instances (fixes double responses)
     lock_file = "/tmp/sefaria_bot.lock"
@@ -104,62 +164,28 @@ async def main():
             f.write(str(os.getpid()))
         
         # Clean up lock file on exit
-        import atexit
         atexit.register(lambda: os.remove(lock_file) if os.path.exists(lock_file) else None)
     except Exception as e:
-        logger.warning(f"Could not create lock file: {e}")
+        logger.warning("Could not create lock file: %s", e)
+    
+    # Use port from environment or default to 8080 for Fly.io deployment
+    port = int(os.getenv('PORT', 8080))
     
-    web_runner = None
-    bot = None
+    # The health server gets its own thread and loop so probe traffic and
+    # gateway traffic can't stall each other
+    started = Future()
+    threading.Thread(target=serve_health_checks, args=(port, started), name="health-server", daemon=True).start()
     
+    # Without health checks the platform would restart us anyway, so fail fast
     try:
-        # Start web server for health checks first (critical for deployment)
-        web_runner = await start_web_server()
-        
-        # Start Discord bot (optional - web server should stay up even if bot fails)
-        bot_result = await start_discord_bot()
-        if bot_result is None:
-            logger.warning("Discord bot failed to start, but web server will continue running")
-            # Keep web server running indefinitely for health checks
-            try:
-                while True:
-                    await asyncio.sleep(60)  # Keep alive
-            except KeyboardInterrupt:
-                logger.info("Application shutdown requested by user")
-            return
-        
-        bot_task, bot = bot_result
-        logger.info("Both web server and Discord bot are running")
-        
-        # Keep the application running
-        try:
-            await bot_task
-        except Exception as e:
-            logger.error(f"Discord bot error: {e}")
-            # Even if bot fails, keep web server running
-            logger.info("Keeping web server running for health checks")
-            try:
-                while True:
-                    await asyncio.sleep(60)  # Keep alive
-            except KeyboardInterrupt:
-                logger.info("Application shutdown requested by user")
-        
-    except KeyboardInterrupt:
-        logger.info("Application shutdown requested by user")
+        started.result()
     except Exception as e:
-        logger.error(f"An error occurred: {e}")
-    finally:
-        logger.info("Application shutting down...")
-        try:
-            if web_runner:
-                await web_runner.cleanup()
-            if bot:
-                await bot.close()
-        except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
+        logger.error("Health check server failed to start on port %d: %s", port, e)
+        sys.exit(1)
+    
+    # uvloop (optional, Linux/macOS) replaces the stock event loop when installed
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+        runner.run(run_bot())
 
 if __name__ == "__main__":
-    try:
-        asyncio.run(main())
-    except KeyboardInterrupt:
-        logger.info("Application stopped by user")
+    main()
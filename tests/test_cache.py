@@ -0,0 +1,40 @@
+"""
+Tests for the async TTL cache
+"""
+import asyncio
+import os
+import sys
+import unittest
+from datetime import date
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bot import cache
+from bot.cache import async_ttl_cache, seconds_until_jerusalem_midnight
+
+class DailyCacheTest(unittest.TestCase):
+    """Daily entries are keyed by the Jerusalem date, not only expired at its midnight"""
+
+    def test_key_rolls_over_with_jerusalem_date(self):
+        calls = []
+
+        class Client:
+            @async_ttl_cache(ttl=seconds_until_jerusalem_midnight)
+            async def get_daily(self):
+                calls.append(cache.jerusalem_today())
+                return calls[-1]
+
+        async def fetch_on(day):
+            with mock.patch.object(cache, 'jerusalem_today', return_value=day):
+                return await client.get_daily()
+
+        client = Client()
+        first, second = date(2026, 10, 15), date(2026, 10, 16)
+        self.assertEqual(asyncio.run(fetch_on(first)), first)
+        self.assertEqual(asyncio.run(fetch_on(first)), first)
+        self.assertEqual(asyncio.run(fetch_on(second)), second)
+        self.assertEqual(calls, [first, second])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+"""
+Tests for registering the right-click context menus
+"""
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import discord
+    from discord.ext import commands
+except ImportError:
+    discord = None
+
+@unittest.skipIf(discord is None, "discord.py is not installed")
+class ContextMenusTest(unittest.TestCase):
+    """The cog adds its message context menus to the bot's tree and removes them on unload"""
+
+    def setUp(self):
+        from bot.context_menus import ContextMenus
+        self.bot = commands.Bot(command_prefix='!', intents=discord.Intents.none())
+        self.cog = ContextMenus(self.bot, sefaria_client=object())
+
+    def menu_names(self):
+        menus = self.bot.tree.get_commands(type=discord.AppCommandType.message)
+        return sorted(menu.name for menu in menus)
+
+    def test_menus_registered(self):
+        self.assertEqual(self.menu_names(), ['Get Hebrew Date', 'Search Sefaria'])
+
+    def test_menus_removed_on_unload(self):
+        asyncio.run(self.cog.cog_unload())
+        self.assertEqual(self.menu_names(), [])
+
+if __name__ == '__main__':
+    unittest.main()
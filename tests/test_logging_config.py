@@ -0,0 +1,52 @@
+"""
+Tests for the queue-based logging setup
+"""
+import atexit
+import logging
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bot.logging_config import setup_logging
+
+class SetupLoggingTest(unittest.TestCase):
+    """Records pass through the queue and are formatted exactly once"""
+
+    def setUp(self):
+        self.root = logging.getLogger()
+        self.saved_handlers = self.root.handlers[:]
+        self.saved_level = self.root.level
+        self.root.handlers.clear()
+        fd, self.log_file = tempfile.mkstemp(suffix='.log')
+        os.close(fd)
+
+    def tearDown(self):
+        for handler in self.root.handlers:
+            handler.close()
+        self.root.handlers[:] = self.saved_handlers
+        self.root.setLevel(self.saved_level)
+        os.remove(self.log_file)
+
+    def test_line_has_single_prefix(self):
+        listener = setup_logging(self.log_file)
+        try:
+            logging.getLogger('bot.x').info("hello %s", "world")
+        finally:
+            atexit.unregister(listener.stop)
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
+        with open(self.log_file) as f:
+            lines = f.read().splitlines()
+
+        self.assertEqual(len(lines), 1)
+        self.assertTrue(lines[0].endswith(" - bot.x - INFO - hello world"), lines[0])
+        self.assertEqual(lines[0].count(" - INFO - "), 1)
+        self.assertNotIn("INFO:bot.x", lines[0])
+
+if __name__ == '__main__':
+    unittest.main()